@@ -0,0 +1,70 @@
+"""
+Time and peak memory to check a long async generator with `amatch()`, compared to collecting it into a list
+and comparing that.
+
+Usage:
+
+    python benchmarks/amatch.py [--count N]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dirty_equals
+from dirty_equals import HasLen, IsList
+
+
+async def rows(count: int) -> AsyncIterator[dict[str, Any]]:
+    for i in range(count):
+        yield {'id': i, 'name': f'user {i}'}
+
+
+def measure(func: Callable[[], Awaitable[bool]]) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    assert asyncio.run(func())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of items in the stream')
+    args = parser.parse_args()
+    count = args.count
+
+    async def collect(matcher: Any) -> bool:
+        return [row async for row in rows(count)] == matcher
+
+    async def stream(matcher: Any) -> bool:
+        return bool(await dirty_equals.amatch(matcher, rows(count)))
+
+    cases = {
+        'HasLen(N)': HasLen(count),
+        'IsList(..., length=...)': IsList({'id': 0, 'name': 'user 0'}, length=...),
+        'IsList(positions={-1: ...})': IsList(positions={-1: {'id': count - 1, 'name': f'user {count - 1}'}}),
+    }
+    print(f'{count:,} items')
+    print(f'{"case":<30} {"collect":>18} {"amatch()":>18}')
+    for name, matcher in cases.items():
+        collect_time, collect_peak = measure(lambda: collect(matcher))
+        stream_time, stream_peak = measure(lambda: stream(matcher))
+        print(
+            f'{name:<30} {collect_time:7.3f}s {collect_peak / 1e6:7.1f}MB '
+            f'{stream_time:7.3f}s {stream_peak / 1e6:7.1f}MB'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
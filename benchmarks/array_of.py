@@ -0,0 +1,61 @@
+"""
+Time to check every item of a large numeric array with `IsArrayOf`, compared to comparing each item
+with `==`.
+
+NumPy arrays are included if NumPy is installed.
+
+Usage:
+
+    python benchmarks/array_of.py [--count N]
+"""
+
+import argparse
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsApprox, IsArrayOf, IsFloat, IsInt
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    assert func()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of items in each array')
+    args = parser.parse_args()
+
+    floats = array('d', [1 + i / args.count for i in range(args.count)])
+    ints = array('q', range(args.count))
+    cases = [
+        ('IsFloat(gt=0)', IsFloat(gt=0), floats),
+        ('IsApprox(1.5, delta=1)', IsApprox(1.5, delta=1), floats),
+        ('IsInt(ge=0, le=N)', IsInt(ge=0, le=args.count), ints),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    print(f'{args.count:,} items, all of which match')
+    print(f'{"case":<24} {"==":>8} {"array":>8} {"numpy":>8}')
+    for name, item, values in cases:
+        each = timed(lambda: all(v == item for v in values))
+        buffer = timed(lambda: IsArrayOf(item) == values)
+        row = f'{name:<24} {each:7.3f}s {buffer:7.3f}s'
+        if np is not None:
+            np_values = np.array(values)
+            row += f' {timed(lambda: IsArrayOf(item) == np_values):7.3f}s'
+        print(row)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
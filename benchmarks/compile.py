@@ -0,0 +1,81 @@
+"""
+Throughput of `dirty_equals.compile()` compared to plain `==` against the same nested expectation.
+
+Usage:
+
+    python benchmarks/compile.py [--payloads N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dirty_equals
+from dirty_equals import IsDict, IsFloat, IsInt, IsList, IsPartialDict, IsPositiveInt, IsStr
+
+expected = {
+    'id': IsPositiveInt,
+    'name': IsStr(min_length=1),
+    'email': IsStr(regex=r'[^@]+@[^@]+'),
+    'address': IsPartialDict(city=IsStr, zip=IsStr(regex=r'\d{5}')),
+    'orders': [
+        IsDict(id=IsInt(gt=0), total=IsFloat(ge=0), items=IsList(IsStr, length=...)),
+        IsDict(id=IsInt(gt=0), total=IsFloat(ge=0), items=IsList(IsStr, length=...)),
+    ],
+    'active': True,
+}
+
+
+def build_payloads(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            'id': i + 1,
+            'name': f'user {i}',
+            'email': f'user{i}@example.com' if i % 10 else 'invalid',
+            'address': {'city': 'London', 'zip': '12345', 'street': 'Main St'},
+            'orders': [
+                {'id': 1, 'total': 12.5, 'items': ['a', 'b']},
+                {'id': 2, 'total': 0.0, 'items': []},
+            ],
+            'active': True,
+        }
+        for i in range(count)
+    ]
+
+
+def timed(func: Callable[[dict[str, Any]], bool], payloads: list[dict[str, Any]]) -> tuple[float, list[bool]]:
+    start = time.perf_counter()
+    verdicts = [func(p) for p in payloads]
+    return time.perf_counter() - start, verdicts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payloads', type=int, default=100_000, help='number of payloads to validate')
+    args = parser.parse_args()
+    start = time.perf_counter()
+    compiled = dirty_equals.compile(expected)
+    compile_time = time.perf_counter() - start
+
+    payloads = build_payloads(args.payloads)
+
+    eq_time, eq_verdicts = timed(lambda p: p == expected, payloads)
+    compiled_time, compiled_verdicts = timed(lambda p: p == compiled, payloads)
+
+    print(f'compile(): {compile_time * 1000:.2f}ms, {len(compiled.source.splitlines())} lines generated')
+    print(f'{"":>10} {"payloads/s":>12}')
+    print(f'{"==":>10} {len(payloads) / eq_time:>12,.0f}')
+    print(f'{"compiled":>10} {len(payloads) / compiled_time:>12,.0f} ({eq_time / compiled_time:.1f}x)')
+
+    if eq_verdicts != compiled_verdicts:
+        print('verdicts differ!')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
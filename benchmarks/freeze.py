@@ -0,0 +1,71 @@
+"""
+Memory used by a large generated set of expectations, with and without `freeze()`.
+
+Generated expectations tend to repeat the same checks many times, frozen objects with the same arguments are
+interned so each distinct check is only held in memory once.
+
+Usage:
+
+    python benchmarks/freeze.py [--cases N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsDict, IsInt, IsList, IsOneOf, IsPositiveInt, IsStr
+
+
+def build_case(i: int, frozen: bool) -> Any:
+    expected = IsDict(
+        id=IsPositiveInt(),
+        name=IsStr(min_length=1),
+        email=IsStr(regex=r'[^@]+@[^@]+'),
+        status=IsOneOf('active', 'inactive', 'banned'),
+        tags=IsList(IsStr, length=...),
+        score=IsInt(ge=0, le=100),
+        # a few variations so not every expectation is identical
+        group=IsInt(exactly=i % 10),
+    )
+    return expected.freeze() if frozen else expected
+
+
+def measure(cases: int, frozen: bool) -> tuple[int, float]:
+    start = time.perf_counter()
+    expectations = [build_case(i, frozen) for i in range(cases)]
+    elapsed = time.perf_counter() - start
+    del expectations
+
+    gc.collect()
+    tracemalloc.start()
+    expectations = [build_case(i, frozen) for i in range(cases)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del expectations
+    return size, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', type=int, default=10_000, help='number of expectations to build')
+    args = parser.parse_args()
+
+    print(f'{"":>8} {"retained":>12} {"per case":>10} {"build time":>11}')
+    results = {}
+    for name, frozen in ('plain', False), ('frozen', True):
+        size, elapsed = measure(args.cases, frozen)
+        results[name] = size
+        print(f'{name:>8} {size / 1024:>10,.0f}KB {size / args.cases:>9,.0f}B {elapsed * 1000:>9,.0f}ms')
+    print(f'frozen expectations use {results["frozen"] / results["plain"]:.1%} of the memory')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Time to check a large batch of values with `match_many()`, compared to `all(v == matcher for v in values)`
+and to a loop of `match()` calls.
+
+Usage:
+
+    python benchmarks/match_many.py [--count N]
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsDatetime, IsInt, IsStr, IsUUID
+
+
+def cases(count: int) -> dict[str, tuple[Any, list[Any]]]:
+    start = datetime(2000, 1, 1)
+    return {
+        'IsInt(gt=0, lt=N)': (IsInt(gt=0, lt=count + 1), list(range(1, count + 1))),
+        'IsStr(regex=...)': (IsStr(regex=r'user-\d+', max_length=20), [f'user-{i}' for i in range(count)]),
+        'IsUUID(4)': (IsUUID(4), [str(uuid.uuid4()) for _ in range(count)]),
+        'IsDatetime(ge=...)': (IsDatetime(ge=start), [start + timedelta(seconds=i) for i in range(count)]),
+    }
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    assert func()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of values in each batch')
+    args = parser.parse_args()
+
+    print(f'{args.count:,} values, all of which match')
+    print(f'{"case":<20} {"==":>8} {"match()":>8} {"match_many()":>13}')
+    for name, (matcher, values) in cases(args.count).items():
+        eq = timed(lambda: all(v == matcher for v in values))
+        match = timed(lambda: all(matcher.match(v) for v in values))
+        many = timed(lambda: matcher.match_many(values))
+        print(f'{name:<20} {eq:7.3f}s {match:7.3f}s {many:7.3f}s {eq / many:4.1f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Evaluation depth and cost of long `|` and `&` chains.
+
+`a | b | c | ...` builds a single n-ary `DirtyOr`, this compares it to the equivalent left-nested tree built with
+`DirtyOr(DirtyOr(a, b), c)`: the depth of the flattened node stays at 1 and the time per alternative stays flat,
+while the nested tree gets deeper (and eventually exceeds the recursion limit) as alternatives are added.
+
+Usage:
+
+    python benchmarks/operators.py [--sizes N [N ...]] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from functools import reduce
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsInt
+from dirty_equals._base import DirtyAnd, DirtyOr
+
+
+def depth(node: Any) -> int:
+    stack = [(node, 1)]
+    max_depth = 0
+    while stack:
+        node, d = stack.pop()
+        if isinstance(node, (DirtyOr, DirtyAnd)):
+            max_depth = max(max_depth, d)
+            stack.extend((child, d + 1) for child in node.dirties)
+    return max_depth
+
+
+def per_alternative(matcher: Any, other: Any, size: int, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        matcher.match(other)
+    return (time.perf_counter() - start) / repeat / size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1_000, 10_000], help='chain lengths')
+    parser.add_argument('--repeat', type=int, default=20, help='comparisons per measurement')
+    args = parser.parse_args()
+
+    print(f'{"size":>8} {"":>8} {"depth":>8} {"ns/alternative":>15}')
+    for size in args.sizes:
+        # only the last alternative matches so every branch is evaluated
+        alternatives = [IsInt(exactly=i) for i in range(size)]
+        other = size - 1
+        chains = {
+            'flat': reduce(lambda a, b: a | b, alternatives),
+            'nested': reduce(lambda a, b: DirtyOr(a, b), alternatives),
+        }
+        for name, matcher in chains.items():
+            try:
+                cost = f'{per_alternative(matcher, other, size, args.repeat) * 1e9:>15,.0f}'
+            except RecursionError:
+                cost = f'{"RecursionError":>15}'
+            print(f'{size:>8} {name:>8} {depth(matcher):>8} {cost}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Time for ordered comparisons with `IsList(...)` and `IsList(positions=...)`, compared to the previous
+implementation, which copied both sides into lists before comparing them.
+
+Usage:
+
+    python benchmarks/ordered.py [--size N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsList
+
+
+def copy_both(items: tuple[Any, ...], other: list[Any]) -> bool:
+    return list(items) == list(other)
+
+
+def timed(func: Callable[[], bool], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=100_000, help='list size')
+    parser.add_argument('--repeat', type=int, default=100, help='comparisons of each case')
+    args = parser.parse_args()
+
+    other = list(range(args.size))
+    cases = {
+        'equal': list(other),
+        'first differs': [-1, *other[1:]],
+        'last differs': [*other[:-1], -1],
+    }
+    print(f'{args.size:,} items, {args.repeat} comparisons')
+    print(f'{"case":<16} {"copy both":>10} {"IsList":>10}')
+    for name, items in cases.items():
+        matcher = IsList(*items)
+        before = timed(lambda: copy_both(matcher.items, other), args.repeat)
+        after = timed(lambda: other == matcher, args.repeat)
+        print(f'{name:<16} {before:9.4f}s {after:9.4f}s')
+
+    matcher = IsList(positions={-1: other[-1], (-10, None): other[-10:]})
+    after = timed(lambda: other == matcher, args.repeat)
+    print(f'{"negative/slice":<16} {"":>10} {after:9.4f}s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
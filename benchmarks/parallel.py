@@ -0,0 +1,51 @@
+"""
+Scaling of `validate_parallel()` from one worker process up to `--workers`, checking a list of dicts,
+compared to `match_many()` in a single process.
+
+Usage:
+
+    python benchmarks/parallel.py [--count N] [--workers N] [--chunksize N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dirty_equals
+from dirty_equals import IsDict, IsInt, IsList, IsStr
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of values')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='maximum number of workers')
+    parser.add_argument('--chunksize', type=int, default=10_000, help='values sent to a worker at a time')
+    args = parser.parse_args()
+
+    matcher = IsDict(id=IsInt(ge=0), name=IsStr(min_length=1), tags=IsList(IsStr, length=...))
+    values = [{'id': i, 'name': f'user {i}', 'tags': ['a', 'b']} for i in range(args.count)]
+
+    start = time.perf_counter()
+    assert matcher.match_many(values)
+    baseline = time.perf_counter() - start
+    print(f'{args.count:,} values, chunksize {args.chunksize:,}')
+    print(f'{"match_many()":>14} {baseline:8.3f}s')
+
+    workers = 1
+    while True:
+        start = time.perf_counter()
+        assert dirty_equals.validate_parallel(matcher, values, workers=workers, chunksize=args.chunksize)
+        elapsed = time.perf_counter() - start
+        print(f'{workers:>6} workers {elapsed:8.3f}s {baseline / elapsed:6.2f}x')
+        if workers >= args.workers:
+            break
+        workers = min(workers * 2, args.workers)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Size of pickled *dirty-equals* types, and the time to pickle and unpickle them, compared to pickling every slot
+as python does by default (which fails for types holding type adapters or generated functions).
+
+Usage:
+
+    python benchmarks/pickling.py [--number N]
+"""
+
+import argparse
+import pickle
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dirty_equals
+from dirty_equals import IsDatetime, IsDict, IsInt, IsList, IsStr, IsUrl
+from dirty_equals._base import DirtyEquals
+
+CASES: dict[str, Callable[[], DirtyEquals[Any]]] = {
+    'IsInt': lambda: IsInt(gt=0),
+    'IsStr': lambda: IsStr(regex=r'\d+'),
+    'IsDatetime': lambda: IsDatetime(iso_string=True),
+    'IsDict': lambda: IsDict(id=IsInt, name=IsStr, tags=IsList(IsStr, length=...)),
+    'IsUrl': lambda: IsUrl(scheme='https'),
+    'compile': lambda: dirty_equals.compile({'id': IsInt, 'name': IsStr}),
+}
+
+
+def default_reduce(obj: DirtyEquals[Any]) -> Any:
+    """
+    Subclass the type of `obj` so it's pickled as python does by default, registered in this module so it can be
+    unpickled.
+    """
+    cls = type(obj)
+    name = f'Default{cls.__name__}'
+    default_cls = globals().get(name)
+    if default_cls is None:
+        default_cls = type(name, (cls,), {'__slots__': (), '__reduce__': object.__reduce__, '__module__': __name__})
+        globals()[name] = default_cls
+    obj.__class__ = default_cls
+    return obj
+
+
+def round_trip(obj: Any, number: int) -> tuple[int, float]:
+    data = pickle.dumps(obj)
+    seconds = min(timeit.repeat(lambda: pickle.loads(pickle.dumps(obj)), number=number, repeat=5))
+    return len(data), seconds / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=10_000, help='number of round trips of each type')
+    args = parser.parse_args()
+
+    print(f'{"type":>12} {"size":>7} {"round trip":>11} {"default size":>13} {"default round trip":>19}')
+    for name, build in CASES.items():
+        size, seconds = round_trip(build(), args.number)
+        try:
+            default_size, default_seconds = round_trip(default_reduce(build()), args.number)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            default = f'{"unpicklable":>13} {"-":>19}'
+        else:
+            default = f'{default_size:>12,}B {default_seconds * 1e6:>17.2f}µs'
+        print(f'{name:>12} {size:>6,}B {seconds * 1e6:>9.2f}µs {default}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
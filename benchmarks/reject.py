@@ -0,0 +1,64 @@
+"""
+Cost of rejecting values, which dominates `|` chains and unordered list matching where most comparisons fail.
+
+Numeric and date types signal that a value can't be equal by returning `Reject` from `prepare()` rather than
+raising an exception which is caught by `__eq__`, this compares each type to a subclass which rejects values by
+raising, as `prepare()` used to.
+
+Usage:
+
+    python benchmarks/reject.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsDate, IsDatetime, IsFloat, IsInt
+from dirty_equals._base import DirtyEquals
+from dirty_equals._utils import Reject
+
+
+def raising(cls: Any) -> Any:
+    """
+    Subclass `cls` so rejected values raise a `TypeError` instead.
+    """
+
+    class Raising(cls):
+        def prepare(self, other: Any) -> Any:
+            prepared = super().prepare(other)
+            if prepared is Reject:
+                raise TypeError(f'{type(other)} not valid for {self.__class__.__name__}')
+            return prepared
+
+    Raising.__name__ = cls.__name__
+    return Raising
+
+
+def per_comparison(matcher: DirtyEquals[Any], other: Any, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        matcher.match(other)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=100_000, help='comparisons per measurement')
+    args = parser.parse_args()
+
+    cases = [(IsInt, 'x'), (IsInt, True), (IsFloat, None), (IsDatetime, 'x'), (IsDate, 123)]
+    print(f'{"type":>12} {"value":>8} {"reject ns":>10} {"raise ns":>10} {"speedup":>8}')
+    for cls, other in cases:
+        reject = per_comparison(cls(), other, args.repeat)
+        raise_ = per_comparison(raising(cls)(), other, args.repeat)
+        print(f'{cls.__name__:>12} {other!r:>8} {reject * 1e9:>10,.0f} {raise_ * 1e9:>10,.0f} {raise_ / reject:>7.1f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Memory kept alive by matchers which outlive their comparisons, for each `retention` policy.
+
+Each case compares a large response body to a matcher which is kept (e.g. at module level or in a fixture),
+with `'strong'` retention every body stays in memory until its matcher is compared again or discarded.
+
+Usage:
+
+    python benchmarks/retention.py [--cases N] [--items N]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import DirtyEquals, IsDict, IsInt, IsList, IsStr
+
+
+class Body(dict):  # type: ignore[type-arg]
+    """
+    Unlike `dict`, instances of subclasses of `dict` can be weakly referenced.
+    """
+
+
+def build_body(items: int, subclass: bool) -> dict[str, Any]:
+    body = {'items': [{'id': i, 'name': f'item {i}'} for i in range(items)]}
+    return Body(body) if subclass else body
+
+
+def measure(cases: int, items: int, retention: str, subclass: bool) -> int:
+    setattr(DirtyEquals, 'retention', retention)
+    matchers = [IsDict(items=IsList(IsDict(id=IsInt, name=IsStr), length=...)) for _ in range(cases)]
+    gc.collect()
+    tracemalloc.start()
+    for matcher in matchers:
+        body = build_body(items, subclass)
+        assert body == matcher
+        del body
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del matchers
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', type=int, default=200, help='number of matchers kept')
+    parser.add_argument('--items', type=int, default=1_000, help='items in each response body')
+    args = parser.parse_args()
+
+    print(f'{"retention":>10} {"value":>9} {"retained":>12} {"per case":>10}')
+    for retention in 'strong', 'weak', 'none':
+        for subclass in False, True:
+            size = measure(args.cases, args.items, retention, subclass)
+            value = 'Body' if subclass else 'dict'
+            print(f'{retention:>10} {value:>9} {size / 1024:>10,.0f}KB {size / args.cases / 1024:>8,.1f}KB')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Memory per instance of *dirty-equals* types, which all use `__slots__`, compared to holding the same
+attributes in a `__dict__` as every type except `DirtyEquals` itself used to.
+
+Usage:
+
+    python benchmarks/slots.py [--instances N]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsDatetime, IsDict, IsInt, IsIP, IsList, IsStr
+from dirty_equals._base import DirtyEquals
+
+# slots `DirtyEquals` had before every type used slots
+BASE_SLOTS = {'_compared', '_repr_args', '_repr_kwargs', '_repr_cache', '__weakref__'}
+POINTER_SIZE = 8
+
+CASES: dict[str, tuple[type[DirtyEquals[Any]], Callable[[Any], DirtyEquals[Any]]]] = {
+    'IsInt': (IsInt, lambda cls: cls(gt=0)),
+    'IsStr': (IsStr, lambda cls: cls(min_length=1, max_length=100)),
+    'IsDatetime': (IsDatetime, lambda cls: cls(iso_string=True)),
+    'IsIP': (IsIP, lambda cls: cls(version=4)),
+    'IsList': (IsList, lambda cls: cls(1, 2, 3)),
+    'IsDict': (IsDict, lambda cls: cls(a=1, b=2)),
+}
+
+
+def with_dict(cls: type[DirtyEquals[Any]]) -> tuple[Any, int]:
+    """
+    Subclass `cls` so attributes are stored in a `__dict__`, and get the size of the slots which are no longer used.
+
+    Class attributes with the same names as slots hide the slot descriptors, so instance attributes are stored in
+    the instance's `__dict__` instead.
+    """
+    names = {name for base in cls.__mro__ for name in getattr(base, '__slots__', ())} - BASE_SLOTS
+    return type(cls.__name__, (cls,), dict.fromkeys(names)), len(names) * POINTER_SIZE
+
+
+def bytes_per_instance(build: Callable[[], DirtyEquals[Any]], instances: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build() for _ in range(instances)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    # this includes the list holding the instances, which is the same size in both cases
+    return size / instances
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--instances', type=int, default=100_000, help='number of instances of each type')
+    args = parser.parse_args()
+
+    print(f'{"type":>12} {"slots":>9} {"__dict__":>9} {"saving":>8}')
+    for name, (cls, build) in CASES.items():
+        slots = bytes_per_instance(lambda: build(cls), args.instances)
+        dict_cls, unused = with_dict(cls)
+        dict_ = bytes_per_instance(lambda: build(dict_cls), args.instances) - unused
+        print(f'{name:>12} {slots:>8,.0f}B {dict_:>8,.0f}B {1 - slots / dict_:>8.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
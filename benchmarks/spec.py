@@ -0,0 +1,66 @@
+"""
+Time to load a directory of JSON contract specs with `load_spec()`, without a cache, while filling the cache
+and from the cache.
+
+Usage:
+
+    python benchmarks/spec.py [--files N] [--fields N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dirty_equals
+from dirty_equals import IsDatetime, IsDict, IsInt, IsList, IsStr
+
+
+def contract(fields: int, seed: int) -> dict[str, object]:
+    item = IsDict(
+        id=IsInt(gt=seed),
+        name=IsStr(regex=r'[a-z]+', min_length=1),
+        tags=IsList(IsStr, length=...),
+        created=IsDatetime(iso_string=True) | IsInt,
+    )
+    return {f'field_{i}': item for i in range(fields)}
+
+
+def load_all(paths: list[Path], cache_dir: 'Path | None') -> float:
+    start = time.perf_counter()
+    for path in paths:
+        dirty_equals.load_spec(path, cache_dir=cache_dir)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=1_000, help='number of contract files')
+    parser.add_argument('--fields', type=int, default=20, help='number of fields in each contract')
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = Path(tmp) / f'contract_{i}.json'
+            path.write_text(json.dumps(dirty_equals.to_spec(contract(args.fields, i))))
+            paths.append(path)
+
+        cache_dir = Path(tmp) / 'cache'
+        no_cache = load_all(paths, None)
+        cold = load_all(paths, cache_dir)
+        warm = load_all(paths, cache_dir)
+
+    print(f'{args.files:,} files with {args.fields} fields each')
+    print(f'{"no cache":>12} {no_cache:8.3f}s')
+    print(f'{"cold cache":>12} {cold:8.3f}s')
+    print(f'{"warm cache":>12} {warm:8.3f}s {no_cache / warm:6.1f}x faster')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
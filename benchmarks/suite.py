@@ -0,0 +1,616 @@
+"""
+Benchmarks for every type exported by `dirty_equals`.
+
+For each type, and at each input size, this measures:
+
+* `construct` - creating an instance
+* `match` - comparing a value which is equal
+* `eq` - comparing a value which is equal with the value on the left, e.g. `assert value == IsInt()`, the usual
+  way types are used, this goes through `==` on the value first and includes recording the compared value
+* `reject` - comparing a value which isn't equal
+* `repr` - comparing a value which is equal then getting the repr, which shows that value as in pytest diffs
+
+Times are the best of several runs, in seconds per operation. Results are written as JSON, which can be compared
+to a baseline to flag regressions.
+
+Usage:
+
+    python benchmarks/suite.py run [--output results.json] [--sizes small medium large] [--only IsInt IsStr ...]
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.2]
+
+`compare` exits with code 1 if any time is more than `threshold` slower than the baseline.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from array import array
+from dataclasses import make_dataclass
+from datetime import date, datetime, timedelta
+from enum import Enum
+from hashlib import sha256
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, NamedTuple, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dirty_equals
+from dirty_equals import (
+    AnyThing,
+    Contains,
+    FunctionCheck,
+    HasAttributes,
+    HasLen,
+    HasName,
+    HasRepr,
+    IsAnyStr,
+    IsApprox,
+    IsArrayOf,
+    IsBytes,
+    IsDataclass,
+    IsDataclassType,
+    IsDate,
+    IsDatetime,
+    IsDict,
+    IsEnum,
+    IsFalseLike,
+    IsFloat,
+    IsFloatInf,
+    IsFloatInfNeg,
+    IsFloatInfPos,
+    IsFloatNan,
+    IsHash,
+    IsIgnoreDict,
+    IsInstance,
+    IsInt,
+    IsIP,
+    IsJson,
+    IsList,
+    IsListOrTuple,
+    IsNegative,
+    IsNegativeFloat,
+    IsNegativeInt,
+    IsNonNegative,
+    IsNonPositive,
+    IsNow,
+    IsNumber,
+    IsNumeric,
+    IsOneOf,
+    IsPartialDataclass,
+    IsPartialDict,
+    IsPositive,
+    IsPositiveFloat,
+    IsPositiveInt,
+    IsStr,
+    IsStrictDataclass,
+    IsStrictDict,
+    IsToday,
+    IsTrueLike,
+    IsTuple,
+    IsUrl,
+    IsUUID,
+)
+
+# the size of inputs, e.g. the length of strings and lists or the number of dict keys and dataclass fields
+SIZES = {'small': 1, 'medium': 100, 'large': 10_000}
+# exported classes which aren't types to compare against
+NOT_MATCHERS = {'DirtyEquals', 'MatchResult', 'MatchManyResult'}
+# marks that a type has no value which isn't equal
+NO_REJECT = object()
+# cases which aren't a single exported type
+EXTRA_CASES = ['nested']
+
+
+class Case(NamedTuple):
+    build: Callable[[], Any]
+    match: Any
+    reject: Any
+
+
+CASES: dict[str, Callable[[int], Case]] = {}
+
+
+def case(name: str) -> Callable[[Callable[[int], Case]], Callable[[int], Case]]:
+    def register(func: Callable[[int], Case]) -> Callable[[int], Case]:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def items(n: int) -> tuple[list[int], list[int]]:
+    """
+    A list of `n` ints, and the same list with the last item changed.
+    """
+    values = list(range(n))
+    return values, [*values[:-1], -1]
+
+
+def mapping(n: int) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    A dict with `n` keys, and the same dict with the last value changed.
+    """
+    values = {f'k{i}': i for i in range(n)}
+    return values, {**values, f'k{n - 1}': -1}
+
+
+# base
+
+
+@case('AnyThing')
+def _(n: int) -> Case:
+    return Case(AnyThing, list(range(n)), NO_REJECT)
+
+
+@case('IsOneOf')
+def _(n: int) -> Case:
+    values = range(n)
+    return Case(lambda: IsOneOf(*values), n - 1, -1)
+
+
+# boolean
+
+
+@case('IsTrueLike')
+def _(n: int) -> Case:
+    return Case(IsTrueLike, list(range(n)), [])
+
+
+@case('IsFalseLike')
+def _(n: int) -> Case:
+    return Case(IsFalseLike, '', 'x' * n)
+
+
+# dataclass
+
+
+def dataclass_values(n: int) -> tuple[Any, Any, Any, dict[str, int]]:
+    fields = mapping(n)[0]
+    cls = make_dataclass(f'Data{n}', list(fields))
+    return cls, cls(*range(n)), cls(*range(n - 1), -1), fields
+
+
+@case('IsDataclass')
+def _(n: int) -> Case:
+    _, instance, other, fields = dataclass_values(n)
+    return Case(lambda: IsDataclass(**fields), instance, other)
+
+
+@case('IsDataclassType')
+def _(n: int) -> Case:
+    cls, instance, _, _ = dataclass_values(n)
+    return Case(IsDataclassType, cls, instance)
+
+
+@case('IsPartialDataclass')
+def _(n: int) -> Case:
+    _, instance, other, fields = dataclass_values(n)
+    return Case(lambda: IsPartialDataclass(**fields), instance, other)
+
+
+@case('IsStrictDataclass')
+def _(n: int) -> Case:
+    _, instance, other, fields = dataclass_values(n)
+    return Case(lambda: IsStrictDataclass(**fields), instance, other)
+
+
+# datetime, sizes don't apply
+
+
+@case('IsDatetime')
+def _(n: int) -> Case:
+    now = datetime.now()
+    return Case(lambda: IsDatetime(approx=now), now, 'x')
+
+
+@case('IsNow')
+def _(n: int) -> Case:
+    return Case(IsNow, datetime.now(), datetime.now() - timedelta(days=1))
+
+
+@case('IsDate')
+def _(n: int) -> Case:
+    today = date.today()
+    return Case(lambda: IsDate(approx=today), today, 'x')
+
+
+@case('IsToday')
+def _(n: int) -> Case:
+    return Case(IsToday, date.today(), date.today() - timedelta(days=2))
+
+
+# dict
+
+
+@case('IsDict')
+def _(n: int) -> Case:
+    values, other = mapping(n)
+    return Case(lambda: IsDict(values), values, other)
+
+
+@case('IsPartialDict')
+def _(n: int) -> Case:
+    values, other = mapping(n)
+    return Case(lambda: IsPartialDict(values), values, other)
+
+
+@case('IsIgnoreDict')
+def _(n: int) -> Case:
+    values, other = mapping(n)
+    return Case(lambda: IsIgnoreDict(values), values, other)
+
+
+@case('IsStrictDict')
+def _(n: int) -> Case:
+    values, other = mapping(n)
+    return Case(lambda: IsStrictDict(values), values, other)
+
+
+# enum
+
+
+@case('IsEnum')
+def _(n: int) -> Case:
+    enum_cls = Enum(f'Enum{n}', mapping(n)[0])  # type: ignore[misc]
+    return Case(lambda: IsEnum(enum_cls), n - 1, -1)
+
+
+# sequence
+
+
+@case('Contains')
+def _(n: int) -> Case:
+    values, other = items(n)
+    return Case(lambda: Contains(n - 1), values, other)
+
+
+@case('HasLen')
+def _(n: int) -> Case:
+    return Case(lambda: HasLen(n), list(range(n)), list(range(n + 1)))
+
+
+@case('IsList')
+def _(n: int) -> Case:
+    values, other = items(n)
+    return Case(lambda: IsList(*values), values, other)
+
+
+@case('IsTuple')
+def _(n: int) -> Case:
+    values, other = items(n)
+    return Case(lambda: IsTuple(*values), tuple(values), tuple(other))
+
+
+@case('IsListOrTuple')
+def _(n: int) -> Case:
+    values, other = items(n)
+    return Case(lambda: IsListOrTuple(*values), tuple(values), tuple(other))
+
+
+# numeric, values are rejected by type or by a bound, sizes change the magnitude of values
+
+
+@case('IsNumeric')
+def _(n: int) -> Case:
+    return Case(lambda: IsNumeric(gt=0), n, None)
+
+
+@case('IsApprox')
+def _(n: int) -> Case:
+    return Case(lambda: IsApprox(n), n, n * 2 + 1)
+
+
+@case('IsNumber')
+def _(n: int) -> Case:
+    return Case(IsNumber, n, 'x')
+
+
+@case('IsPositive')
+def _(n: int) -> Case:
+    return Case(IsPositive, n, -n)
+
+
+@case('IsNegative')
+def _(n: int) -> Case:
+    return Case(IsNegative, -n, n)
+
+
+@case('IsNonPositive')
+def _(n: int) -> Case:
+    return Case(IsNonPositive, -n, n)
+
+
+@case('IsNonNegative')
+def _(n: int) -> Case:
+    return Case(IsNonNegative, n, -n)
+
+
+@case('IsInt')
+def _(n: int) -> Case:
+    return Case(IsInt, n, float(n))
+
+
+@case('IsPositiveInt')
+def _(n: int) -> Case:
+    return Case(IsPositiveInt, n, -n)
+
+
+@case('IsNegativeInt')
+def _(n: int) -> Case:
+    return Case(IsNegativeInt, -n, n)
+
+
+@case('IsFloat')
+def _(n: int) -> Case:
+    return Case(IsFloat, float(n), n)
+
+
+@case('IsPositiveFloat')
+def _(n: int) -> Case:
+    return Case(IsPositiveFloat, float(n), -float(n))
+
+
+@case('IsNegativeFloat')
+def _(n: int) -> Case:
+    return Case(IsNegativeFloat, -float(n), float(n))
+
+
+@case('IsFloatInf')
+def _(n: int) -> Case:
+    return Case(IsFloatInf, float('inf'), float(n))
+
+
+@case('IsFloatInfNeg')
+def _(n: int) -> Case:
+    return Case(IsFloatInfNeg, float('-inf'), float('inf'))
+
+
+@case('IsFloatInfPos')
+def _(n: int) -> Case:
+    return Case(IsFloatInfPos, float('inf'), float('-inf'))
+
+
+@case('IsFloatNan')
+def _(n: int) -> Case:
+    return Case(IsFloatNan, float('nan'), float(n))
+
+
+@case('IsArrayOf')
+def _(n: int) -> Case:
+    values, other = items(n)
+    return Case(lambda: IsArrayOf(IsInt(ge=0)), array('q', values), array('q', other))
+
+
+# inspection
+
+
+@case('HasAttributes')
+def _(n: int) -> Case:
+    values, other = mapping(n)
+    return Case(lambda: HasAttributes(values), SimpleNamespace(**values), SimpleNamespace(**other))
+
+
+@case('HasName')
+def _(n: int) -> Case:
+    name = 'N' * n
+    return Case(lambda: HasName(name), type(name, (), {}), type('M' * n, (), {}))
+
+
+@case('HasRepr')
+def _(n: int) -> Case:
+    expected = repr('x' * n)
+    return Case(lambda: HasRepr(expected), 'x' * n, 'y' * n)
+
+
+@case('IsInstance')
+def _(n: int) -> Case:
+    values = list(range(n))
+    return Case(lambda: IsInstance(list), values, tuple(values))
+
+
+# other
+
+
+@case('FunctionCheck')
+def _(n: int) -> Case:
+    def check(v: Any) -> bool:
+        return len(v) == n
+
+    return Case(lambda: FunctionCheck(check), 'x' * n, '')
+
+
+@case('IsJson')
+def _(n: int) -> Case:
+    values, other = mapping(n)
+    return Case(lambda: IsJson(values), json.dumps(values), json.dumps(other))
+
+
+@case('IsUUID')
+def _(n: int) -> Case:
+    return Case(IsUUID, 'edf9f29e-45c7-431c-99db-28ea44df9785', 'x' * n)
+
+
+@case('IsUrl')
+def _(n: int) -> Case:
+    return Case(IsUrl, f'https://example.com/{"a" * n}', f'example.com/{"a" * n}')
+
+
+@case('IsHash')
+def _(n: int) -> Case:
+    return Case(lambda: IsHash('sha-256'), sha256(b'x' * n).hexdigest(), 'x' * n)
+
+
+@case('IsIP')
+def _(n: int) -> Case:
+    return Case(IsIP, '179.27.154.96', 'x' * n)
+
+
+# strings
+
+
+@case('IsStr')
+def _(n: int) -> Case:
+    return Case(lambda: IsStr(min_length=1), 'x' * n, b'x' * n)
+
+
+@case('IsBytes')
+def _(n: int) -> Case:
+    return Case(lambda: IsBytes(min_length=1), b'x' * n, 'x' * n)
+
+
+@case('IsAnyStr')
+def _(n: int) -> Case:
+    return Case(lambda: IsAnyStr(min_length=1), 'x' * n, [])
+
+
+# other
+
+
+@case('nested')
+def _(n: int) -> Case:
+    value = {'a': n, 'b': 'x' * n, 'c': list(range(n))}
+    return Case(lambda: IsDict(a=IsInt(), b=IsStr(), c=IsList(IsInt(), length=...)), value, {**value, 'c': ['x'] * n})
+
+
+def exported_matchers() -> list[str]:
+    return [
+        name
+        for name in dirty_equals.__all__
+        if isinstance(getattr(dirty_equals, name), type) and name not in NOT_MATCHERS
+    ]
+
+
+def best_time(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """
+    Best time in seconds per call of `func`, over `repeat` runs which each take at least `min_time`.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / elapsed * 1.2)) if elapsed else number * 10
+    return min([elapsed, *timer.repeat(repeat - 1, number)]) / number
+
+
+def measure(name: str, n: int, repeat: int, min_time: float) -> dict[str, Optional[float]]:
+    build, match, reject = CASES[name](n)
+    matcher = build()
+    # check the case is correct, otherwise the wrong path would be measured
+    if not matcher == match:
+        raise RuntimeError(f'{name}: {match!r} should match')
+    if reject is not NO_REJECT and matcher == reject:
+        raise RuntimeError(f'{name}: {reject!r} should not match')
+
+    def repr_after_match() -> str:
+        matcher == match
+        return repr(matcher)
+
+    return {
+        'construct': best_time(build, repeat, min_time),
+        'match': best_time(lambda: matcher == match, repeat, min_time),
+        'eq': best_time(lambda: match == matcher, repeat, min_time),
+        'reject': None if reject is NO_REJECT else best_time(lambda: matcher == reject, repeat, min_time),
+        'repr': best_time(repr_after_match, repeat, min_time),
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    names = exported_matchers()
+    missing = set(names) - CASES.keys()
+    if missing:
+        print(f'no benchmark cases for: {", ".join(sorted(missing))}', file=sys.stderr)
+        return 1
+    names += EXTRA_CASES
+    if args.only:
+        names = [name for name in names if name in args.only]
+
+    results: dict[str, dict[str, dict[str, Optional[float]]]] = {}
+    for name in names:
+        results[name] = {}
+        for size in args.sizes:
+            results[name][size] = times = measure(name, SIZES[size], args.repeat, args.min_time)
+            print(f'{name:>20} {size:>7} ' + ' '.join(f'{k} {format_time(v):>9}' for k, v in times.items()))
+
+    data = {
+        'dirty_equals': dirty_equals.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'sizes': {size: SIZES[size] for size in args.sizes},
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(data, indent=2))
+        print(f'results written to {args.output}')
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())['results']
+    current = json.loads(Path(args.current).read_text())['results']
+
+    regressions = 0
+    print(f'{"":>20} {"":>7} {"":>9} {"baseline":>10} {"current":>10} {"change":>8}')
+    for name, sizes in current.items():
+        for size, times in sizes.items():
+            for metric, value in times.items():
+                base = baseline.get(name, {}).get(size, {}).get(metric)
+                if base is None or value is None:
+                    continue
+                change = value / base - 1
+                flag = ''
+                if change > args.threshold:
+                    flag = '  regression'
+                    regressions += 1
+                elif change < -args.threshold:
+                    flag = '  improvement'
+                if flag or args.verbose:
+                    print(
+                        f'{name:>20} {size:>7} {metric:>9} {format_time(base):>10} {format_time(value):>10} '
+                        f'{change:>+8.1%}{flag}'
+                    )
+    print(f'{regressions} regression{"" if regressions == 1 else "s"} above {args.threshold:.0%}')
+    return 1 if regressions else 0
+
+
+def format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '-'
+    elif seconds < 1e-6:
+        return f'{seconds * 1e9:.0f}ns'
+    elif seconds < 1e-3:
+        return f'{seconds * 1e6:.1f}µs'
+    else:
+        return f'{seconds * 1e3:.1f}ms'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('--output', help='path to write JSON results to')
+    run_parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES), help='input sizes')
+    run_parser.add_argument('--only', nargs='+', help='only benchmark these types')
+    run_parser.add_argument('--repeat', type=int, default=5, help='runs per measurement, the best is used')
+    run_parser.add_argument('--min-time', type=float, default=0.02, help='minimum seconds per run')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser('compare', help='compare results to a baseline')
+    compare_parser.add_argument('baseline', help='JSON results to compare against')
+    compare_parser.add_argument('current', help='JSON results to check')
+    compare_parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown which is flagged')
+    compare_parser.add_argument('--verbose', action='store_true', help='show every time, not just changes')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Multi-threaded stress and throughput benchmark.
+
+N threads compare many payloads against the same shared matchers, every verdict is checked so any corruption caused
+by concurrent use shows up as an error, and the throughput for each thread count is compared to a single thread.
+
+On free-threaded python (3.13t, 3.14t) throughput should scale close to linearly with the number of threads,
+with the GIL enabled expect a speedup of roughly 1x.
+
+Usage:
+
+    python benchmarks/threads.py [--threads N] [--payloads N] [--mode match|eq]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from threading import Barrier
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsDict, IsInt, IsList, IsNow, IsPositiveInt, IsStr
+
+shared = IsDict(
+    id=IsPositiveInt,
+    name=IsStr(regex=r'user-\d+'),
+    tags=IsList(IsStr, length=...),
+    score=IsInt(ge=0, le=100) | IsStr,
+    created=IsNow(iso_string=True, delta=3600),
+)
+
+
+def build_payloads(count: int) -> list[tuple[dict[str, Any], bool]]:
+    now = datetime.now().isoformat()
+    payloads = []
+    for i in range(count):
+        good = i % 3 != 0
+        payloads.append(
+            (
+                {
+                    'id': i + 1 if good else -i,
+                    'name': f'user-{i}',
+                    'tags': ['a', 'b'],
+                    'score': i % 100,
+                    'created': now,
+                },
+                good,
+            )
+        )
+    return payloads
+
+
+def worker(payloads: list[tuple[dict[str, Any], bool]], mode: str) -> int:
+    errors = 0
+    if mode == 'match':
+        for payload, expected in payloads:
+            result = shared.match(payload)
+            if bool(result) is not expected:
+                errors += 1
+            elif expected and result.value is not payload:
+                errors += 1
+    else:
+        for payload, expected in payloads:
+            if (payload == shared) is not expected:
+                errors += 1
+    return errors
+
+
+def run(threads: int, payloads: list[tuple[dict[str, Any], bool]], mode: str) -> tuple[float, int]:
+    barrier = Barrier(threads + 1)
+
+    def target() -> int:
+        barrier.wait()
+        return worker(payloads, mode)
+
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(target) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        errors = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+    return threads * len(payloads) / elapsed, errors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=os.cpu_count() or 1, help='maximum number of threads')
+    parser.add_argument('--payloads', type=int, default=20_000, help='payloads compared by each thread')
+    parser.add_argument('--mode', choices=('match', 'eq'), default='match', help='use match() or ==')
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'python {sys.version.split()[0]}, GIL {"enabled" if gil_enabled else "disabled"}, mode={args.mode}')
+    payloads = build_payloads(args.payloads)
+
+    thread_counts = sorted({1, *(2**i for i in range(1, args.threads.bit_length())), args.threads})
+    baseline = None
+    total_errors = 0
+    print(f'{"threads":>8} {"comparisons/s":>15} {"speedup":>8} {"efficiency":>11} {"errors":>7}')
+    for threads in thread_counts:
+        rate, errors = run(threads, payloads, args.mode)
+        total_errors += errors
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(f'{threads:>8} {rate:>15,.0f} {speedup:>7.2f}x {speedup / threads:>10.0%} {errors:>7}')
+
+    if total_errors:
+        print(f'{total_errors} incorrect results')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
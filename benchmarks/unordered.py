@@ -0,0 +1,66 @@
+"""
+Time for order insensitive comparisons with `IsList(..., check_order=False)` across sizes, compared to the
+previous implementation, which removed each item from a copy of the list with `list.remove()`.
+
+`list.remove()` lets a matcher take a value a later literal needed, so it gets some cases wrong.
+
+Usage:
+
+    python benchmarks/unordered.py [--sizes N [N ...]]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dirty_equals import IsInt, IsList, IsStr
+
+
+def remove_each(items: tuple[Any, ...], other: list[Any]) -> bool:
+    other_copy = list(other)
+    for item in items:
+        try:
+            other_copy.remove(item)
+        except ValueError:
+            return False
+    return True
+
+
+def timed(func: Callable[[], bool]) -> str:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    return f'{elapsed:.4f}s' if result else 'wrong'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000, 50_000], help='list sizes')
+    args = parser.parse_args()
+
+    print(f'{"size":>8} {"items":<20} {"list.remove()":>14} {"IsList":>10}')
+    for size in args.sizes:
+        strings = [f'item {i}' for i in range(size)]
+        other = [*strings, *range(10)]
+        cases = {
+            'literals': random.sample(other, len(other)),
+            'with 10 IsInt()': [*random.sample(strings, size), *(IsInt() for _ in range(10))],
+            'IsInt() first': [*(IsInt() for _ in range(5)), *random.sample(strings, size), *range(5)],
+            'repeated': ['x'] * (size // 2) + [IsStr(min_length=1)] * (size - size // 2),
+        }
+        for name, items in cases.items():
+            values = ['x'] * size if name == 'repeated' else other
+            matcher = IsList(*items, check_order=False)
+            before = timed(lambda: remove_each(matcher.items, values))
+            after = timed(lambda: values == matcher)
+            print(f'{size:>8} {name:<20} {before:>14} {after:>10}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,47 +1,64 @@
-from ._base import AnyThing, DirtyEquals, IsOneOf
-from ._boolean import IsFalseLike, IsTrueLike
-from ._datetime import IsDate, IsDatetime, IsNow, IsToday
-from ._dict import IsDict, IsIgnoreDict, IsPartialDict, IsStrictDict
-from ._inspection import HasAttributes, HasName, HasRepr, IsInstance
-from ._numeric import (
-    IsApprox,
-    IsFloat,
-    IsFloatInf,
-    IsFloatInfNeg,
-    IsFloatInfPos,
-    IsFloatNan,
-    IsInt,
-    IsNegative,
-    IsNegativeFloat,
-    IsNegativeInt,
-    IsNonNegative,
-    IsNonPositive,
-    IsNumber,
-    IsNumeric,
-    IsPositive,
-    IsPositiveFloat,
-    IsPositiveInt,
-)
-from ._other import (
-    FunctionCheck,
-    IsDataclass,
-    IsDataclassType,
-    IsEnum,
-    IsHash,
-    IsIP,
-    IsJson,
-    IsPartialDataclass,
-    IsStrictDataclass,
-    IsUrl,
-    IsUUID,
-)
-from ._sequence import Contains, HasLen, IsList, IsListOrTuple, IsTuple
-from ._strings import IsAnyStr, IsBytes, IsStr
+import os
+from importlib import import_module
+
 from .version import VERSION
 
+# not imported from `typing` since importing it is slow, type checkers treat this name specially
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from ._async import amatch
+    from ._base import AnyThing, DirtyEquals, IsOneOf, MatchManyResult, MatchResult
+    from ._boolean import IsFalseLike, IsTrueLike
+    from ._compile import compile as compile
+    from ._datetime import IsDate, IsDatetime, IsNow, IsToday
+    from ._dict import IsDict, IsIgnoreDict, IsPartialDict, IsStrictDict
+    from ._explain import explain
+    from ._inspection import HasAttributes, HasName, HasRepr, IsInstance
+    from ._instrument import instrument
+    from ._numeric import (
+        IsApprox,
+        IsArrayOf,
+        IsFloat,
+        IsFloatInf,
+        IsFloatInfNeg,
+        IsFloatInfPos,
+        IsFloatNan,
+        IsInt,
+        IsNegative,
+        IsNegativeFloat,
+        IsNegativeInt,
+        IsNonNegative,
+        IsNonPositive,
+        IsNumber,
+        IsNumeric,
+        IsPositive,
+        IsPositiveFloat,
+        IsPositiveInt,
+    )
+    from ._other import (
+        FunctionCheck,
+        IsDataclass,
+        IsDataclassType,
+        IsEnum,
+        IsHash,
+        IsIP,
+        IsJson,
+        IsPartialDataclass,
+        IsStrictDataclass,
+        IsUrl,
+        IsUUID,
+    )
+    from ._parallel import validate_parallel
+    from ._sequence import Contains, HasLen, IsList, IsListOrTuple, IsTuple
+    from ._spec import from_spec, load_spec, to_spec
+    from ._strings import IsAnyStr, IsBytes, IsStr
+
+# `compile` is deliberately omitted from `__all__` to avoid shadowing the builtin with `from dirty_equals import *`
 __all__ = (
     # base
     'DirtyEquals',
+    'MatchResult',
+    'MatchManyResult',
     'AnyThing',
     'IsOneOf',
     # boolean
@@ -88,6 +105,7 @@ __all__ = (
     'IsFloatInfNeg',
     'IsFloatInfPos',
     'IsFloatNan',
+    'IsArrayOf',
     # inspection
     'HasAttributes',
     'HasName',
@@ -104,8 +122,106 @@ __all__ = (
     'IsStr',
     'IsBytes',
     'IsAnyStr',
+    # functions
+    'explain',
+    'instrument',
+    'from_spec',
+    'to_spec',
+    'load_spec',
+    'validate_parallel',
+    'amatch',
     # version
     '__version__',
 )
 
 __version__ = VERSION
+
+# types and functions are imported when they're first used, so `import dirty_equals` doesn't import
+# every submodule (and the standard library modules they use), see PEP 562
+_dynamic_imports: dict[str, str] = {
+    'AnyThing': '._base',
+    'DirtyEquals': '._base',
+    'IsOneOf': '._base',
+    'MatchResult': '._base',
+    'MatchManyResult': '._base',
+    'IsFalseLike': '._boolean',
+    'IsTrueLike': '._boolean',
+    'compile': '._compile',
+    'IsDate': '._datetime',
+    'IsDatetime': '._datetime',
+    'IsNow': '._datetime',
+    'IsToday': '._datetime',
+    'IsDict': '._dict',
+    'IsIgnoreDict': '._dict',
+    'IsPartialDict': '._dict',
+    'IsStrictDict': '._dict',
+    'explain': '._explain',
+    'HasAttributes': '._inspection',
+    'HasName': '._inspection',
+    'HasRepr': '._inspection',
+    'IsInstance': '._inspection',
+    'instrument': '._instrument',
+    'IsApprox': '._numeric',
+    'IsArrayOf': '._numeric',
+    'IsFloat': '._numeric',
+    'IsFloatInf': '._numeric',
+    'IsFloatInfNeg': '._numeric',
+    'IsFloatInfPos': '._numeric',
+    'IsFloatNan': '._numeric',
+    'IsInt': '._numeric',
+    'IsNegative': '._numeric',
+    'IsNegativeFloat': '._numeric',
+    'IsNegativeInt': '._numeric',
+    'IsNonNegative': '._numeric',
+    'IsNonPositive': '._numeric',
+    'IsNumber': '._numeric',
+    'IsNumeric': '._numeric',
+    'IsPositive': '._numeric',
+    'IsPositiveFloat': '._numeric',
+    'IsPositiveInt': '._numeric',
+    'FunctionCheck': '._other',
+    'IsDataclass': '._other',
+    'IsDataclassType': '._other',
+    'IsEnum': '._other',
+    'IsHash': '._other',
+    'IsIP': '._other',
+    'IsJson': '._other',
+    'IsPartialDataclass': '._other',
+    'IsStrictDataclass': '._other',
+    'IsUrl': '._other',
+    'IsUUID': '._other',
+    'Contains': '._sequence',
+    'HasLen': '._sequence',
+    'IsList': '._sequence',
+    'IsListOrTuple': '._sequence',
+    'IsTuple': '._sequence',
+    'from_spec': '._spec',
+    'load_spec': '._spec',
+    'to_spec': '._spec',
+    'validate_parallel': '._parallel',
+    'amatch': '._async',
+    'IsAnyStr': '._strings',
+    'IsBytes': '._strings',
+    'IsStr': '._strings',
+}
+
+
+# hidden from type checkers, so they report unknown attributes
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> object:
+        module_name = _dynamic_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+        value = getattr(import_module(module_name, __name__), name)
+        # cache the value so `__getattr__` isn't called again
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return [*globals(), *_dynamic_imports]
+
+
+# instrumentation enabled by the environment is set up when `_instrument` is imported
+if os.environ.get('DIRTY_EQUALS_INSTRUMENT'):
+    import_module('._instrument', __name__)
@@ -0,0 +1,74 @@
+import inspect
+from typing import Any
+
+from ._base import DirtyEquals, DirtyEqualsMeta, MatchResult, _not_instantiable, _stateless
+from ._compile import compile
+
+__all__ = ('amatch',)
+
+
+async def amatch(matcher: Any, source: Any) -> MatchResult[Any]:
+    """
+    Compare an awaitable or async iterator to `matcher`, without recording anything on it,
+    like [`match()`][dirty_equals.DirtyEquals.match].
+
+    Args:
+        matcher: A *dirty-equals* type, or any expected value which [`compile()`][dirty_equals.compile] accepts.
+        source: The value to compare, awaitables are awaited first, async iterators (e.g. async generators)
+            are compared as if their items had been collected into a list.
+
+    Returns:
+        A [`MatchResult`][dirty_equals.MatchResult], `other` is the awaited value or the async iterator.
+
+    [`IsList`][dirty_equals.IsList], [`IsTuple`][dirty_equals.IsTuple],
+    [`IsListOrTuple`][dirty_equals.IsListOrTuple], [`HasLen`][dirty_equals.HasLen] and
+    [`Contains`][dirty_equals.Contains] consume async iterators one item at a time: they stop at the first item
+    which doesn't match, or as soon as the result is known, and only keep the items they need, e.g. the last
+    few items to check negative `positions`, or up to the maximum length when `check_order=False`.
+    The type of the stream isn't checked, so `IsList` and `IsTuple` behave the same.
+
+    Other types are compared to the collected list of items.
+
+    Async generators are closed once the comparison is finished, even if it stopped before the end.
+
+    ```py title="amatch"
+    import asyncio
+
+    import dirty_equals
+    from dirty_equals import Contains, IsInt, IsList
+
+    async def numbers():
+        for i in range(1_000_000):
+            yield i
+
+    async def main():
+        assert await dirty_equals.amatch(IsList(0, 1, 2, length=...), numbers())
+        assert await dirty_equals.amatch(Contains(10, 20), numbers())
+        # stops at the third item
+        assert not await dirty_equals.amatch(IsList(0, 1, 5, length=...), numbers())
+        assert await dirty_equals.amatch(IsInt, asyncio.sleep(0, result=42))
+
+    asyncio.run(main())
+    ```
+    """
+    if inspect.isawaitable(source):
+        source = await source
+
+    if isinstance(matcher, DirtyEqualsMeta):
+        # compare with the instance `==` uses for the class, a class which can't be created doesn't match anything
+        matcher = matcher._default_instance()
+    elif not isinstance(matcher, DirtyEquals):
+        matcher = compile(matcher)
+
+    if not hasattr(source, '__aiter__'):
+        return MatchResult(False, source) if matcher is _not_instantiable else matcher.match(source)
+
+    items = source.__aiter__()
+    token = _stateless.set(True)
+    try:
+        return MatchResult(matcher is not _not_instantiable and await matcher._amatches(items), source)
+    finally:
+        _stateless.reset(token)
+        aclose = getattr(items, 'aclose', None)
+        if aclose is not None:
+            await aclose()
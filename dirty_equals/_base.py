@@ -1,15 +1,26 @@
 import io
 from abc import ABCMeta
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextvars import ContextVar
+from copy import deepcopy
+from copyreg import __newobj__  # type: ignore[attr-defined]
 from pprint import PrettyPrinter
-from typing import TYPE_CHECKING, Any, Generic, Optional, Protocol, TypeVar
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, Optional, Protocol, TypeVar
+from weakref import WeakValueDictionary, ref
 
-from ._utils import Omit
+from ._utils import Omit, _literal_types, bounded_repr
 
 if TYPE_CHECKING:
-    from typing import TypeAlias, Union  # noqa: F401
+    from typing import TypeAlias, Union
 
-__all__ = 'DirtyEqualsMeta', 'DirtyEquals', 'AnyThing', 'IsOneOf'
+__all__ = 'DirtyEqualsMeta', 'DirtyEquals', 'MatchResult', 'MatchManyResult', 'AnyThing', 'IsOneOf', 'Retention'
+
+Retention = Literal['strong', 'weak', 'none']
+
+# set while `DirtyEquals.match()` is running, nested comparisons check it so they don't record any state
+_stateless: ContextVar[bool] = ContextVar('dirty_equals_stateless', default=False)
 
 
 class DirtyEqualsMeta(ABCMeta):
@@ -21,19 +32,43 @@ class DirtyEqualsMeta(ABCMeta):
         # we get some recursive errors
         if self is DirtyEquals or other is Generic or other is Protocol:
             return False
+
+        default = self._default_instance()
+        if default is _not_instantiable:
+            # we don't want to raise a type error here since somewhere deep in pytest it does something like
+            # type(a) == type(b), if we raised TypeError we would upset the pytest error message
+            return False
+        elif type(default).__eq__ is DirtyEquals.__eq__:  # type: ignore[comparison-overlap]
+            return default._matches(other)
         else:
+            # `__eq__` is customised and might record state, so compare with a new instance
             try:
                 return self() == other
             except TypeError:
-                # we don't want to raise a type error here since somewhere deep in pytest it does something like
-                # type(a) == type(b), if we raised TypeError we would upset the pytest error message
                 return False
 
+    def _default_instance(self) -> Any:
+        """
+        Get the instance used when comparing to the class itself, it's created on the first comparison and shared
+        after that, it's only used through `_matches()` so never records any state.
+
+        If the class can't be created without arguments, that's remembered so it isn't retried every time.
+        """
+        default = self.__dict__.get('_dirty_equals_default')
+        if default is None:
+            try:
+                default = self()
+            except TypeError:
+                default = _not_instantiable
+            # type.__setattr__ so we don't need to worry about classes which customise attribute access
+            type.__setattr__(self, '_dirty_equals_default', default)
+        return default
+
     def __or__(self, other: Any) -> 'DirtyOr':  # type: ignore[override]
-        return DirtyOr(self, other)
+        return DirtyOr(*_flatten(DirtyOr, self, other))
 
     def __and__(self, other: Any) -> 'DirtyAnd':
-        return DirtyAnd(self, other)
+        return DirtyAnd(*_flatten(DirtyAnd, self, other))
 
     def __invert__(self) -> 'DirtyNot':
         return DirtyNot(self)
@@ -45,7 +80,99 @@ class DirtyEqualsMeta(ABCMeta):
         return self.__name__
 
 
+# marks classes which can't be created without arguments, see `DirtyEqualsMeta._default_instance`
+_not_instantiable = object()
+
 T = TypeVar('T')
+D = TypeVar('D', bound='DirtyEquals[Any]')
+
+
+class MatchResult(Generic[T]):
+    """
+    The outcome of a single comparison made with [`DirtyEquals.match`][dirty_equals.DirtyEquals.match].
+
+    Since the result holds the compared value, the matcher itself is left untouched.
+    """
+
+    __slots__ = 'matched', 'other'
+
+    def __init__(self, matched: bool, other: Any):
+        self.matched = matched
+        self.other = other
+
+    @property
+    def value(self) -> T:
+        """
+        The compared value, only available if the comparison succeeded.
+        """
+        if self.matched:
+            return self.other
+        else:
+            raise AttributeError('value is not available since the comparison failed')
+
+    def __bool__(self) -> bool:
+        return bool(self.matched)
+
+    def __repr__(self) -> str:
+        return f'MatchResult(matched={self.matched!r}, other={self.other!r})'
+
+
+class MatchManyResult:
+    """
+    The outcome of comparing many values with [`DirtyEquals.match_many`][dirty_equals.DirtyEquals.match_many].
+
+    It's truthy if every value matched, `first_failure` is the index of the first value which didn't match.
+    With `verdicts=True` the result of every comparison is kept in `bitmap`, one bit per value, and can be
+    read by index.
+    """
+
+    __slots__ = 'count', 'first_failure', 'bitmap'
+
+    def __init__(self, count: int, first_failure: Optional[int], bitmap: Optional[bytes] = None):
+        self.count = count
+        self.first_failure = first_failure
+        self.bitmap = bitmap
+
+    @classmethod
+    def from_verdicts(cls, verdicts: Iterable[Any]) -> 'MatchManyResult':
+        # one byte per value first, then packed to one bit per value, lowest bit first
+        flags = bytearray(map(bool, verdicts))
+        count = len(flags)
+        first_failure = flags.find(0)
+        bits = int(flags[::-1].translate(_bit_chars) or b'0', 2)
+        return cls(count, None if first_failure == -1 else first_failure, bits.to_bytes((count + 7) // 8, 'little'))
+
+    @property
+    def failures(self) -> list[int]:
+        """
+        Indexes of the values which didn't match, only available with `verdicts=True`.
+        """
+        if self.bitmap is None:
+            raise AttributeError('failures are only available with verdicts=True')
+        return [i for i in range(self.count) if not self[i]]
+
+    def __bool__(self) -> bool:
+        return self.first_failure is None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bool:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('index out of range')
+        if self.bitmap is not None:
+            return bool(self.bitmap[index >> 3] >> (index & 7) & 1)
+        else:
+            # without verdicts, comparisons stopped at the first failure
+            return index != self.first_failure
+
+    def __repr__(self) -> str:
+        return f'MatchManyResult(count={self.count!r}, first_failure={self.first_failure!r})'
+
+
+_bit_chars = bytes.maketrans(b'\x00\x01', b'01')
 
 
 class DirtyEquals(Generic[T], metaclass=DirtyEqualsMeta):
@@ -53,7 +180,67 @@ class DirtyEquals(Generic[T], metaclass=DirtyEqualsMeta):
     Base type for all *dirty-equals* types.
     """
 
-    __slots__ = '_other', '_was_equal', '_repr_args', '_repr_kwargs'
+    __slots__ = (
+        '_compared',
+        '_repr_args',
+        '_repr_kwargs',
+        '_repr_cache',
+        '_retention',
+        '_frozen',
+        '_plain',
+        '__weakref__',
+    )
+
+    cost_hint: ClassVar[float] = 1.0
+    """
+    Rough relative cost of a comparison, used to decide the initial order of branches in adaptive `|` and `&`
+    comparisons, see [boolean logic](../usage.md#adaptive-evaluation-order).
+    """
+
+    repr_max_chars: ClassVar[Optional[int]] = 50_000
+    """
+    Maximum length of the repr of a matched value, see [`__repr__`](../usage.md#__repr__-and-pytest-compatibility),
+    longer reprs are truncated, `None` for no limit.
+    """
+
+    repr_max_nodes: ClassVar[Optional[int]] = 5_000
+    """
+    Maximum number of values (including containers and their items) shown in the repr of a matched value,
+    remaining items are elided with `...`, `None` for no limit.
+    """
+
+    retention: ClassVar[Retention] = 'strong'
+    """
+    How the value last compared with `==` is kept by default, to provide [`.value`][dirty_equals.DirtyEquals.value]
+    and the [`__repr__`](../usage.md#__repr__-and-pytest-compatibility) of matched values:
+
+    * `'strong'` keeps a reference to the value
+    * `'weak'` keeps a weak reference where the value supports it, along with small numbers, strings and bytes
+      which don't, other values aren't kept
+    * `'none'` doesn't keep the value
+
+    When the value isn't kept (or has since been garbage collected), `.value` raises an `AttributeError` and
+    `repr()` describes the type as if the comparison failed. Set it on `DirtyEquals` (or any subclass) to change
+    the default, or use [`retain()`][dirty_equals.DirtyEquals.retain] to set it for an instance,
+    see [retaining compared values](../usage.md#retaining-compared-values).
+    """
+
+    # the last compared value and whether it was equal, kept in a single tuple so that it's always
+    # replaced atomically, even when an instance is compared from multiple threads at once
+    _compared: tuple[Any, Optional[bool]]
+    _repr_args: Iterable[Any]
+    _repr_kwargs: dict[str, Any]
+    # result of `_repr_ne()`, `None` until it's called, or `False` if it includes nested types so can't be cached
+    _repr_cache: 'Union[str, bool, None]'
+    # `retention` for this instance, `None` to use the class's
+    _retention: Optional[Retention]
+    # structural key and its hash, set on instances returned by `freeze()`
+    _frozen: Optional[tuple[Any, int]]
+    # whether the instance isn't frozen and has no `_retention`, so `==` only needs to check the class's retention
+    _plain: bool
+    # slots holding caches derived from other attributes, these aren't pickled or deep-copied, subclasses
+    # rebuild them when they're next used
+    _cache_slots: ClassVar[tuple[str, ...]] = ()
 
     def __init__(self, *repr_args: Any, **repr_kwargs: Any):
         """
@@ -61,10 +248,20 @@ class DirtyEquals(Generic[T], metaclass=DirtyEqualsMeta):
             *repr_args: unnamed args to be used in `__repr__`
             **repr_kwargs: named args to be used in `__repr__`
         """
-        self._other: Any = None
-        self._was_equal: Optional[bool] = None
-        self._repr_args: Iterable[Any] = repr_args
-        self._repr_kwargs: dict[str, Any] = repr_kwargs
+        self._repr_args = repr_args
+        self._repr_kwargs = repr_kwargs
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """
+        Set the comparison state, this is also called by `__eq__` and `__ne__` if a subclass doesn't call
+        `super().__init__()`.
+        """
+        self._compared = (None, None)
+        self._repr_cache = None
+        self._retention = None
+        self._frozen = None
+        self._plain = True
 
     def equals(self, other: Any) -> bool:
         """
@@ -93,33 +290,288 @@ class DirtyEquals(Generic[T], metaclass=DirtyEqualsMeta):
         #> t-123
         ```
         """
-        if self._was_equal:
-            return self._other
-        else:
+        other, was_equal = self._retained()
+        if not was_equal:
             raise AttributeError('value is not available until __eq__ has been called')
+        elif other is _not_retained:
+            retention = self._retention or self.retention
+            raise AttributeError(f'value is not available since it was not retained, retention={retention!r}')
+        else:
+            return other
 
-    def __eq__(self, other: Any) -> bool:
-        self._other = other
+    def match(self, other: Any) -> MatchResult[T]:
+        """
+        Compare `other` to this object without recording anything on it, or on any nested *dirty-equals* types.
+
+        Unlike `==`, `match()` has no side effects, so a single instance can safely be shared between threads
+        or reused for many comparisons, the state of the comparison is held by the returned
+        [`MatchResult`][dirty_equals.MatchResult] instead.
+
+        ```py title="match()"
+        from dirty_equals import IsStr
+
+        token_is_str = IsStr(regex=r't-.+')
+        result = token_is_str.match('t-123')
+        assert result
+        print(result.value)
+        #> t-123
+        assert not token_is_str.match(123)
+        assert repr(token_is_str) == "IsStr(regex='t-.+')"
+        ```
+        """
+        token = _stateless.set(True)
         try:
-            self._was_equal = self.equals(other)
+            return MatchResult(self._matches(other), other)
+        finally:
+            _stateless.reset(token)
+
+    def match_many(self, values: Iterable[Any], *, verdicts: bool = False) -> MatchManyResult:
+        """
+        Compare every value in `values` to this object, like [`match()`][dirty_equals.DirtyEquals.match]
+        nothing is recorded on this object, and the result is a single
+        [`MatchManyResult`][dirty_equals.MatchManyResult] rather than a result per value.
+
+        By default comparisons stop at the first value which doesn't match, with `verdicts=True` every value
+        is compared and the results are kept as a bitmap.
+
+        ```py title="match_many()"
+        from dirty_equals import IsInt
+
+        result = IsInt(gt=0).match_many([1, 2, -3, 4])
+        assert not result
+        print(result.first_failure)
+        #> 2
+        result = IsInt(gt=0).match_many([1, 2, -3, 4, -5], verdicts=True)
+        print(result.failures)
+        #> [2, 4]
+        assert IsInt(gt=0).match_many(range(1, 1000))
+        ```
+        """
+        token = _stateless.set(True)
+        try:
+            if DirtyEquals._matches is _original_matches:
+                results = self._matches_many(values)
+            else:
+                # `instrument()` is active, the faster versions of `_matches_many()` don't call `_matches()`,
+                # so compare each value with it to record them
+                results = map(self._matches, values)
+            if verdicts:
+                return MatchManyResult.from_verdicts(results)
+            count = 0
+            for matched in results:
+                if not matched:
+                    return MatchManyResult(count + 1, count)
+                count += 1
+            return MatchManyResult(count, None)
+        finally:
+            _stateless.reset(token)
+
+    def _matches_many(self, values: Iterable[Any]) -> Iterable[Any]:
+        """
+        Compare each value in turn, returning an iterable of results which is consumed lazily by `match_many()`.
+
+        Subclasses can override this with a faster version, it must give the same result as `_matches()`
+        for every value.
+        """
+        return map(self._matches, values)
+
+    async def _amatches(self, items: AsyncIterator[Any]) -> bool:
+        """
+        Compare the items from an async iterator as if they'd been collected into a list, used by
+        [`amatch()`][dirty_equals.amatch].
+
+        Types which compare sequences override this to check items as they arrive.
+        """
+        return self._matches([item async for item in items])
+
+    def _matches(self, other: Any) -> bool:
+        try:
+            return self.equals(other)
         except (TypeError, ValueError):
-            self._was_equal = False
+            return False
+
+    def freeze(self: 'D') -> 'D':
+        """
+        Get an immutable, hashable version of this object.
+
+        Construction arguments (including any nested *dirty-equals* types, which are frozen too) are used to build a
+        structural key, objects with the same key are interned so freezing equal specs returns the same instance,
+        this makes frozen objects suitable as cache keys and reduces memory when the same checks are repeated
+        many times, e.g. across large generated expectations.
+
+        Frozen objects never record the values they're compared to, so their repr and hash don't change,
+        and they must not be modified. Calling `freeze()` on a frozen object returns the object itself.
+
+        A `TypeError` is raised if any argument is unhashable.
+
+        ```py title="freeze()"
+        from dirty_equals import IsStr
+
+        is_a = IsStr(regex='a.*').freeze()
+        assert is_a is IsStr(regex='a.*').freeze()
+        assert is_a is not IsStr(regex='b.*').freeze()
+
+        cache = {is_a: 'starts with a'}
+        assert 'apple' == is_a
+        assert repr(is_a) == "IsStr(regex='a.*')"
+        assert cache[IsStr(regex='a.*').freeze()] == 'starts with a'
+        ```
+        """
+        # `getattr()` in case a subclass doesn't call `super().__init__()`
+        if getattr(self, '_frozen', None) is not None:
+            return self
+
+        state = {name: _freeze_value(value) for name, value in _get_state(self, self._cache_slots).items()}
+        key = _type_key(type(self)), tuple((k, _structural_key(v)) for k, v in state.items())
+        # this also raises a `TypeError` for unhashable arguments
+        key_hash = hash(key)
+        interned = _interned.get(key)
+        if interned is not None:
+            return interned  # type: ignore[return-value]
+
+        frozen = self._clone()
+        for name, value in state.items():
+            object.__setattr__(frozen, name, value)
+        frozen._frozen = key, key_hash
+        frozen._plain = False
+        with _interned_lock:
+            return _interned.setdefault(key, frozen)  # type: ignore[return-value]
+
+    def retain(self: D, retention: Retention) -> D:
+        """
+        Set [`retention`][dirty_equals._base.DirtyEquals.retention] for this instance, overriding the class's.
+
+        Returns the instance itself, to allow chaining.
+
+        With `'weak'`, values which can't be weakly referenced, e.g. lists, dicts and long strings, aren't kept,
+        so after they're compared `repr()` doesn't show them, use `'strong'` to keep them.
 
-        return self._was_equal
+        ```py title="retain()"
+        from dirty_equals import IsDict, IsInt
+
+        user_matcher = IsDict(id=IsInt).retain('none')
+
+        assert {'id': 1} == user_matcher
+        assert repr(user_matcher) == 'IsDict(id=IsInt)'
+        ```
+        """
+        if retention not in _retentions:
+            raise ValueError(f"retention must be 'strong', 'weak' or 'none', not {retention!r}")
+        self._set_retention(retention)
+        return self
+
+    def _clone(self: D) -> D:
+        """
+        Copy this object with a fresh comparison state, the copy is never frozen.
+        """
+        return _reconstruct(type(self), _get_state(self), getattr(self, '_retention', None))
+
+    def __copy__(self: D) -> D:
+        if getattr(self, '_frozen', None) is not None:
+            return self
+        return self._clone()
+
+    def __deepcopy__(self: D, memo: dict[int, Any]) -> D:
+        if getattr(self, '_frozen', None) is not None:
+            return self
+        cls = type(self)
+        new = memo[id(self)] = cls.__new__(cls)
+        new._init_state()
+        new._set_retention(getattr(self, '_retention', None))
+        for name, value in _get_state(self, cls._cache_slots).items():
+            object.__setattr__(new, name, deepcopy(value, memo))
+        return new
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # pickle attributes without the comparison state or `_cache_slots`
+        state = _get_state(self, self._cache_slots)
+        retention = getattr(self, '_retention', None)
+        if getattr(self, '_frozen', None) is not None:
+            # frozen objects are frozen (and so interned) again when they're unpickled
+            return _reconstruct, (type(self), state, retention, True)
+        # `__newobj__` with `(None, attributes)` as state is restored by pickle without calling any python code,
+        # which is much faster than calling `_reconstruct()` when many objects are unpickled
+        state.update(
+            _compared=(None, None), _repr_cache=None, _retention=retention, _frozen=None, _plain=retention is None
+        )
+        return __newobj__, (type(self),), (None, state)
+
+    def __hash__(self) -> int:
+        frozen = getattr(self, '_frozen', None)
+        if frozen is None:
+            raise TypeError(f'unhashable type: {self.__class__.__name__!r}, use `.freeze()` to get a hashable object')
+        return frozen[1]
+
+    def __eq__(self, other: Any) -> bool:
+        was_equal = self._matches(other)
+        try:
+            plain = self._plain
+        except AttributeError:
+            # a subclass didn't call `super().__init__()`
+            self._init_state()
+            plain = True
+        # the common case first: record the value with the default retention, unless within `match()`
+        if plain and self.retention == 'strong':
+            if not _stateless.get():
+                self._compared = other, was_equal
+        elif self._frozen is None and not _stateless.get():
+            self._compared = self._retain(other, self._retention or self.retention), was_equal
+        return was_equal
 
     def __ne__(self, other: Any) -> bool:
-        # We don't set _was_equal to avoid strange errors in pytest
-        self._other = other
+        # We don't change was_equal to avoid strange errors in pytest
         try:
-            return not self.equals(other)
-        except (TypeError, ValueError):
-            return True
+            plain = self._plain
+        except AttributeError:
+            self._init_state()
+            plain = True
+        if plain and self.retention == 'strong':
+            if not _stateless.get():
+                self._compared = other, self._compared[1]
+        elif self._frozen is None and not _stateless.get():
+            self._compared = self._retain(other, self._retention or self.retention), self._compared[1]
+        return not self._matches(other)
+
+    def _set_retention(self, retention: Optional[Retention]) -> None:
+        self._retention = retention
+        self._plain = retention is None
+
+    def _retain(self, other: Any, retention: Retention) -> Any:
+        """
+        Get what's stored in `_compared` for `other` according to `retention`.
+        """
+        if retention == 'strong':
+            return other
+        elif retention == 'weak':
+            try:
+                return _WeakValue(other)
+            except TypeError:
+                # e.g. ints, strings, lists and dicts can't be weakly referenced
+                other_type = type(other)
+                if other_type in _small_types or (other_type in _small_sized_types and len(other) <= _small_size):
+                    return other
+                return _not_retained
+        elif retention == 'none':
+            return _not_retained
+        else:
+            raise ValueError(f"retention must be 'strong', 'weak' or 'none', not {retention!r}")
+
+    def _retained(self) -> tuple[Any, Optional[bool]]:
+        """
+        The last compared value (or `_not_retained`) and whether it was equal.
+        """
+        other, was_equal = self._compared
+        if type(other) is _WeakValue:
+            other = other()
+            if other is None:
+                return _not_retained, was_equal
+        return other, was_equal
 
     def __or__(self, other: Any) -> 'DirtyOr':
-        return DirtyOr(self, other)
+        return DirtyOr(*_flatten(DirtyOr, self, other))
 
     def __and__(self, other: Any) -> 'DirtyAnd':
-        return DirtyAnd(self, other)
+        return DirtyAnd(*_flatten(DirtyAnd, self, other))
 
     def __invert__(self) -> 'DirtyNot':
         return DirtyNot(self)
@@ -129,29 +581,98 @@ class DirtyEquals(Generic[T], metaclass=DirtyEqualsMeta):
         args += [f'{k}={v!r}' for k, v in self._repr_kwargs.items() if v is not Omit]
         return f'{self.__class__.__name__}({", ".join(args)})'
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """
+        Positional and keyword arguments which create an equivalent object, used by
+        [`to_spec()`][dirty_equals.to_spec]. By default these are the arguments shown in the repr, types whose repr
+        differs from how they're created override this.
+        """
+        args = tuple(arg for arg in self._repr_args if arg is not Omit)
+        return args, {k: v for k, v in self._repr_kwargs.items() if v is not Omit}
+
+    def _spec_settings(self) -> dict[str, Any]:
+        """
+        Arguments to `settings()` which, applied to the object created from `_spec_args()`, create an equivalent
+        object, for types with a `settings()` method.
+        """
+        return {}
+
+    def _cached_repr_ne(self) -> str:
+        cached = getattr(self, '_repr_cache', None)
+        if type(cached) is str:
+            return cached
+        r = self._repr_ne()
+        if cached is None:
+            # `_repr_ne()` can include the repr of nested types which changes when they're compared,
+            # so it's only cached without them
+            nested = any(map(_has_instance, _get_state(self, self._cache_slots).values()))
+            self._repr_cache = False if nested else r
+        return r
+
     def __repr__(self) -> str:
-        if self._was_equal:
-            # if we've got the correct value return it to aid in diffs
-            return repr(self._other)
+        other, was_equal = self._retained()
+        if was_equal and other is not _not_retained:
+            # if we've got the correct value return it to aid in diffs, limiting its size
+            return bounded_repr(other, self.repr_max_chars, self.repr_max_nodes)[0]
         else:
             # else return something which explains what's going on.
-            return self._repr_ne()
+            return self._cached_repr_ne()
 
     def _pprint_format(self, pprinter: PrettyPrinter, stream: io.StringIO, *args: Any, **kwargs: Any) -> None:
         # pytest diffs use pprint to format objects, so we patch pprint to call this method
         # for DirtyEquals objects. So this method needs to follow the same pattern as __repr__.
         # We check that the protected _format method actually exists
         # to be safe and to make linters happy.
-        if self._was_equal and hasattr(pprinter, '_format'):
-            pprinter._format(self._other, stream, *args, **kwargs)
+        other, was_equal = self._retained()
+        if was_equal and other is not _not_retained and hasattr(pprinter, '_format'):
+            r, complete = bounded_repr(other, self.repr_max_chars, self.repr_max_nodes)
+            if complete:
+                pprinter._format(other, stream, *args, **kwargs)
+            else:
+                stream.write(r)
         else:
             stream.write(repr(self))  # i.e. self._repr_ne() (for now)
 
 
+def _has_instance(value: Any) -> bool:
+    """
+    Whether `value` is, or contains, a *dirty-equals* instance.
+    """
+    if isinstance(value, DirtyEquals):
+        return True
+    elif isinstance(value, dict):
+        return any(map(_has_instance, value.keys())) or any(map(_has_instance, value.values()))
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return any(map(_has_instance, value))
+    else:
+        return False
+
+
+class _WeakValue(ref):  # type: ignore[type-arg]
+    """
+    A weak reference to a compared value, a subclass so it can't be confused with a compared `ref`.
+    """
+
+    __slots__ = ()
+
+
+# replaced on `DirtyEquals` while `instrument()` is active
+_original_matches = DirtyEquals._matches
+# stored in place of values which weren't retained
+_not_retained = object()
+_retentions = 'strong', 'weak', 'none'
+# values which can't be weakly referenced but are kept by `retention = 'weak'` since they're small
+_small_types = frozenset({int, float, complex, bool, type(None)})
+_small_sized_types = frozenset({str, bytes})
+_small_size = 1_000
+
+
 # Patch pprint to call _pprint_format for DirtyEquals objects
 # Check that the protected attribute _dispatch exists to be safe and to make linters happy.
 # The reason we modify _dispatch rather than _format
 # is that pytest sometimes uses a subclass of PrettyPrinter which overrides _format.
+# This happens once at import time (which is serialised by the import lock), and is never modified afterwards,
+# so it's safe with free-threaded python.
 if hasattr(PrettyPrinter, '_dispatch'):  # pragma: no branch
     PrettyPrinter._dispatch[DirtyEquals.__repr__] = lambda pprinter, obj, *args, **kwargs: obj._pprint_format(
         pprinter, *args, **kwargs
@@ -162,34 +683,135 @@ InstanceOrType: 'TypeAlias' = 'Union[DirtyEquals[Any], DirtyEqualsMeta]'
 
 
 class DirtyOr(DirtyEquals[Any]):
-    def __init__(self, a: 'InstanceOrType', b: 'InstanceOrType', *extra: 'InstanceOrType'):
+    __slots__ = 'dirties', '_branches'
+
+    cost_hint = 2.0
+
+    def __init__(self, a: 'InstanceOrType', b: 'InstanceOrType', *extra: 'InstanceOrType', adaptive: bool = False):
         self.dirties = (a, b) + extra
+        self._branches = _AdaptiveBranches(self.dirties, True) if adaptive else None
         super().__init__()
 
+    def adaptive(self) -> 'DirtyOr':
+        """
+        Create a copy which reorders its branches to minimise the expected cost of comparisons,
+        see [boolean logic](../usage.md#adaptive-evaluation-order).
+        """
+        return DirtyOr(*self.dirties, adaptive=True)
+
     def equals(self, other: Any) -> bool:
-        return any(d == other for d in self.dirties)
+        if self._branches is None:
+            return any(d == other for d in self.dirties)
+        else:
+            return self._branches.evaluate(other)
 
     def _repr_ne(self) -> str:
         return ' | '.join(_repr_ne(d) for d in self.dirties)
 
 
 class DirtyAnd(DirtyEquals[Any]):
-    def __init__(self, a: InstanceOrType, b: InstanceOrType, *extra: InstanceOrType):
+    __slots__ = 'dirties', '_branches'
+
+    cost_hint = 2.0
+
+    def __init__(self, a: InstanceOrType, b: InstanceOrType, *extra: InstanceOrType, adaptive: bool = False):
         self.dirties = (a, b) + extra
+        self._branches = _AdaptiveBranches(self.dirties, False) if adaptive else None
         super().__init__()
 
+    def adaptive(self) -> 'DirtyAnd':
+        """
+        Create a copy which reorders its branches to minimise the expected cost of comparisons,
+        see [boolean logic](../usage.md#adaptive-evaluation-order).
+        """
+        return DirtyAnd(*self.dirties, adaptive=True)
+
     def equals(self, other: Any) -> bool:
-        return all(d == other for d in self.dirties)
+        if self._branches is None:
+            return all(d == other for d in self.dirties)
+        else:
+            return self._branches.evaluate(other)
 
     def _repr_ne(self) -> str:
         return ' & '.join(_repr_ne(d) for d in self.dirties)
 
 
+# an estimate of the time taken by a comparison with a `cost_hint` of 1
+_cost_hint_seconds = 1e-6
+# how many comparisons the cost hint, and a 50% pass rate, count for when estimating the cost of a branch
+_prior_weight = 4
+# how often the order of branches is reconsidered
+_reorder_interval = 32
+
+
+class _AdaptiveBranches:
+    """
+    Records the cost and pass rate of each branch of an adaptive `DirtyOr` or `DirtyAnd` and uses them to evaluate
+    branches in the order with the lowest expected cost.
+
+    Statistics are updated without locking, so concurrent comparisons may lose a few updates, but the result of a
+    comparison never depends on the order branches are evaluated in.
+    """
+
+    __slots__ = 'dirties', 'decisive', 'calls', 'passes', 'seconds', 'order', 'countdown'
+
+    def __init__(self, dirties: tuple[Any, ...], decisive: bool):
+        self.dirties = dirties
+        # the result of a branch which decides the overall result, `True` for `|` and `False` for `&`
+        self.decisive = decisive
+        self.calls = [0] * len(dirties)
+        self.passes = [0] * len(dirties)
+        self.seconds = [0.0] * len(dirties)
+        self.order = self.choose_order()
+        self.countdown = _reorder_interval
+
+    def evaluate(self, other: Any) -> bool:
+        dirties, calls, passes, seconds = self.dirties, self.calls, self.passes, self.seconds
+        result = not self.decisive
+        for i in self.order:
+            start = perf_counter()
+            passed = bool(dirties[i] == other)
+            seconds[i] += perf_counter() - start
+            calls[i] += 1
+            if passed:
+                passes[i] += 1
+            if passed is self.decisive:
+                result = passed
+                break
+
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.order = self.choose_order()
+            self.countdown = _reorder_interval
+        return result
+
+    def choose_order(self) -> tuple[int, ...]:
+        # for independent branches the expected cost is minimised by evaluating them in order of
+        # cost / probability of deciding the result
+        def rank(i: int) -> float:
+            cost_hint = getattr(self.dirties[i], 'cost_hint', 1.0)
+            calls = self.calls[i] + _prior_weight
+            cost = (self.seconds[i] + cost_hint * _cost_hint_seconds * _prior_weight) / calls
+            pass_rate = (self.passes[i] + _prior_weight / 2) / calls
+            return cost / (pass_rate if self.decisive else 1 - pass_rate)
+
+        return tuple(sorted(range(len(self.dirties)), key=rank))
+
+
 class DirtyNot(DirtyEquals[Any]):
+    __slots__ = ('subject',)
+
     def __init__(self, subject: InstanceOrType):
         self.subject = subject
         super().__init__()
 
+    def __invert__(self) -> Any:
+        # `~~x` is equivalent to `x`
+        if type(self) is DirtyNot:
+            return self.subject
+        else:
+            return super().__invert__()
+
     def equals(self, other: Any) -> bool:
         return self.subject != other
 
@@ -197,11 +819,123 @@ class DirtyNot(DirtyEquals[Any]):
         return f'~{_repr_ne(self.subject)}'
 
 
+def _flatten(cls: 'type[DirtyOr | DirtyAnd]', *operands: Any) -> list[Any]:
+    """
+    Merge the branches of operands which are themselves plain `cls` instances, so `a | b | c` creates a single
+    `DirtyOr(a, b, c)` rather than `DirtyOr(DirtyOr(a, b), c)`.
+
+    Adaptive instances and subclasses are kept as they are.
+    """
+    dirties: list[Any] = []
+    for operand in operands:
+        if type(operand) is cls and operand._branches is None:
+            dirties.extend(operand.dirties)
+        else:
+            dirties.append(operand)
+    return dirties
+
+
+# frozen objects by their structural key, see `DirtyEquals.freeze()`
+_interned: 'WeakValueDictionary[Any, DirtyEquals[Any]]' = WeakValueDictionary()
+_interned_lock = Lock()
+
+
+def _get_state(obj: DirtyEquals[Any], exclude: Iterable[str] = ()) -> dict[str, Any]:
+    """
+    Attributes of a *dirty-equals* object, excluding its comparison state, frozen key and any names in `exclude`.
+    """
+    state = {name: getattr(obj, name) for name in _slot_names(type(obj)) if hasattr(obj, name)}
+    # subclasses defined outside dirty-equals might not use slots
+    state.update(getattr(obj, '__dict__', {}))
+    for name in exclude:
+        state.pop(name, None)
+    return state
+
+
+def _reconstruct(cls: type[D], state: dict[str, Any], retention: Optional[Retention] = None, frozen: bool = False) -> D:
+    """
+    Create an instance of `cls` from the attributes returned by `_get_state()`, used for copying and unpickling.
+    """
+    new = cls.__new__(cls)
+    new._init_state()
+    new._set_retention(retention)
+    for name, value in state.items():
+        object.__setattr__(new, name, value)
+    return new.freeze() if frozen else new
+
+
+def _slot_names(cls: type) -> list[str]:
+    """
+    Names of the slots of `cls` and its bases, excluding those used for comparison state.
+    """
+    names = cls.__dict__.get('_dirty_equals_slot_names')
+    if names is None:
+        names = []
+        for base in reversed(cls.__mro__):
+            slots = base.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in _state_slots and name not in names:
+                    names.append(name)
+        # type.__setattr__ so we don't need to worry about classes which customise attribute access
+        type.__setattr__(cls, '_dirty_equals_slot_names', names)
+    return names
+
+
+# slots holding the state of comparisons rather than what's compared, these are excluded from `freeze()` keys
+_state_slots = {'_compared', '_repr_cache', '_retention', '_frozen', '_plain', '__weakref__', '__dict__'}
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Replace *dirty-equals* objects within `value` with their frozen versions.
+    """
+    value_type = type(value)
+    # checking the metaclass avoids the much slower `ABCMeta.__instancecheck__`
+    if isinstance(value_type, DirtyEqualsMeta):
+        return value.freeze()
+    elif value_type in (list, tuple):
+        return value_type(_freeze_value(v) for v in value)
+    elif value_type is dict:
+        return {k: _freeze_value(v) for k, v in value.items()}
+    else:
+        return value
+
+
+def _structural_key(value: Any) -> Any:
+    """
+    Build a hashable key for `value` which only compares equal to the key of a value with the same structure.
+
+    Keys are built from plain tuples, so comparing keys never calls `__eq__` on *dirty-equals* types, types are
+    compared by identity. Items are tagged with their type so `1`, `1.0` and `True` have different keys.
+    """
+    value_type = type(value)
+    if isinstance(value_type, DirtyEqualsMeta):
+        assert value._frozen is not None, 'nested objects are frozen first'
+        return value._frozen[0]
+    elif isinstance(value, type):
+        return _type_key(value)
+    elif value_type is _AdaptiveBranches:
+        raise TypeError('adaptive comparisons cannot be frozen since they record statistics')
+    elif value_type in (list, tuple):
+        return value_type, tuple(_structural_key(v) for v in value)
+    elif value_type is dict:
+        return value_type, tuple((_structural_key(k), _structural_key(v)) for k, v in value.items())
+    elif value_type in (set, frozenset):
+        return value_type, frozenset(_structural_key(v) for v in value)
+    else:
+        return value_type, value
+
+
+def _type_key(t: type) -> tuple[str, str, int]:
+    # the type is always referenced by the frozen object, so its id can't be reused while the key is in use
+    return t.__module__, t.__qualname__, id(t)
+
+
 def _repr_ne(v: InstanceOrType) -> str:
     if isinstance(v, DirtyEqualsMeta):
         return repr(v)
     else:
-        return v._repr_ne()
+        return v._cached_repr_ne()
 
 
 class AnyThing(DirtyEquals[Any]):
@@ -222,6 +956,8 @@ class AnyThing(DirtyEquals[Any]):
     ```
     """
 
+    __slots__ = ()
+
     def equals(self, other: Any) -> bool:
         return True
 
@@ -233,6 +969,8 @@ class IsOneOf(DirtyEquals[Any]):
     Can be useful with boolean operators.
     """
 
+    __slots__ = 'expected_values', '_residual', '_literals'
+
     def __init__(self, expected_value: Any, *more_expected_values: Any):
         """
         Args:
@@ -250,7 +988,21 @@ class IsOneOf(DirtyEquals[Any]):
         ```
         """
         self.expected_values: tuple[Any, ...] = (expected_value,) + more_expected_values
+        # split expected values into literals which can be found by hash and everything else which has to be checked
+        # one by one, hashes of equal numbers match so `True == IsOneOf(1)` still holds
+        literals = []
+        self._residual: list[Any] = []
+        for e in self.expected_values:
+            if type(e) in _literal_types and e == e:
+                literals.append(e)
+            else:
+                self._residual.append(e)
+        self._literals = frozenset(literals)
         super().__init__(*self.expected_values)
 
     def equals(self, other: Any) -> bool:
-        return any(other == e for e in self.expected_values)
+        if type(other) in _literal_types:
+            return other in self._literals or any(other == e for e in self._residual)
+        else:
+            # other might define `__eq__` which doesn't agree with its `__hash__`, check every value
+            return any(other == e for e in self.expected_values)
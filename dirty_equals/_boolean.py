@@ -25,6 +25,8 @@ class IsTrueLike(DirtyEquals[bool]):
     ```
     """
 
+    __slots__ = ()
+
     def equals(self, other: Any) -> bool:
         return bool(other)
 
@@ -35,6 +37,8 @@ class IsFalseLike(DirtyEquals[bool]):
     `return not bool(other)` (with string checks if `allow_strings=True` is set).
     """
 
+    __slots__ = ('allow_strings',)
+
     def __init__(self, *, allow_strings: bool = False):
         """
         Args:
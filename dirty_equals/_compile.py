@@ -0,0 +1,328 @@
+import builtins
+import re
+from decimal import Decimal
+from itertools import count
+from typing import Any, Callable
+
+from ._base import DirtyAnd, DirtyEquals, DirtyEqualsMeta, DirtyNot, DirtyOr, _stateless
+from ._dict import IsDict
+from ._numeric import IsNumeric
+from ._sequence import IsListOrTuple
+from ._strings import IsAnyStr
+from ._utils import _literal_types
+
+__all__ = 'compile', 'Compiled'
+
+_number_types = int, float, Decimal
+# each container adds a level of indentation to the generated source, stop inlining well before python's limit
+_max_depth = 50
+_missing = object()
+
+
+def compile(expected: Any) -> 'Compiled':
+    """
+    Generate a single specialised python function to compare values against `expected`.
+
+    Args:
+        expected: The expected value, generally a nested structure of dicts, lists and *dirty-equals* types.
+
+    `compile()` walks `expected` once, then builds the source of a function which checks a value against the whole
+    tree: dicts and lists become direct length and item checks, and common types like
+    [`IsInt`][dirty_equals.IsInt], [`IsStr`][dirty_equals.IsStr], [`IsDict`][dirty_equals.IsDict] and
+    [`IsList`][dirty_equals.IsList] become inline checks, so comparisons avoid the overhead of calling
+    `__eq__` on every node. Any other type is checked with its own `equals()` method.
+
+    The result is itself a *dirty-equals* type which gives the same verdicts as comparing to `expected` directly.
+    Like [`match()`][dirty_equals.DirtyEquals.match], types within `expected` are checked without recording the
+    compared value, and values are checked first, so compiled expectations only differ from `==` if compared values
+    implement `__eq__` for arbitrary objects.
+
+    ```py title="compile"
+    import dirty_equals
+    from dirty_equals import IsInt, IsList, IsStr
+
+    user_check = dirty_equals.compile(
+        {'id': IsInt(gt=0), 'name': IsStr(min_length=1), 'tags': IsList(IsStr, length=...)}
+    )
+
+    assert {'id': 1, 'name': 'John', 'tags': ['a', 'b']} == user_check
+    assert {'id': 0, 'name': 'John', 'tags': []} != user_check
+    assert user_check.match({'id': 2, 'name': 'Jane', 'tags': ['c']})
+    ```
+
+    !!! note
+        `compile` isn't included in `dirty_equals.__all__` to avoid shadowing the builtin `compile` with
+        `from dirty_equals import *`, use `import dirty_equals` and `dirty_equals.compile(...)`.
+    """
+    return Compiled(expected)
+
+
+class Compiled(DirtyEquals[Any]):
+    """
+    A generated validator, see [`compile`][dirty_equals.compile].
+    """
+
+    __slots__ = 'expected', '_source', '_func'
+
+    # generated functions can't be pickled, they're generated again on first use after unpickling
+    _cache_slots = '_source', '_func'
+
+    def __init__(self, expected: Any):
+        """
+        Args:
+            expected: The expected value to generate a validator for.
+        """
+        self.expected = expected
+        self._build()
+        super().__init__(expected)
+
+    def _build(self) -> Callable[[Any], bool]:
+        self._source, self._func = _CodeGen().build(self.expected)
+        return self._func
+
+    @property
+    def source(self) -> str:
+        """
+        Source of the generated function.
+        """
+        try:
+            return self._source
+        except AttributeError:
+            self._build()
+            return self._source
+
+    def equals(self, other: Any) -> bool:
+        try:
+            func = self._func
+        except AttributeError:
+            func = self._build()
+        # types without an inline check are compared with `_matches()`, which can still record values on the
+        # types nested within them, e.g. in `IsDict(..., partial=True)`
+        token = _stateless.set(True)
+        try:
+            return func(other)
+        finally:
+            _stateless.reset(token)
+
+
+class _CodeGen:
+    def __init__(self) -> None:
+        self.namespace: dict[str, Any] = {'_missing': _missing}
+        self.lines: list[str] = []
+        self.counter = count(1)
+
+    def build(self, expected: Any) -> tuple[str, Callable[[Any], bool]]:
+        self.lines.append('def validate(v0):')
+        self.stmts(expected, 'v0', 1, 0)
+        self.lines.append('    return True')
+        source = '\n'.join(self.lines) + '\n'
+        exec(builtins.compile(source, '<dirty_equals.compile>', 'exec'), self.namespace)
+        return source, self.namespace['validate']
+
+    def line(self, indent: int, code: str) -> None:
+        self.lines.append('    ' * indent + code)
+
+    def const(self, value: Any) -> str:
+        # literals are embedded using their repr, except numbers like `nan` and `inf` whose repr isn't valid code
+        if type(value) in _literal_types and not isinstance(value, (float, complex)):
+            return repr(value)
+        name = f'c{next(self.counter)}'
+        self.namespace[name] = value
+        return name
+
+    def var(self) -> str:
+        return f'v{next(self.counter)}'
+
+    def stmts(self, expected: Any, ref: str, indent: int, depth: int) -> None:
+        """
+        Add statements which `return False` if the value named `ref` doesn't match `expected`.
+        """
+        if depth < _max_depth:
+            expected_type = type(expected)
+            if expected_type is dict:
+                return self.dict_stmts(expected, ref, indent, depth)
+            elif expected_type is list or expected_type is tuple:
+                return self.seq_stmts(expected, ref, indent, depth)
+            elif isinstance(expected, IsDict) and _plain_dict(expected):
+                return self.is_dict_stmts(expected, ref, indent, depth)
+            elif isinstance(expected, IsListOrTuple) and _plain_list_or_tuple(expected):
+                return self.is_list_or_tuple_stmts(expected, ref, indent, depth)
+
+        self.line(indent, f'if not {self.expr(expected, ref, root=depth == 0)}: return False')
+
+    def dict_stmts(self, expected: dict[Any, Any], ref: str, indent: int, depth: int) -> None:
+        self.line(indent, f'if type({ref}) is dict:')
+        self.line(indent + 1, f'if len({ref}) != {len(expected)}: return False')
+        self.items_stmts(expected, ref, indent + 1, depth)
+        self.line(indent, f'elif not {ref} == {self.const(expected)}: return False')
+
+    def seq_stmts(self, expected: 'list[Any] | tuple[Any, ...]', ref: str, indent: int, depth: int) -> None:
+        self.line(indent, f'if type({ref}) is {type(expected).__name__}:')
+        self.line(indent + 1, f'if len({ref}) != {len(expected)}: return False')
+        self.index_stmts(expected, ref, indent + 1, depth)
+        self.line(indent, f'elif not {ref} == {self.const(expected)}: return False')
+
+    def is_dict_stmts(self, expected: IsDict, ref: str, indent: int, depth: int) -> None:
+        expected_values = expected.expected_values
+        self.line(indent, f'if type({ref}) is dict:')
+        start = len(self.lines)
+        if not expected.partial:
+            self.line(indent + 1, f'if len({ref}) != {len(expected_values)}: return False')
+        self.items_stmts(expected_values, ref, indent + 1, depth)
+        if expected.strict:
+            keys = self.const(tuple(expected_values))
+            if expected.partial:
+                values = self.const(expected_values)
+                self.line(indent + 1, f'if tuple(k for k in {ref} if k in {values}) != {keys}: return False')
+            else:
+                self.line(indent + 1, f'if tuple({ref}) != {keys}: return False')
+        if len(self.lines) == start:
+            # e.g. `IsPartialDict()`, any dict matches
+            self.line(indent + 1, 'pass')
+        self.line(indent, f'elif not {self.const(expected)}._matches({ref}): return False')
+
+    def is_list_or_tuple_stmts(self, expected: IsListOrTuple[Any], ref: str, indent: int, depth: int) -> None:
+        allowed_type = expected.allowed_type
+        allowed = allowed_type if isinstance(allowed_type, tuple) else (allowed_type,)
+        self.line(indent, f'if type({ref}) in {self.const(allowed)}:')
+        items_count = len(expected.items)
+        length = expected.length
+        if length is None:
+            self.line(indent + 1, f'if len({ref}) != {items_count}: return False')
+        else:
+            self.line(indent + 1, f'if len({ref}) < {items_count}: return False')
+            if isinstance(length, int):
+                self.line(indent + 1, f'if len({ref}) != {length}: return False')
+            else:
+                min_length, max_length = length
+                if min_length > items_count:
+                    self.line(indent + 1, f'if len({ref}) < {min_length}: return False')
+                if isinstance(max_length, int):
+                    self.line(indent + 1, f'if len({ref}) > {max_length}: return False')
+        self.index_stmts(expected.items, ref, indent + 1, depth)
+        self.line(indent, f'elif not {self.const(expected)}._matches({ref}): return False')
+
+    def items_stmts(self, expected: dict[Any, Any], ref: str, indent: int, depth: int) -> None:
+        for key, value in expected.items():
+            var = self.var()
+            self.line(indent, f'{var} = {ref}.get({self.const(key)}, _missing)')
+            self.line(indent, f'if {var} is _missing: return False')
+            self.stmts(value, var, indent, depth + 1)
+
+    def index_stmts(self, expected: 'list[Any] | tuple[Any, ...]', ref: str, indent: int, depth: int) -> None:
+        for index, item in enumerate(expected):
+            var = self.var()
+            self.line(indent, f'{var} = {ref}[{index}]')
+            self.stmts(item, var, indent, depth + 1)
+
+    def expr(self, expected: Any, ref: str, *, root: bool = False) -> str:
+        """
+        Build a parenthesised expression which is truthy if the value named `ref` matches `expected`.
+        """
+        if isinstance(expected, DirtyEqualsMeta):
+            return self.class_expr(expected, ref)
+        elif isinstance(expected, DirtyEquals):
+            if isinstance(expected, DirtyOr) and _plain_boolean(expected, DirtyOr):
+                return '(' + ' or '.join(self.expr(d, ref) for d in expected.dirties) + ')'
+            elif isinstance(expected, DirtyAnd) and _plain_boolean(expected, DirtyAnd):
+                return '(' + ' and '.join(self.expr(d, ref) for d in expected.dirties) + ')'
+            elif isinstance(expected, DirtyNot) and type(expected).equals is DirtyNot.equals:
+                return f'(not {self.expr(expected.subject, ref)})'
+            elif isinstance(expected, IsNumeric) and _plain_numeric(expected):
+                return self.numeric_expr(expected, ref)
+            elif isinstance(expected, IsAnyStr) and _plain_str(expected):
+                return self.str_expr(expected, ref)
+            else:
+                return f'{self.const(expected)}._matches({ref})'
+        elif (type(expected) in _literal_types and expected == expected) or root:
+            return f'({ref} == {self.const(expected)})'
+        else:
+            # like dict and list comparisons, identical objects are always considered equal
+            c = self.const(expected)
+            return f'({ref} is {c} or {ref} == {c})'
+
+    def class_expr(self, expected: DirtyEqualsMeta, ref: str) -> str:
+        # equivalent to `DirtyEqualsMeta.__eq__`, but the instance is only created once
+        if expected is DirtyEquals:
+            return f'({ref} is {self.const(expected)})'
+        try:
+            instance = expected()
+        except TypeError:
+            return f'({ref} is {self.const(expected)})'
+        else:
+            return f'({ref} is {self.const(expected)} or {self.expr(instance, ref)})'
+
+    def numeric_expr(self, expected: IsNumeric[Any], ref: str) -> str:
+        parts = [
+            f'isinstance({ref}, {self.const(expected.allowed_types)})',
+            f'{ref} is not True',
+            f'{ref} is not False',
+        ]
+        if expected.exactly is not None:
+            parts.append(f'{self.const(expected.exactly)} == {ref}')
+        else:
+            for op, bound in ('>', expected.gt), ('<', expected.lt), ('>=', expected.ge), ('<=', expected.le):
+                if bound is not None:
+                    parts.append(f'{ref} {op} {self.const(bound)}')
+        return '(' + ' and '.join(parts) + ')'
+
+    def str_expr(self, expected: IsAnyStr[Any], ref: str) -> str:
+        parts = [f'type({ref}) is {expected.expected_types[0].__name__}']
+        if expected.regex is not None:
+            pattern = _compile_regex(expected)
+            parts.append(f'{self.const(pattern)}.fullmatch({ref}) is not None')
+        if expected.min_length is not None:
+            parts.append(f'len({ref}) >= {expected.min_length}')
+        if expected.max_length is not None:
+            parts.append(f'len({ref}) <= {expected.max_length}')
+        if expected.case == 'upper':
+            parts.append(f'{ref}.isupper()')
+        elif expected.case == 'lower':
+            parts.append(f'{ref}.islower()')
+        return '(' + ' and '.join(parts) + ')'
+
+
+def _plain_boolean(expected: 'DirtyOr | DirtyAnd', cls: type[DirtyEquals[Any]]) -> bool:
+    # adaptive `|` and `&` are left to `equals()` so they keep adapting
+    return type(expected).equals is cls.equals and expected._branches is None
+
+
+def _plain_dict(expected: IsDict) -> bool:
+    return type(expected).equals is IsDict.equals and not expected.ignore
+
+
+def _plain_list_or_tuple(expected: IsListOrTuple[Any]) -> bool:
+    return type(expected).equals is IsListOrTuple.equals and expected.check_order and expected.positions is None
+
+
+def _plain_numeric(expected: IsNumeric[Any]) -> bool:
+    cls = type(expected)
+    if not (
+        cls.equals is IsNumeric.equals
+        and cls.prepare is IsNumeric.prepare
+        and cls.bounds_checks is IsNumeric.bounds_checks
+        and expected.approx is None
+    ):
+        return False
+    # comparisons between other types (e.g. dates and numbers) can raise a TypeError, which must be caught
+    allowed = expected.allowed_types if isinstance(expected.allowed_types, tuple) else (expected.allowed_types,)
+    bounds = expected.exactly, expected.gt, expected.lt, expected.ge, expected.le
+    return all(t in _number_types for t in allowed) and all(b is None or type(b) in _number_types for b in bounds)
+
+
+def _plain_str(expected: IsAnyStr[Any]) -> bool:
+    if type(expected).equals is not IsAnyStr.equals or len(expected.expected_types) != 1:
+        return False
+    elif expected.regex is None:
+        return True
+    else:
+        # a regex of the wrong type raises a TypeError, leave that to `equals()`
+        pattern = expected.regex.pattern if isinstance(expected.regex, re.Pattern) else expected.regex
+        return type(pattern) is expected.expected_types[0]
+
+
+def _compile_regex(expected: IsAnyStr[Any]) -> 're.Pattern[Any]':
+    if isinstance(expected.regex, re.Pattern):
+        return expected.regex
+    else:
+        return re.compile(expected.regex, expected.regex_flags)
@@ -2,10 +2,9 @@ from __future__ import annotations as _annotations
 
 from datetime import date, datetime, timedelta, timezone, tzinfo
 from typing import Any
-from zoneinfo import ZoneInfo
 
 from ._numeric import IsNumeric
-from ._utils import Omit
+from ._utils import Omit, Reject
 
 
 class IsDatetime(IsNumeric[datetime]):
@@ -13,6 +12,10 @@ class IsDatetime(IsNumeric[datetime]):
     Check if the value is a datetime, and matches the given conditions.
     """
 
+    __slots__ = 'unix_number', 'iso_string', 'format_string', 'enforce_tz'
+
+    cost_hint = 3.0
+
     allowed_types = datetime
 
     def __init__(
@@ -80,40 +83,52 @@ class IsDatetime(IsNumeric[datetime]):
             unix_number=Omit if unix_number is False else unix_number,
             iso_string=Omit if iso_string is False else iso_string,
             format_string=Omit if format_string is None else format_string,
-            enforce_tz=Omit if enforce_tz is True else format_string,
+            enforce_tz=Omit if enforce_tz is True else enforce_tz,
         )
 
     def prepare(self, other: Any) -> datetime:
         if isinstance(other, datetime):
             dt = other
         elif isinstance(other, (float, int)):
-            if self.unix_number:
-                dt = datetime.fromtimestamp(other)
-            else:
-                raise TypeError('numbers not allowed')
+            if not self.unix_number:
+                return Reject
+            dt = datetime.fromtimestamp(other)
         elif isinstance(other, str):
-            if self.iso_string:
-                dt = datetime.fromisoformat(other)
-            elif self.format_string:
-                dt = datetime.strptime(other, self.format_string)
-            else:
-                raise ValueError('not a valid datetime string')
+            try:
+                if self.iso_string:
+                    dt = datetime.fromisoformat(other)
+                elif self.format_string:
+                    dt = datetime.strptime(other, self.format_string)
+                else:
+                    return Reject
+            except ValueError:
+                return Reject
         else:
-            raise ValueError(f'{type(other)} not valid as datetime')
+            return Reject
 
         if self.approx is not None and not self.enforce_tz and self.approx.tzinfo is None and dt.tzinfo is not None:
             dt = dt.replace(tzinfo=None)
         return dt
 
+    def _prepared_types(self) -> tuple[type, ...]:
+        # without `approx`, datetimes are never changed by `prepare()`
+        if type(self).prepare is IsDatetime.prepare and self.approx is None:
+            return (datetime,)
+        else:
+            return ()
+
     def approx_equals(self, other: datetime, delta: timedelta) -> bool:
-        if not super().approx_equals(other, delta):
+        return self._approx_equals(self.approx, other, delta)  # type: ignore[arg-type]
+
+    def _approx_equals(self, approx: datetime, other: datetime, delta: timedelta) -> bool:
+        if not abs(approx - other) <= delta:
             return False
 
         if self.enforce_tz:
-            if self.approx.tzinfo is None:  # type: ignore[union-attr]
+            if approx.tzinfo is None:
                 return other.tzinfo is None
             else:
-                approx_offset = self.approx.tzinfo.utcoffset(self.approx)  # type: ignore[union-attr]
+                approx_offset = approx.tzinfo.utcoffset(approx)
                 other_offset = other.tzinfo.utcoffset(other)  # type: ignore[union-attr]
                 return approx_offset == other_offset
         else:
@@ -126,6 +141,8 @@ class IsNow(IsDatetime):
     but slightly more powerful.
     """
 
+    __slots__ = ('tz',)
+
     def __init__(
         self,
         *,
@@ -164,6 +181,9 @@ class IsNow(IsDatetime):
         ```
         """
         if isinstance(tz, str):
+            # imported here since it's only needed for named timezones
+            from zoneinfo import ZoneInfo
+
             tz = ZoneInfo(tz)
 
         self.tz = tz
@@ -181,6 +201,16 @@ class IsNow(IsDatetime):
         if tz is not None:
             self._repr_kwargs['tz'] = tz
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        args, kwargs = super()._spec_args()
+        # `approx` is the time the object was created, it's not an argument
+        del kwargs['approx']
+        # `ZoneInfo` is created from its key
+        key = getattr(self.tz, 'key', None)
+        if key is not None:
+            kwargs['tz'] = key
+        return args, kwargs
+
     def _get_now(self) -> datetime:
         if self.tz is None:
             return datetime.now()
@@ -188,12 +218,10 @@ class IsNow(IsDatetime):
             utc_now = datetime.now(tz=timezone.utc).replace(tzinfo=timezone.utc)
             return utc_now.astimezone(self.tz)
 
-    def prepare(self, other: Any) -> datetime:
-        # update approx for every comparing, to check if other value is dirty equal
-        # to current moment of time
-        self.approx = self._get_now()
-
-        return super().prepare(other)
+    def approx_equals(self, other: datetime, delta: timedelta) -> bool:
+        # compare to the current moment of time on every comparison, without storing it on the instance
+        # so `IsNow` can be shared between threads
+        return self._approx_equals(self._get_now(), other, delta)
 
 
 class IsDate(IsNumeric[date]):
@@ -201,6 +229,10 @@ class IsDate(IsNumeric[date]):
     Check if the value is a date, and matches the given conditions.
     """
 
+    __slots__ = 'iso_string', 'format_string'
+
+    cost_hint = 3.0
+
     allowed_types = date
 
     def __init__(
@@ -261,23 +293,31 @@ class IsDate(IsNumeric[date]):
         if type(other) is date:
             dt = other
         elif isinstance(other, str):
-            if self.iso_string:
-                dt = date.fromisoformat(other)
-            elif self.format_string:
-                dt = datetime.strptime(other, self.format_string).date()
-            else:
-                raise ValueError('not a valid date string')
+            try:
+                if self.iso_string:
+                    dt = date.fromisoformat(other)
+                elif self.format_string:
+                    dt = datetime.strptime(other, self.format_string).date()
+                else:
+                    return Reject
+            except ValueError:
+                return Reject
         else:
-            raise ValueError(f'{type(other)} not valid as date')
+            return Reject
 
         return dt
 
+    def _prepared_types(self) -> tuple[type, ...]:
+        return (date,) if type(self).prepare is IsDate.prepare else ()
+
 
 class IsToday(IsDate):
     """
     Check if a date is today, this is similar to `IsDate(approx=date.today())`, but slightly more powerful.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -304,3 +344,13 @@ class IsToday(IsDate):
         """
 
         super().__init__(approx=date.today(), iso_string=iso_string, format_string=format_string)
+
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        args, kwargs = super()._spec_args()
+        # `approx` is the date the object was created and `delta` is always zero, neither are arguments
+        del kwargs['approx'], kwargs['delta']
+        return args, kwargs
+
+    def approx_equals(self, other: date, delta: timedelta) -> bool:
+        # like `IsNow`, use the current date on every comparison so an instance is still correct after midnight
+        return abs(date.today() - other) <= delta
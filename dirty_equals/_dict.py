@@ -17,6 +17,10 @@ class IsDict(DirtyEquals[dict[Any, Any]]):
     with `.settings(...)` to powerful things.
     """
 
+    __slots__ = 'expected_values', 'strict', 'partial', 'ignore'
+
+    cost_hint = 3.0
+
     @overload
     def __init__(self, expected: dict[Any, Any]): ...
 
@@ -86,8 +90,8 @@ class IsDict(DirtyEquals[dict[Any, Any]]):
         1. This is the same as [`IsPartialDict(a=1, b=2)`][dirty_equals.IsPartialDict]
         2. This is the same as [`IsStrictDict(a=1, b=2)`][dirty_equals.IsStrictDict]
         """
-        new_cls = self.__class__(self.expected_values)
-        new_cls.__dict__ = self.__dict__.copy()
+        # the modified copy is never frozen, even if this object is
+        new_cls = self._clone()
         if strict is not None:
             new_cls.strict = strict
         if partial is not None:
@@ -100,6 +104,20 @@ class IsDict(DirtyEquals[dict[Any, Any]]):
 
         return new_cls
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        if all(isinstance(k, str) and not k.startswith('$') for k in self.expected_values):
+            return (), dict(self.expected_values)
+        else:
+            return (self.expected_values,), {}
+
+    def _spec_settings(self) -> dict[str, Any]:
+        default = type(self)()
+        return {
+            name: getattr(self, name)
+            for name in ('strict', 'partial', 'ignore')
+            if getattr(self, name) != getattr(default, name)
+        }
+
     def equals(self, other: dict[Any, Any]) -> bool:
         if not isinstance(other, dict):
             return False
@@ -175,6 +193,8 @@ class IsPartialDict(IsDict):
     ```
     """
 
+    __slots__ = ()
+
     def _post_init(self) -> None:
         self.partial = True
 
@@ -208,6 +228,8 @@ class IsIgnoreDict(IsDict):
     ```
     """
 
+    __slots__ = ()
+
     def _post_init(self) -> None:
         self.ignore = {None}
 
@@ -230,5 +252,7 @@ class IsStrictDict(IsDict):
     ```
     """
 
+    __slots__ = ()
+
     def _post_init(self) -> None:
         self.strict = True
@@ -0,0 +1,187 @@
+from typing import Any, Optional
+
+from ._base import DirtyEquals, DirtyEqualsMeta, _stateless
+from ._dict import IsDict
+from ._sequence import IsListOrTuple, _position_slice
+from ._utils import bounded_repr
+
+__all__ = 'explain', 'Mismatch'
+
+_missing = object()
+# limits for the repr of the actual value
+_max_chars = 80
+_max_nodes = 10
+# longest repr of `expected`, reprs of *dirty-equals* types can't be bounded as they're built, so they're truncated
+_max_expected_repr = 200
+
+
+def explain(expected: Any, actual: Any) -> Optional['Mismatch']:
+    """
+    Find the first place where `actual` doesn't match `expected`.
+
+    Args:
+        expected: The expected value, generally a nested structure of dicts, lists and *dirty-equals* types.
+        actual: The value to check.
+
+    Returns:
+        `None` if `actual == expected`, otherwise a [`Mismatch`][dirty_equals._explain.Mismatch] describing the first
+        difference found.
+
+    Dicts and lists, along with [`IsDict`][dirty_equals.IsDict] and ordered
+    [`IsList`][dirty_equals.IsList]/[`IsTuple`][dirty_equals.IsTuple] are walked item by item, stopping at the first
+    difference, other values and *dirty-equals* types are compared without recording anything on them.
+    Only the mismatched values are formatted, with a limited size, so this is much faster than the diff
+    generated by pytest when `actual` is very large.
+
+    ```py title="explain"
+    import dirty_equals
+    from dirty_equals import IsPositiveFloat, IsStr
+
+    actual = {'items': [{'name': f'item {i}', 'price': 10.0} for i in range(5_000)]}
+    actual['items'][4031]['price'] = -1.0
+    expected = {'items': [{'name': IsStr, 'price': IsPositiveFloat}] * 5_000}
+
+    mismatch = dirty_equals.explain(expected, actual)
+    print(mismatch)
+    #> ['items'][4031]['price']: expected IsPositiveFloat, got -1.0
+    assert mismatch.path == ('items', 4031, 'price')
+
+    assert dirty_equals.explain([1, 2], [1, 2]) is None
+    ```
+    """
+    # like `match()`, nested types compared with `==` don't record anything
+    token = _stateless.set(True)
+    try:
+        return _walk(expected, actual, ())
+    finally:
+        _stateless.reset(token)
+
+
+class Mismatch:
+    """
+    The first difference found by [`explain`][dirty_equals.explain].
+    """
+
+    __slots__ = 'path', 'expected', 'actual'
+
+    def __init__(self, path: tuple[Any, ...], expected: str, actual: str):
+        self.path = path
+        """Keys and indexes leading to the mismatch from the root of `actual`."""
+        self.expected = expected
+        """Representation of the expected value, `'<missing>'` if `actual` has an unexpected key or item."""
+        self.actual = actual
+        """Size limited representation of the actual value, `'<missing>'` if a key or item is missing."""
+
+    @property
+    def path_str(self) -> str:
+        """
+        The path in python syntax, e.g. `['items'][4031]['price']`.
+        """
+        return ''.join(f'[{k!r}]' for k in self.path)
+
+    def __str__(self) -> str:
+        return f'{self.path_str or "value"}: expected {self.expected}, got {self.actual}'
+
+    def __repr__(self) -> str:
+        return f'Mismatch(path={self.path!r}, expected={self.expected!r}, actual={self.actual!r})'
+
+
+def _walk(expected: Any, actual: Any, path: tuple[Any, ...]) -> Optional[Mismatch]:
+    expected_type = type(expected)
+    if expected_type is dict:
+        if isinstance(actual, dict):
+            return _walk_dict(expected, actual, path, partial=False)
+    elif expected_type is list or expected_type is tuple:
+        if isinstance(actual, expected_type):
+            return _walk_seq(expected, actual, path)
+    elif isinstance(expected_type, DirtyEqualsMeta):
+        # checking the metaclass avoids the much slower `ABCMeta.__instancecheck__`
+        return _walk_dirty(expected, actual, path)
+    # like dicts and lists, items within containers are equal if they're identical, e.g. `[nan] == [nan]`
+    elif (path and actual is expected) or actual == expected:
+        return None
+
+    return Mismatch(path, _expected_repr(expected), _repr(actual))
+
+
+def _walk_dict(
+    expected: dict[Any, Any], actual: dict[Any, Any], path: tuple[Any, ...], partial: bool
+) -> Optional[Mismatch]:
+    for key, expected_value in expected.items():
+        actual_value = actual.get(key, _missing)
+        if actual_value is _missing:
+            return Mismatch((*path, key), _expected_repr(expected_value), '<missing>')
+        mismatch = _walk(expected_value, actual_value, (*path, key))
+        if mismatch is not None:
+            return mismatch
+
+    if not partial and len(actual) != len(expected):
+        extra = next(k for k in actual if k not in expected)
+        return Mismatch((*path, extra), '<missing>', _repr(actual[extra]))
+    return None
+
+
+def _walk_seq(expected: Any, actual: Any, path: tuple[Any, ...], prefix: bool = False) -> Optional[Mismatch]:
+    for index, (expected_value, actual_value) in enumerate(zip(expected, actual)):
+        mismatch = _walk(expected_value, actual_value, (*path, index))
+        if mismatch is not None:
+            return mismatch
+
+    if len(expected) > len(actual):
+        return Mismatch((*path, len(actual)), _expected_repr(expected[len(actual)]), '<missing>')
+    elif len(expected) < len(actual) and not prefix:
+        return Mismatch((*path, len(expected)), '<missing>', _repr(actual[len(expected)]))
+    return None
+
+
+def _walk_dirty(expected: DirtyEquals[Any], actual: Any, path: tuple[Any, ...]) -> Optional[Mismatch]:
+    # find a more specific mismatch within types whose `equals` is the same as comparing items in order,
+    # `checked` is set if the walk covered everything `equals` checks
+    mismatch = None
+    checked = False
+    if isinstance(expected, IsDict) and type(expected).equals is IsDict.equals:
+        if isinstance(actual, dict) and not expected.ignore:
+            mismatch = _walk_dict(expected.expected_values, actual, path, partial=expected.partial)
+            checked = not expected.strict
+    elif isinstance(expected, IsListOrTuple) and type(expected).equals is IsListOrTuple.equals:
+        if isinstance(actual, expected.allowed_type) and expected.check_order and expected.positions is None:
+            mismatch = _walk_seq(expected.items, actual, path, prefix=expected.length is not None)
+            checked = expected.length is None
+        elif isinstance(actual, expected.allowed_type) and expected.check_order:
+            index = expected._first_mismatch(actual)
+            if index is not None and 0 <= index < len(actual):
+                expected_value = _position_expected(expected.positions, index, len(actual))
+                if expected_value is not _missing:
+                    mismatch = _walk(expected_value, actual[index], (*path, index))
+
+    if mismatch is None and not checked and not expected._matches(actual):
+        # e.g. a length or key order which doesn't match, or an unsupported type
+        mismatch = Mismatch(path, _expected_repr(expected), _repr(actual))
+    return mismatch
+
+
+def _position_expected(positions: Any, index: int, length: int) -> Any:
+    """
+    The value expected at `index` by `positions`, or `_missing` if it's compared as part of a slice.
+    """
+    for position, expected in positions.items():
+        position_slice = _position_slice(position)
+        if position_slice is not None:
+            indexes = range(*position_slice.indices(length))
+            if isinstance(expected, (list, tuple)) and index in indexes and indexes.index(index) < len(expected):
+                return expected[indexes.index(index)]
+        elif (position + length if position < 0 else position) == index:
+            return expected
+    return _missing
+
+
+def _expected_repr(expected: Any) -> str:
+    if isinstance(type(expected), DirtyEqualsMeta):
+        r = expected._cached_repr_ne()
+        return r if len(r) <= _max_expected_repr else f'{r[: _max_expected_repr - 3]}...'
+    else:
+        return _repr(expected)
+
+
+def _repr(value: Any) -> str:
+    return bounded_repr(value, _max_chars, _max_nodes)[0]
@@ -12,6 +12,8 @@ class IsInstance(DirtyEquals[ExpectedType]):
     A type which checks that the value is an instance of the expected type.
     """
 
+    __slots__ = 'expected_type', 'only_direct_instance'
+
     def __init__(self, expected_type: ExpectedType, *, only_direct_instance: bool = False):
         """
         Args:
@@ -47,6 +49,9 @@ class IsInstance(DirtyEquals[ExpectedType]):
         self.only_direct_instance = only_direct_instance
         super().__init__(expected_type)
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return (self.expected_type,), {'only_direct_instance': True} if self.only_direct_instance else {}
+
     def __class_getitem__(cls, expected_type: ExpectedType) -> 'IsInstance[ExpectedType]':
         return cls(expected_type)
 
@@ -65,6 +70,8 @@ class HasName(DirtyEquals[T]):
     A type which checks that the value has the given `__name__` attribute.
     """
 
+    __slots__ = 'expected_name', 'allow_instances'
+
     def __init__(self, expected_name: Union[IsStr, str], *, allow_instances: bool = True):
         """
         Args:
@@ -119,6 +126,10 @@ class HasRepr(DirtyEquals[T]):
     A type which checks that the value has the given `repr()` value.
     """
 
+    __slots__ = ('expected_repr',)
+
+    cost_hint = 3.0
+
     def __init__(self, expected_repr: Union[IsStr, str]):
         """
         Args:
@@ -156,6 +167,10 @@ class HasAttributes(DirtyEquals[Any]):
     This is a partial check - e.g. the attributes provided to check do not need to be exhaustive.
     """
 
+    __slots__ = ('expected_attrs',)
+
+    cost_hint = 2.0
+
     @overload
     def __init__(self, expected: dict[Any, Any]): ...
 
@@ -0,0 +1,248 @@
+import atexit
+import json
+import os
+import sys
+from threading import Lock
+from time import perf_counter
+from typing import Any, Literal, Optional
+from weakref import ref
+
+from ._base import DirtyEquals, _original_matches
+
+__all__ = 'instrument', 'Instrumentation', 'MatcherStats'
+
+SortBy = Literal['total_time', 'max_time', 'calls', 'passed', 'failed', 'errors']
+
+# every comparison, whether it's from `==`, `!=`, `match()`, `match_many()` or comparing to a class, goes through
+# `_matches`
+# replaced rather than modified, so `_instrumented_matches` can iterate over it without a lock
+_active: tuple['Instrumentation', ...] = ()
+_active_lock = Lock()
+
+
+def instrument() -> 'Instrumentation':
+    """
+    Record how often *dirty-equals* types are compared, how long comparisons take and how often they pass.
+
+    Use the result as a context manager, while it's active, every comparison made by any *dirty-equals* type
+    is recorded, both per class and per instance. Times are inclusive, so the time recorded for
+    [`IsDict`][dirty_equals.IsDict] includes the time taken by the types nested within it.
+
+    When no instrumentation is active, comparisons are not wrapped at all, so there's no overhead. While it's
+    active, [`match_many()`][dirty_equals.DirtyEquals.match_many] compares values one at a time so each of them
+    is recorded, rather than using the faster versions some types have.
+
+    Instrumentation can also be enabled for a whole process by setting the `DIRTY_EQUALS_INSTRUMENT` environment
+    variable, either to `1` to print a report to stderr when the process exits, or to a path ending in `.json`
+    to write the JSON export there.
+
+    ```py title="instrument"
+    import dirty_equals
+    from dirty_equals import IsInt, IsStr
+
+    with dirty_equals.instrument() as stats:
+        for i in range(10):
+            assert {'id': i, 'name': 'x'} == {'id': IsInt, 'name': IsStr(min_length=1)}
+        assert 'x' != IsInt
+
+    assert stats.classes['IsInt'].calls == 11
+    assert stats.classes['IsInt'].failed == 1
+    ```
+
+    `stats.top(2)` gives a report like this:
+
+    ```text
+    class   calls  passed  failed  errors   total ms     max ms    mean µs
+    IsInt      11      10       1       0      0.013      0.005      1.225
+    IsStr      10      10       0       0      0.008      0.003      0.807
+    ```
+    """
+    return Instrumentation()
+
+
+class MatcherStats:
+    """
+    Statistics for comparisons made by one *dirty-equals* class or instance.
+    """
+
+    __slots__ = 'calls', 'passed', 'failed', 'errors', 'total_time', 'max_time'
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.passed = 0
+        self.failed = 0
+        # `TypeError` and `ValueError` raised by `equals()`, these count as failures too
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, passed: bool, error: bool, elapsed: float) -> None:
+        self.calls += 1
+        if passed:
+            self.passed += 1
+        else:
+            self.failed += 1
+        if error:
+            self.errors += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        d = {name: getattr(self, name) for name in self.__slots__}
+        d['mean_time'] = self.mean_time
+        return d
+
+    def __repr__(self) -> str:
+        return f'MatcherStats(calls={self.calls}, passed={self.passed}, failed={self.failed}, errors={self.errors})'
+
+
+class Instrumentation:
+    """
+    Statistics recorded by [`instrument`][dirty_equals.instrument].
+    """
+
+    def __init__(self) -> None:
+        self.classes: dict[str, MatcherStats] = {}
+        # keyed by id, with a weak reference so recording doesn't keep instances (or the values they last matched)
+        # alive, along with the class name and repr taken when the instance was first recorded
+        self._instances: dict[int, tuple[ref[DirtyEquals[Any]], str, str, MatcherStats]] = {}
+        # class name, repr and statistics of collected instances whose id has since been reused
+        self._collected: list[tuple[str, str, MatcherStats]] = []
+        self._lock = Lock()
+
+    def __enter__(self) -> 'Instrumentation':
+        global _active
+        with _active_lock:
+            if not _active:
+                setattr(DirtyEquals, '_matches', _instrumented_matches)
+            _active += (self,)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        global _active
+        with _active_lock:
+            _active = tuple(i for i in _active if i is not self)
+            if not _active:
+                setattr(DirtyEquals, '_matches', _original_matches)
+
+    def record(self, instance: DirtyEquals[Any], passed: bool, error: bool, elapsed: float) -> None:
+        with self._lock:
+            name = instance.__class__.__qualname__
+            class_stats = self.classes.get(name)
+            if class_stats is None:
+                class_stats = self.classes[name] = MatcherStats()
+            class_stats.record(passed, error, elapsed)
+
+            instance_stats = self._instances.get(id(instance))
+            if instance_stats is None or instance_stats[0]() is not instance:
+                if instance_stats is not None:
+                    # the recorded instance has been collected and its id reused
+                    self._collected.append(instance_stats[1:])
+                instance_stats = self._instances[id(instance)] = (
+                    ref(instance),
+                    name,
+                    _short_repr(instance),
+                    MatcherStats(),
+                )
+            instance_stats[3].record(passed, error, elapsed)
+
+    @property
+    def instances(self) -> list[tuple[DirtyEquals[Any], MatcherStats]]:
+        """
+        Instances which have been compared, with their statistics. Instances aren't kept alive by recording them,
+        so only those which still exist are included, `top()` and `as_dict()` include every instance by its repr.
+        """
+        with self._lock:
+            entries = list(self._instances.values())
+        return [(instance, stats) for instance_ref, _, _, stats in entries if (instance := instance_ref()) is not None]
+
+    def _instance_stats(self) -> list[tuple[str, str, MatcherStats]]:
+        """
+        Class name, repr and statistics of every instance recorded, including those which have been collected.
+        """
+        with self._lock:
+            return [*self._collected, *(entry[1:] for entry in self._instances.values())]
+
+    def top(self, n: int = 10, *, by: SortBy = 'total_time', instances: bool = False) -> str:
+        """
+        Build a table of the `n` classes (or instances if `instances` is `True`) with the highest value of `by`.
+
+        Args:
+            n: Number of rows to include.
+            by: Statistic to sort by.
+            instances: Whether to include instances rather than classes.
+        """
+        if instances:
+            rows = [(instance_repr, stats) for _, instance_repr, stats in self._instance_stats()]
+        else:
+            rows = list(self.classes.items())
+        rows.sort(key=lambda row: getattr(row[1], by), reverse=True)
+
+        label = 'instance' if instances else 'class'
+        width = max([len(label), *(len(name) for name, _ in rows[:n])])
+        lines = [
+            f'{label:<{width}} {"calls":>7} {"passed":>7} {"failed":>7} {"errors":>7} '
+            f'{"total ms":>10} {"max ms":>10} {"mean µs":>10}'
+        ]
+        for name, s in rows[:n]:
+            lines.append(
+                f'{name:<{width}} {s.calls:>7} {s.passed:>7} {s.failed:>7} {s.errors:>7} '
+                f'{s.total_time * 1e3:>10.3f} {s.max_time * 1e3:>10.3f} {s.mean_time * 1e6:>10.3f}'
+            )
+        return '\n'.join(lines)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'classes': {name: stats.as_dict() for name, stats in self.classes.items()},
+            'instances': [
+                {'class': name, 'repr': instance_repr, **stats.as_dict()}
+                for name, instance_repr, stats in self._instance_stats()
+            ],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(), indent=indent)
+
+
+def _instrumented_matches(self: DirtyEquals[Any], other: Any) -> bool:
+    error = False
+    start = perf_counter()
+    try:
+        passed = self.equals(other)
+    except (TypeError, ValueError):
+        passed = False
+        error = True
+    elapsed = perf_counter() - start
+    for instrumentation in _active:
+        instrumentation.record(self, passed, error, elapsed)
+    return passed
+
+
+def _short_repr(instance: DirtyEquals[Any], max_length: int = 60) -> str:
+    r = instance._cached_repr_ne()
+    return r if len(r) <= max_length else f'{r[: max_length - 3]}...'
+
+
+def _instrument_from_env() -> None:
+    target = os.environ.get('DIRTY_EQUALS_INSTRUMENT')
+    if not target or target == '0':
+        return
+
+    instrumentation = Instrumentation().__enter__()
+
+    def report() -> None:
+        if target.endswith('.json'):
+            with open(target, 'w') as f:
+                f.write(instrumentation.to_json())
+        else:
+            print(f'dirty-equals comparisons:\n{instrumentation.top(20)}', file=sys.stderr)
+
+    atexit.register(report)
+
+
+_instrument_from_env()
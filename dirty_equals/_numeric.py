@@ -1,4 +1,7 @@
 import math
+import operator
+import sys
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any, Optional, TypeVar, Union
@@ -7,6 +10,7 @@ from ._base import DirtyEquals
 
 __all__ = (
     'IsApprox',
+    'IsArrayOf',
     'IsNumeric',
     'IsNumber',
     'IsPositive',
@@ -21,7 +25,7 @@ __all__ = (
     'IsNegativeFloat',
 )
 
-from ._utils import Omit
+from ._utils import Omit, Reject
 
 AnyNumber = Union[int, float, Decimal]
 N = TypeVar('N', int, float, Decimal, date, datetime, AnyNumber)
@@ -35,6 +39,8 @@ class IsNumeric(DirtyEquals[N]):
     This class can be used directly or via any of its subclasses.
     """
 
+    __slots__ = 'exactly', 'approx', 'delta', 'gt', 'lt', 'ge', 'le', 'has_bounds_checks'
+
     allowed_types: Union[type[N], tuple[type, ...]] = (int, float, Decimal, date, datetime)
     """It allows any of the types supported in its subclasses."""
 
@@ -104,15 +110,19 @@ class IsNumeric(DirtyEquals[N]):
         super().__init__(**kwargs)
 
     def prepare(self, other: Any) -> N:
-        if other is True or other is False:
-            raise TypeError('booleans are not numbers')
-        elif not isinstance(other, self.allowed_types):
-            raise TypeError(f'not a {self.allowed_types}')
+        """
+        Convert `other` to the type compared by this object, or return `Reject` if it can't be equal.
+        """
+        if other is True or other is False or not isinstance(other, self.allowed_types):
+            # booleans are not numbers
+            return Reject
         else:
             return other
 
     def equals(self, other: Any) -> bool:
         other = self.prepare(other)
+        if other is Reject:
+            return False
 
         if self.has_bounds_checks:
             return self.bounds_checks(other)
@@ -145,6 +155,60 @@ class IsNumeric(DirtyEquals[N]):
     def approx_equals(self, other: Any, delta: Any) -> bool:
         return abs(self.approx - other) <= delta
 
+    def _prepared_types(self) -> tuple[type, ...]:
+        """
+        Types which `prepare()` returns unchanged, `match_many()` skips `prepare()` for values of exactly these types.
+        """
+        if type(self).prepare is not IsNumeric.prepare:
+            return ()
+        elif isinstance(self.allowed_types, tuple):
+            return self.allowed_types
+        else:
+            return (self.allowed_types,)
+
+    def _matches_many(self, values: Iterable[Any]) -> Iterable[Any]:
+        cls = type(self)
+        fast_types = frozenset(self._prepared_types())
+        if (
+            not fast_types
+            or self.exactly is not None
+            or self.approx is not None
+            or cls.equals is not IsNumeric.equals
+            or cls.bounds_checks is not IsNumeric.bounds_checks
+        ):
+            return super()._matches_many(values)
+
+        # the bounds are found once, rather than checking each of them for every value
+        bounds = [
+            (op, bound)
+            for op, bound in (
+                (operator.gt, self.gt),
+                (operator.lt, self.lt),
+                (operator.ge, self.ge),
+                (operator.le, self.le),
+            )
+            if bound is not None
+        ]
+        return self._bounds_verdicts(values, fast_types, bounds)
+
+    def _bounds_verdicts(
+        self, values: Iterable[Any], fast_types: frozenset[type], bounds: list[tuple[Any, Any]]
+    ) -> Iterator[bool]:
+        matches = self._matches
+        for other in values:
+            if type(other) in fast_types:
+                try:
+                    for op, bound in bounds:
+                        if not op(other, bound):
+                            yield False
+                            break
+                    else:
+                        yield True
+                except (TypeError, ValueError):
+                    yield False
+            else:
+                yield matches(other)
+
 
 class IsNumber(IsNumeric[AnyNumber]):
     """
@@ -153,6 +217,8 @@ class IsNumber(IsNumeric[AnyNumber]):
     Inherits from [`IsNumeric`][dirty_equals.IsNumeric] and can therefore be initialised with any of its arguments.
     """
 
+    __slots__ = ()
+
     allowed_types = int, float, Decimal
     """
     It allows any of the number types.
@@ -167,6 +233,8 @@ class IsApprox(IsNumber):
     Simplified subclass of [`IsNumber`][dirty_equals.IsNumber] that only allows approximate comparisons.
     """
 
+    __slots__ = ()
+
     def __init__(self, approx: Num, *, delta: Optional[Num] = None):
         """
         Args:
@@ -203,6 +271,8 @@ class IsPositive(IsNumber):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(gt=0)
         self._repr_kwargs = {}
@@ -226,6 +296,8 @@ class IsNegative(IsNumber):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(lt=0)
         self._repr_kwargs = {}
@@ -250,6 +322,8 @@ class IsNonNegative(IsNumber):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(ge=0)
         self._repr_kwargs = {}
@@ -275,6 +349,8 @@ class IsNonPositive(IsNumber):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(le=0)
         self._repr_kwargs = {}
@@ -299,6 +375,8 @@ class IsInt(IsNumeric[int]):
     ```
     """
 
+    __slots__ = ()
+
     allowed_types = int
     """
     As the name suggests, only integers are allowed, booleans (`True` are `False`) are explicitly excluded although
@@ -323,6 +401,8 @@ class IsPositiveInt(IsInt):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(gt=0)
         self._repr_kwargs = {}
@@ -345,6 +425,8 @@ class IsNegativeInt(IsInt):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(lt=0)
         self._repr_kwargs = {}
@@ -366,6 +448,8 @@ class IsFloat(IsNumeric[float]):
     ```
     """
 
+    __slots__ = ()
+
     allowed_types = float
     """
     As the name suggests, only floats are allowed.
@@ -389,6 +473,8 @@ class IsPositiveFloat(IsFloat):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(gt=0)
         self._repr_kwargs = {}
@@ -411,6 +497,8 @@ class IsNegativeFloat(IsFloat):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(lt=0)
         self._repr_kwargs = {}
@@ -431,9 +519,11 @@ class IsFloatInf(IsFloat):
     ```
     """
 
+    __slots__ = ()
+
     def equals(self, other: Any) -> bool:
         other = self.prepare(other)
-        return math.isinf(other)
+        return other is not Reject and math.isinf(other)
 
 
 class IsFloatInfPos(IsFloatInf):
@@ -452,12 +542,15 @@ class IsFloatInfPos(IsFloatInf):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(gt=0)
         self._repr_kwargs = {}
 
     def equals(self, other: Any) -> bool:
-        return self.bounds_checks(other) and super().equals(other)
+        # check the type first, `bounds_checks()` expects a float
+        return super().equals(other) and self.bounds_checks(other)
 
 
 class IsFloatInfNeg(IsFloatInf):
@@ -476,12 +569,15 @@ class IsFloatInfNeg(IsFloatInf):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(lt=0)
         self._repr_kwargs = {}
 
     def equals(self, other: Any) -> bool:
-        return self.bounds_checks(other) and super().equals(other)
+        # check the type first, `bounds_checks()` expects a float
+        return super().equals(other) and self.bounds_checks(other)
 
 
 class IsFloatNan(IsFloat):
@@ -498,6 +594,166 @@ class IsFloatNan(IsFloat):
     ```
     """
 
+    __slots__ = ()
+
     def equals(self, other: Any) -> bool:
         other = self.prepare(other)
-        return math.isnan(other)
+        return other is not Reject and math.isnan(other)
+
+
+class IsArrayOf(DirtyEquals[Any]):
+    """
+    Check that every item in a numeric array matches a numeric type, without comparing items one at a time.
+    """
+
+    __slots__ = 'item', '_item_types', '_kind'
+
+    cost_hint = 4.0
+
+    # makes NumPy arrays return `NotImplemented` from `==`, rather than comparing each item with this object
+    __array_ufunc__ = None
+
+    # quoted, since creating the `Union` would compare the two types with `==`
+    def __init__(self, item: 'Union[IsNumeric[Any], type[IsNumeric[Any]]]'):
+        """
+        Args:
+            item: The type every item must match, e.g. `IsFloat(gt=0)`, `IsInt(ge=0, le=255)` or `IsApprox(1.5)`.
+
+        Arrays can be any object supporting the buffer protocol with an integer or float format,
+        e.g. `array.array` or `memoryview`, or a NumPy array. `str`, `bytes` and `bytearray` are never matched.
+
+        Bounds and approximate checks are made on the smallest and largest items, found with `min()` and `max()`
+        (or NumPy's reductions), rather than on every item, NaNs fail any bounds check just as they do
+        when compared one at a time. NumPy isn't required, but if the compared value is a NumPy array its
+        vectorised operations are used.
+
+        ```py title="IsArrayOf"
+        from array import array
+
+        from dirty_equals import IsArrayOf, IsFloat, IsFloatNan, IsInt
+
+        assert array('d', [0.5, 1.5]) == IsArrayOf(IsFloat(gt=0))
+        assert array('d', [0.5, -1.5]) != IsArrayOf(IsFloat(gt=0))
+        assert array('d', [0.5, float('nan')]) != IsArrayOf(IsFloat(gt=0))
+        assert array('d', [float('nan')]) == IsArrayOf(IsFloatNan)
+        assert memoryview(array('i', [1, 2])) == IsArrayOf(IsInt(le=2))
+        assert array('d', [1.0]) != IsArrayOf(IsInt)
+        assert [1, 2] != IsArrayOf(IsInt)
+        ```
+        """
+        if isinstance(item, type):
+            item_instance = item()
+        else:
+            item_instance = item
+        if not isinstance(item_instance, IsNumeric):
+            raise TypeError(f'IsArrayOf requires a numeric type, e.g. IsInt or IsFloat(gt=0), not {item!r}')
+        prepared_types = item_instance._prepared_types()
+        self._item_types = frozenset(t for t in (int, float) if t in prepared_types)
+        if not self._item_types:
+            raise TypeError(f'IsArrayOf requires a type which matches ints or floats, not {item!r}')
+
+        self.item = item_instance
+        cls = type(item_instance)
+        if cls.equals is IsFloatNan.equals:
+            self._kind = 'nan'
+        elif cls.equals in (IsFloatInf.equals, IsFloatInfPos.equals, IsFloatInfNeg.equals):
+            self._kind = 'inf'
+        elif (
+            cls.equals is IsNumeric.equals
+            and cls.bounds_checks is IsNumeric.bounds_checks
+            and cls.approx_equals is IsNumeric.approx_equals
+        ):
+            # without `delta`, the allowed difference depends on each item so they're compared individually
+            self._kind = 'each' if item_instance.approx is not None and item_instance.delta is None else 'bounds'
+        else:
+            self._kind = 'each'
+        super().__init__(item)
+
+    def equals(self, other: Any) -> bool:
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(other, np.ndarray):
+            # numpy is only used if the value is already a numpy array, so it never needs to be imported here
+            return self._numpy_equals(np, other)
+        elif isinstance(other, (str, bytes, bytearray)):
+            return False
+
+        try:
+            view = memoryview(other)
+        except TypeError:
+            return False
+        fmt = view.format.lstrip('@')
+        if fmt in _int_formats:
+            item_type: type = int
+        elif fmt in _float_formats:
+            item_type = float
+        else:
+            return False
+        if item_type not in self._item_types:
+            return False
+        if view.ndim != 1:
+            view = view.cast('B').cast(fmt)  # type: ignore[call-overload]
+        if not view:
+            return True
+
+        kind = self._kind
+        if kind == 'nan':
+            return all(map(math.isnan, view))
+        elif kind == 'inf' and not all(map(math.isinf, view)):
+            return False
+        elif kind == 'each':
+            return all(map(self.item._matches, view))
+        elif item_type is float and self._constrained() and _has_nan(view):
+            return False
+        return self._extremes_match(min(view), max(view))
+
+    def _numpy_equals(self, np: Any, other: Any) -> bool:
+        dtype_kind = other.dtype.kind
+        if dtype_kind in 'iu':
+            item_type: type = int
+        elif dtype_kind == 'f' and other.dtype.itemsize <= 8:
+            item_type = float
+        else:
+            return False
+        if item_type not in self._item_types:
+            return False
+        if other.size == 0:
+            return True
+
+        kind = self._kind
+        if kind == 'nan':
+            return bool(np.isnan(other).all())
+        elif kind == 'inf' and not np.isinf(other).all():
+            return False
+        elif kind == 'each':
+            item = self.item
+            if item_type is float and item.approx is not None and type(item.approx) in (int, float):
+                # the check `IsNumeric.bounds_checks` makes with the default delta, using float64 like python floats
+                values = other.astype(np.float64)
+                return bool((np.abs(item.approx - values) <= np.abs(values / 100)).all())
+            return all(map(item._matches, other.ravel().tolist()))
+        elif item_type is float and self._constrained() and np.isnan(other).any():
+            return False
+        return self._extremes_match(other.min().item(), other.max().item())
+
+    def _constrained(self) -> bool:
+        item = self.item
+        return any(v is not None for v in (item.exactly, item.approx, item.gt, item.lt, item.ge, item.le))
+
+    def _extremes_match(self, smallest: Any, largest: Any) -> bool:
+        # every check on `IsNumeric` is passed by a continuous range of values, so if the smallest and largest
+        # items pass, every item in between does too
+        item = self.item
+        if item.has_bounds_checks:
+            return item.bounds_checks(smallest) and item.bounds_checks(largest)
+        else:
+            return True
+
+
+def _has_nan(view: memoryview) -> bool:
+    # summing is much faster than checking each item, the sum is NaN if any item is, but also if the items
+    # include both infinities, so NaNs are looked for only then
+    return math.isnan(sum(view)) and any(map(math.isnan, view))
+
+
+_int_formats = frozenset('bBhHiIlLqQnN')
+_float_formats = frozenset('fd')
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict, is_dataclass
 from enum import Enum
 from functools import lru_cache
@@ -17,11 +18,18 @@ if TYPE_CHECKING:
     from pydantic import TypeAdapter
 
 
+_canonical_uuid = re.compile('[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+
+
 class IsUUID(DirtyEquals[UUID]):
     """
     A class that checks if a value is a valid UUID, optionally checking UUID version.
     """
 
+    __slots__ = ('version',)
+
+    cost_hint = 4.0
+
     def __init__(self, version: Literal[None, 1, 2, 3, 4, 5] = None):
         """
         Args:
@@ -42,11 +50,17 @@ class IsUUID(DirtyEquals[UUID]):
         self.version = version
         super().__init__(version or plain_repr(''))
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return () if self.version is None else (self.version,), {}
+
     def equals(self, other: Any) -> bool:
         if isinstance(other, UUID):
             uuid = other
         elif isinstance(other, str):
-            uuid = UUID(other)
+            try:
+                uuid = UUID(other)
+            except ValueError:
+                return False
             if self.version is not None and uuid.version != self.version:
                 return False
         else:
@@ -57,6 +71,28 @@ class IsUUID(DirtyEquals[UUID]):
         else:
             return True
 
+    def _matches_many(self, values: Iterable[Any]) -> Iterable[Any]:
+        if type(self).equals is not IsUUID.equals:
+            return super()._matches_many(values)
+        return self._uuid_verdicts(values)
+
+    def _uuid_verdicts(self, values: Iterable[Any]) -> Iterator[bool]:
+        # strings in the canonical form are checked with a regex rather than creating a `UUID` from each one,
+        # the version is the 13th hex digit, and it's only set for the RFC 4122 variant: "8", "9", "a" or "b"
+        # as the 17th digit
+        if self.version:
+            match = re.compile(
+                rf'[0-9a-f]{{8}}-[0-9a-f]{{4}}-{self.version}[0-9a-f]{{3}}-[89ab][0-9a-f]{{3}}-[0-9a-f]{{12}}', re.I
+            ).fullmatch
+        else:
+            match = _canonical_uuid.fullmatch
+        matches = self._matches
+        for other in values:
+            if type(other) is str and match(other):
+                yield True
+            else:
+                yield matches(other)
+
 
 AnyJson = object
 JsonType = TypeVar('JsonType', AnyJson, Any)
@@ -67,6 +103,10 @@ class IsJson(DirtyEquals[JsonType]):
     A class that checks if a value is a JSON object, and check the contents of the JSON.
     """
 
+    __slots__ = ('expected_value',)
+
+    cost_hint = 10.0
+
     @overload
     def __init__(self, expected_value: JsonType = AnyJson): ...
 
@@ -109,14 +149,20 @@ class IsJson(DirtyEquals[JsonType]):
             self.expected_value: Any = expected_kwargs
         else:
             self.expected_value = expected_value
-        super().__init__(plain_repr('') if expected_value is AnyJson else expected_value)
+        super().__init__(plain_repr('') if self.expected_value is AnyJson else self.expected_value)
+
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return () if self.expected_value is AnyJson else (self.expected_value,), {}
 
     def __class_getitem__(cls, expected_type: JsonType) -> IsJson[JsonType]:
         return cls(expected_type)
 
     def equals(self, other: Any) -> bool:
         if isinstance(other, (str, bytes)):
-            v = json.loads(other)
+            try:
+                v = json.loads(other)
+            except ValueError:
+                return False
             if self.expected_value is AnyJson:
                 return True
             else:
@@ -130,6 +176,10 @@ class FunctionCheck(DirtyEquals[Any]):
     Use a function to check if a value "equals" whatever you want to check
     """
 
+    __slots__ = ('func',)
+
+    cost_hint = 2.0
+
     def __init__(self, func: Callable[[Any], bool]):
         """
         Args:
@@ -148,6 +198,9 @@ class FunctionCheck(DirtyEquals[Any]):
         self.func = func
         super().__init__(plain_repr(func.__name__))
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return (self.func,), {}
+
     def equals(self, other: Any) -> bool:
         return self.func(other)
 
@@ -155,6 +208,8 @@ class FunctionCheck(DirtyEquals[Any]):
 T = TypeVar('T')
 
 
+# lru_cache is thread safe, including on free-threaded python, at worst two threads build the same adapter
+# concurrently and one is discarded
 @lru_cache
 def _build_type_adapter(ta: type[TypeAdapter[T]], schema: T) -> TypeAdapter[T]:
     return ta(schema)
@@ -179,6 +234,12 @@ class IsUrl(DirtyEquals[Any]):
     [Pydantic](https://pydantic-docs.helpmanual.io/usage/types/#urls).
     """
 
+    __slots__ = 'url_type', 'ValidationError', 'type_adapter', 'attribute_checks'
+
+    cost_hint = 20.0
+    # type adapters can't be pickled, they're rebuilt on first use after unpickling
+    _cache_slots = 'ValidationError', 'type_adapter'
+
     def __init__(
         self,
         any_url: bool = False,
@@ -220,11 +281,7 @@ class IsUrl(DirtyEquals[Any]):
                 HttpUrl,
                 PostgresDsn,
                 RedisDsn,
-                TypeAdapter,
-                ValidationError,
             )
-
-            self.ValidationError = ValidationError
         except ImportError as e:  # pragma: no cover
             raise ImportError('Pydantic V2 is not installed, run `pip install dirty-equals[pydantic]`') from e
         url_type_mappings = {
@@ -238,13 +295,13 @@ class IsUrl(DirtyEquals[Any]):
         }
         url_types_sum = sum(url_type_mappings.values())
         if url_types_sum == 0:
-            url_type: Any = AnyUrl
+            self.url_type: Any = AnyUrl
         elif url_types_sum == 1:
-            url_type = max(url_type_mappings, key=url_type_mappings.get)  # type: ignore[arg-type]
+            self.url_type = max(url_type_mappings, key=url_type_mappings.get)  # type: ignore[arg-type]
         else:
             raise ValueError('You can only check against one Pydantic url type at a time')
 
-        self.type_adapter = _build_type_adapter(TypeAdapter, url_type)
+        self._load_type_adapter()
 
         for item in expected_attributes:
             if item not in _allowed_url_attribute_checks:
@@ -255,11 +312,38 @@ class IsUrl(DirtyEquals[Any]):
         self.attribute_checks = expected_attributes
         super().__init__()
 
+    def _load_type_adapter(self) -> TypeAdapter[Any]:
+        from pydantic import TypeAdapter, ValidationError
+
+        self.ValidationError = ValidationError
+        self.type_adapter = _build_type_adapter(TypeAdapter, self.url_type)
+        return self.type_adapter
+
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        from pydantic import AmqpDsn, AnyHttpUrl, FileUrl, HttpUrl, PostgresDsn, RedisDsn
+
+        url_type_names = {
+            AnyHttpUrl: 'any_http_url',
+            HttpUrl: 'http_url',
+            FileUrl: 'file_url',
+            PostgresDsn: 'postgres_dsn',
+            AmqpDsn: 'ampqp_dsn',
+            RedisDsn: 'redis_dsn',
+        }
+        kwargs = dict(self.attribute_checks)
+        if self.url_type in url_type_names:
+            kwargs[url_type_names[self.url_type]] = True
+        return (), kwargs
+
     def equals(self, other: Any) -> bool:
         try:
-            other_url = self.type_adapter.validate_python(other)
+            type_adapter = self.type_adapter
+        except AttributeError:
+            type_adapter = self._load_type_adapter()
+        try:
+            other_url = type_adapter.validate_python(other)
         except self.ValidationError:
-            raise ValueError('Invalid URL')
+            return False
 
         # we now check that str() of the parsed URL equals its original value
         # so that invalid encodings fail
@@ -286,6 +370,10 @@ class IsHash(DirtyEquals[str]):
     A class that checks if a value is a valid common hash type, using a simple length and allowed characters regex.
     """
 
+    __slots__ = ('hash_type',)
+
+    cost_hint = 3.0
+
     def __init__(self, hash_type: HashTypes):
         """
         Args:
@@ -335,6 +423,10 @@ class IsIP(DirtyEquals[IP]):
     A class that checks if a value is a valid IP address, optionally checking IP version, netmask.
     """
 
+    __slots__ = 'version', 'netmask'
+
+    cost_hint = 5.0
+
     def __init__(self, *, version: Literal[None, 4, 6] = None, netmask: str | None = None):
         """
         Args:
@@ -368,7 +460,10 @@ class IsIP(DirtyEquals[IP]):
         if isinstance(other, (IPv4Network, IPv6Network)):
             ip = other
         elif isinstance(other, (str, bytes, int, IPv4Address, IPv6Address)):
-            ip = ip_network(other, strict=False)
+            try:
+                ip = ip_network(other, strict=False)
+            except ValueError:
+                return False
         else:
             return False
 
@@ -406,6 +501,8 @@ class IsDataclassType(DirtyEquals[Any]):
     ```
     """
 
+    __slots__ = ()
+
     def equals(self, other: Any) -> bool:
         return is_dataclass(other) and isinstance(other, type)
 
@@ -443,6 +540,10 @@ class IsDataclass(DirtyEquals[Any]):
     ```
     """
 
+    __slots__ = 'strict', 'partial'
+
+    cost_hint = 5.0
+
     def __init__(self, **fields: Any):
         """
         Args:
@@ -472,8 +573,8 @@ class IsDataclass(DirtyEquals[Any]):
         partial: bool | None = None,
     ) -> IsDataclass:
         """Allows to customise the behaviour of `IsDataclass`, technically a new `IsDataclass` to allow chaining."""
-        new_cls = self.__class__(**self._repr_kwargs)
-        new_cls.__dict__ = self.__dict__.copy()
+        # the modified copy is never frozen, even if this object is
+        new_cls = self._clone()
 
         if strict is not None:
             new_cls.strict = strict
@@ -482,6 +583,12 @@ class IsDataclass(DirtyEquals[Any]):
 
         return new_cls
 
+    def _spec_settings(self) -> dict[str, Any]:
+        default = type(self)()
+        return {
+            name: getattr(self, name) for name in ('strict', 'partial') if getattr(self, name) != getattr(default, name)
+        }
+
     def _fields_check(self, other: Any) -> bool:
         """
         Checks exactness of fields using [`IsDict`][dirty_equals.IsDict] with given settings.
@@ -516,6 +623,8 @@ class IsPartialDataclass(IsDataclass):
     ```
     """
 
+    __slots__ = ()
+
     def _post_init(self) -> None:
         self.partial = True
 
@@ -549,6 +658,8 @@ class IsStrictDataclass(IsDataclass):
     ```
     """
 
+    __slots__ = ()
+
     def _post_init(self) -> None:
         self.strict = True
 
@@ -573,6 +684,8 @@ class IsEnum(DirtyEquals[Enum]):
     ```
     """
 
+    __slots__ = '_enum_cls', '_enum_values'
+
     def __init__(self, enum_cls: type[Enum] = Enum):
         """
         Args:
@@ -580,6 +693,10 @@ class IsEnum(DirtyEquals[Enum]):
         """
         self._enum_cls = enum_cls
         self._enum_values = {i.value for i in enum_cls}
+        super().__init__(plain_repr(enum_cls.__name__))
+
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return () if self._enum_cls is Enum else (self._enum_cls,), {}
 
     def equals(self, other: Any) -> bool:
         if isinstance(other, Enum):
@@ -0,0 +1,139 @@
+import os
+import pickle
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Optional
+
+from ._base import DirtyEquals, MatchManyResult
+from ._compile import compile
+
+__all__ = ('validate_parallel',)
+
+# the matcher used by `_check_chunk()` in a worker process, set once per worker by `_init_worker()`
+_worker_matcher: Optional[DirtyEquals[Any]] = None
+
+
+def validate_parallel(
+    matcher: Any,
+    values: Iterable[Any],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 10_000,
+    fail_fast: bool = True,
+) -> MatchManyResult:
+    """
+    Compare every value in `values` to `matcher`, like [`match_many()`][dirty_equals.DirtyEquals.match_many],
+    but split between a pool of worker processes so large collections are checked on many cores at once.
+
+    Args:
+        matcher: A *dirty-equals* type, or any expected value which [`compile()`][dirty_equals.compile] accepts,
+            e.g. a dict of types.
+        values: The values to check, they're read in chunks so it can be a generator.
+        workers: Number of worker processes, defaults to the number of CPUs.
+        chunksize: Number of values sent to a worker at a time, rounded up to a multiple of 8.
+        fail_fast: Whether to stop at the first value which doesn't match, if false every value is compared and
+            the verdict for each is recorded, like `match_many(values, verdicts=True)`.
+
+    Returns:
+        A [`MatchManyResult`][dirty_equals.MatchManyResult], as returned by `match_many()`.
+
+    `matcher` is pickled once and sent to each worker when it starts, values are pickled as they're sent,
+    so both must be picklable.
+
+    With `fail_fast`, once a chunk fails no more chunks are sent, and chunks after it which haven't started are
+    cancelled, chunks before it are still checked since they might include an earlier failure, so
+    `first_failure` is always the index of the first value which doesn't match.
+
+    ```{.py title="validate_parallel" test="skip"}
+    import dirty_equals
+    from dirty_equals import IsInt, IsStr
+
+    rows = ({'id': i, 'name': f'user {i}'} for i in range(1_000_000))
+    expected = {'id': IsInt(ge=0), 'name': IsStr}
+    assert dirty_equals.validate_parallel(expected, rows, workers=4)
+    ```
+    """
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+    # chunks are a whole number of bytes in the bitmap of verdicts, so the bitmaps can be joined
+    chunksize = -(-chunksize // 8) * 8
+    workers = workers or os.cpu_count() or 1
+    if not isinstance(matcher, DirtyEquals):
+        matcher = compile(matcher)
+    matcher_pickle = pickle.dumps(matcher)
+
+    chunks = _chunks(values, chunksize)
+    # chunk lengths and results, by chunk index
+    lengths: list[int] = []
+    results: dict[int, tuple[Optional[int], Optional[bytes]]] = {}
+    failed_chunk: Optional[int] = None
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(matcher_pickle,)) as executor:
+        # only a few chunks are waiting at a time so `values` isn't read into memory all at once
+        pending: dict[Future[tuple[Optional[int], Optional[bytes]]], int] = {}
+        while True:
+            while failed_chunk is None and len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pending[executor.submit(_check_chunk, chunk, fail_fast)] = len(lengths)
+                lengths.append(len(chunk))
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future not in pending:
+                    # dropped by an earlier failure in this batch
+                    continue
+                index = pending.pop(future)
+                results[index] = future.result()
+                if fail_fast and results[index][0] is not None and (failed_chunk is None or index < failed_chunk):
+                    failed_chunk = index
+                    # chunks after this one can't change the result
+                    for later, later_index in list(pending.items()):
+                        if later_index > index:
+                            later.cancel()
+                            del pending[later]
+
+    return _combine(lengths, results, failed_chunk, fail_fast)
+
+
+def _combine(
+    lengths: list[int],
+    results: dict[int, tuple[Optional[int], Optional[bytes]]],
+    failed_chunk: Optional[int],
+    fail_fast: bool,
+) -> MatchManyResult:
+    """
+    Build the result for the whole of `values` from the result of each chunk.
+    """
+    if fail_fast:
+        if failed_chunk is None:
+            return MatchManyResult(sum(lengths), None)
+        failure = sum(lengths[:failed_chunk]) + results[failed_chunk][0]  # type: ignore[operator]
+        return MatchManyResult(failure + 1, failure)
+
+    first_failure = next(
+        (sum(lengths[:index]) + failure for index, (failure, _) in sorted(results.items()) if failure is not None),
+        None,
+    )
+    bitmap = b''.join(results[index][1] or b'' for index in range(len(lengths)))
+    return MatchManyResult(sum(lengths), first_failure, bitmap)
+
+
+def _chunks(values: Iterable[Any], chunksize: int) -> Iterator[list[Any]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def _init_worker(matcher_pickle: bytes) -> None:
+    global _worker_matcher
+    _worker_matcher = pickle.loads(matcher_pickle)
+
+
+def _check_chunk(chunk: list[Any], fail_fast: bool) -> tuple[Optional[int], Optional[bytes]]:
+    assert _worker_matcher is not None, 'worker not initialised'
+    result = _worker_matcher.match_many(chunk, verdicts=not fail_fast)
+    return result.first_failure, result.bitmap
@@ -1,9 +1,10 @@
 import sys
-from collections.abc import Container, Sized
+from collections import deque
+from collections.abc import AsyncIterator, Container, Sized
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, overload
 
 from ._base import DirtyEquals
-from ._utils import Omit, plain_repr
+from ._utils import Omit, _literal_types, plain_repr
 
 if TYPE_CHECKING:
     from typing import TypeAlias
@@ -16,6 +17,9 @@ else:
 __all__ = 'HasLen', 'Contains', 'IsListOrTuple', 'IsList', 'IsTuple'
 T = TypeVar('T', list[Any], tuple[Any, ...])
 LengthType: 'TypeAlias' = 'Union[None, int, tuple[int, Union[int, Any]], EllipsisType]'
+# a position in `IsListOrTuple(positions=...)`, tuples are the arguments to `slice()` since slices aren't hashable
+# before python 3.12
+PositionType: 'TypeAlias' = 'Union[int, tuple[Optional[int], ...], slice]'
 
 
 class HasLen(DirtyEquals[Sized]):
@@ -23,6 +27,8 @@ class HasLen(DirtyEquals[Sized]):
     Check that some has a given length, or length in a given range.
     """
 
+    __slots__ = ('length',)
+
     @overload
     def __init__(self, length: int): ...
 
@@ -56,15 +62,33 @@ class HasLen(DirtyEquals[Sized]):
             self.length = (min_length, max_length)
             super().__init__(*_length_repr(self.length))
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return (self.length if isinstance(self.length, tuple) else (self.length,)), {}
+
     def equals(self, other: Any) -> bool:
         return _length_correct(self.length, other)
 
+    async def _amatches(self, items: AsyncIterator[Any]) -> bool:
+        min_length, max_length = _length_bounds(self.length)
+        count = 0
+        async for _ in items:
+            count += 1
+            if max_length is None and count >= min_length:
+                return True
+            elif max_length is not None and count > max_length:
+                return False
+        return count >= min_length
+
 
 class Contains(DirtyEquals[Container[Any]]):
     """
     Check that an object contains one or more values.
     """
 
+    __slots__ = ('contained_values',)
+
+    cost_hint = 2.0
+
     def __init__(self, contained_value: Any, *more_contained_values: Any):
         """
         Args:
@@ -88,24 +112,37 @@ class Contains(DirtyEquals[Container[Any]]):
     def equals(self, other: Any) -> bool:
         return all(v in other for v in self.contained_values)
 
+    async def _amatches(self, items: AsyncIterator[Any]) -> bool:
+        remaining = list(self.contained_values)
+        async for item in items:
+            # compared the same way as `in` compares items of a list
+            remaining = [v for v in remaining if not (item is v or item == v)]
+            if not remaining:
+                return True
+        return False
+
 
 class IsListOrTuple(DirtyEquals[T]):
     """
     Check that some object is a list or tuple and optionally its values match some constraints.
     """
 
+    __slots__ = 'positions', 'items', 'check_order', 'length'
+
+    cost_hint = 3.0
+
     allowed_type: Union[type[T], tuple[type[list[Any]], type[tuple[Any, ...]]]] = (list, tuple)
 
     @overload
     def __init__(self, *items: Any, check_order: bool = True, length: 'LengthType' = None): ...
 
     @overload
-    def __init__(self, positions: dict[int, Any], length: 'LengthType' = None): ...
+    def __init__(self, positions: 'dict[PositionType, Any]', length: 'LengthType' = None): ...
 
     def __init__(
         self,
         *items: Any,
-        positions: Optional[dict[int, Any]] = None,
+        positions: 'Optional[dict[PositionType, Any]]' = None,
         check_order: bool = True,
         length: 'LengthType' = None,
     ):
@@ -122,13 +159,14 @@ class IsListOrTuple(DirtyEquals[T]):
         or,
 
         Args:
-            positions (dict[int, Any]): Instead of `*items`, a dictionary of positions and
-                values to check and be provided.
+            positions (dict[Union[int, tuple[Optional[int], ...], slice], Any]): Instead of `*items`, a dictionary
+                of positions and values to check and be provided, positions can be negative to count from the end,
+                or a tuple of arguments to `slice()` (or a slice from python 3.12) to compare the items in a slice.
             length (Union[int, tuple[int, Union[int, Any]]]): length constraints, int or tuple matching the arguments
                 of [`HasLen`][dirty_equals.HasLen].
 
         ```py title="IsListOrTuple"
-        from dirty_equals import AnyThing, IsListOrTuple
+        from dirty_equals import AnyThing, IsInt, IsListOrTuple
 
         assert [1, 2, 3] == IsListOrTuple(1, 2, 3)
         assert (1, 3, 2) == IsListOrTuple(1, 2, 3, check_order=False)
@@ -148,6 +186,12 @@ class IsListOrTuple(DirtyEquals[T]):
         assert [1, 2, 3, 4] == IsListOrTuple(3, check_order=False, length=(0, ...))  # (7)!
 
         assert [1, 2, 3] == IsListOrTuple(AnyThing, AnyThing, 3)  # (8)!
+
+        assert [1, 2] == IsListOrTuple(IsInt, 1, check_order=False)  # (9)!
+
+        assert ['a', 'b', 'c', 'd'] == (
+            IsListOrTuple(positions={-1: 'd', (1, 3): ['b', 'c']})  # (10)!
+        )
         ```
 
         1. Unlike using sets for comparison, we can do order-insensitive comparisons on objects that are not hashable.
@@ -159,9 +203,11 @@ class IsListOrTuple(DirtyEquals[T]):
         7. Here we're just confirming that the value `3` is in the list
         8. If you don't care about the first few values of a list or tuple,
             you can use [`AnyThing`][dirty_equals.AnyThing] in your arguments.
+        9. Items are matched to values so every item finds one, even though `IsInt` is also equal to `1`.
+        10. Negative positions count from the end, and a tuple of `slice()` arguments compares a slice.
         """
         if positions is not None:
-            self.positions: Optional[dict[int, Any]] = positions
+            self.positions: Optional[dict[PositionType, Any]] = positions
             if items:
                 raise TypeError(f'{self.__class__.__name__} requires either args or positions, not both')
             if not check_order:
@@ -185,34 +231,116 @@ class IsListOrTuple(DirtyEquals[T]):
             check_order=self.check_order and Omit,
         )
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        kwargs: dict[str, Any] = {}
+        if self.positions is None:
+            args = self.items
+        else:
+            args = ()
+            kwargs['positions'] = self.positions
+        if not self.check_order:
+            kwargs['check_order'] = False
+        if self.length is not None:
+            kwargs['length'] = self.length
+        return args, kwargs
+
     def equals(self, other: Any) -> bool:
         if not isinstance(other, self.allowed_type):
             return False
+        return self._items_equal(other)
 
+    def _items_equal(self, other: Any) -> bool:
         if not _length_correct(self.length, other):
             return False
 
         if self.check_order:
-            if self.positions is None:
-                if self.length is None:
-                    return list(self.items) == list(other)
-                else:
-                    return list(self.items) == list(other[: len(self.items)])
-            else:
-                return all(v == other[k] for k, v in self.positions.items())
+            return self._first_mismatch(other) is None
         else:
             # order insensitive comparison
             # if we haven't checked length yet, check it now
             if self.length is None and len(other) != len(self.items):
                 return False
 
-            other_copy = list(other)
-            for item in self.items:
-                try:
-                    other_copy.remove(item)
-                except ValueError:
-                    return False
-            return True
+            return _unordered_equal(self.items, other)
+
+    def _first_mismatch(self, other: Any) -> Optional[int]:
+        """
+        Index of the first value in `other` which doesn't match, when the order is checked, or `None` if they all
+        match. The walk stops at the first value which doesn't match, so each matcher is called at most once.
+
+        The length constraint isn't checked, an index outside `other` means a value is missing.
+        """
+        if self.positions is not None:
+            return _positions_mismatch(self.positions, other)
+
+        items = self.items
+        for index, (item, value) in enumerate(zip(items, other)):
+            # `_item_equal()` inlined, since this is the hot loop for ordered comparisons
+            if not (item is value or item == value):
+                return index
+        if len(other) < len(items):
+            return len(other)
+        elif self.length is None and len(other) > len(items):
+            return len(items)
+        return None
+
+    async def _amatches(self, items: AsyncIterator[Any]) -> bool:
+        # the stream is compared as if it were collected into a list, without checking the type
+        if not self.check_order:
+            # every item is needed to compare without order, but no more than the maximum length
+            max_length = len(self.items) if self.length is None else _length_bounds(self.length)[1]
+            collected = await _collect(items, max_length)
+            return collected is not None and self._items_equal(collected)
+        elif self.positions is None:
+            return await self._amatches_items(items)
+        elif any(_position_slice(k) is not None for k in self.positions):
+            # slices can depend on the length, so the stream is collected
+            collected = await _collect(items, _length_bounds(self.length)[1])
+            return collected is not None and self._items_equal(collected)
+        else:
+            return await self._amatches_positions(items, self.positions)
+
+    async def _amatches_items(self, items: AsyncIterator[Any]) -> bool:
+        expected = self.items
+        min_length, max_length = _length_bounds(len(expected) if self.length is None else self.length)
+        # shorter than `items` never matches
+        min_length = max(min_length, len(expected))
+
+        count = 0
+        async for item in items:
+            if count < len(expected) and not _item_equal(expected[count], item):
+                return False
+            count += 1
+            if max_length is None and count >= min_length:
+                # the remaining items aren't checked
+                return True
+            elif max_length is not None and count > max_length:
+                return False
+        return count >= min_length
+
+    async def _amatches_positions(self, items: AsyncIterator[Any], positions: dict[Any, Any]) -> bool:
+        min_length, max_length = _length_bounds(self.length)
+        positive = {k: v for k, v in positions.items() if k >= 0}
+        negative = {k: v for k, v in positions.items() if k < 0}
+        last_position = max(positive, default=-1)
+        # only the last few items are kept, to check negative positions once the stream ends
+        window: deque[Any] = deque(maxlen=max((-k for k in negative), default=0))
+
+        count = 0
+        async for item in items:
+            if count in positive and not _item_equal(positive[count], item):
+                return False
+            count += 1
+            if negative:
+                window.append(item)
+            elif max_length is None and count > last_position and count >= min_length:
+                return True
+            if max_length is not None and count > max_length:
+                return False
+
+        if count < min_length or count <= last_position or (negative and -min(negative) > count):
+            return False
+        return all(_item_equal(v, window[k]) for k, v in negative.items())
 
 
 class IsList(IsListOrTuple[list[Any]]):
@@ -233,6 +361,8 @@ class IsList(IsListOrTuple[list[Any]]):
     ```
     """
 
+    __slots__ = ()
+
     allowed_type = list
 
 
@@ -254,9 +384,67 @@ class IsTuple(IsListOrTuple[tuple[Any, ...]]):
     ```
     """
 
+    __slots__ = ()
+
     allowed_type = tuple
 
 
+def _positions_mismatch(positions: 'dict[PositionType, Any]', other: Any) -> Optional[int]:
+    """
+    Index of the first position in `other` which doesn't match, in the order of `positions`, or `None`.
+
+    Negative positions are counted from the end of `other`, so a position outside `other` gives a negative index
+    or one past the end, either way the value is missing.
+    """
+    other_len = len(other)
+    for position, expected in positions.items():
+        if isinstance(position, int):
+            index = position + other_len if position < 0 else position
+            if not 0 <= index < other_len:
+                # outside `other`, so the value is missing
+                return index
+            if not _item_equal(expected, other[index]):
+                return index
+        else:
+            mismatch = _slice_mismatch(slice(*position) if isinstance(position, tuple) else position, expected, other)
+            if mismatch is not None:
+                return mismatch
+    return None
+
+
+def _position_slice(position: 'PositionType') -> Optional[slice]:
+    if isinstance(position, tuple):
+        return slice(*position)
+    elif isinstance(position, slice):
+        return position
+    else:
+        return None
+
+
+def _slice_mismatch(position: slice, expected: Any, other: Any) -> Optional[int]:
+    """
+    Index of the first value in `other[position]` which doesn't match `expected`, or `None`.
+
+    When `expected` is a list or tuple, like `other[position]` would be, its items are compared in place,
+    otherwise, e.g. for a *dirty-equals* type, it's compared to the slice.
+    """
+    indexes = range(*position.indices(len(other)))
+    if not isinstance(expected, (list, tuple)) or not isinstance(other, type(expected)):
+        if expected == other[position]:
+            return None
+        return indexes[0] if indexes else indexes.start
+
+    for index, item in zip(indexes, expected):
+        if not _item_equal(item, other[index]):
+            return index
+    if len(expected) < len(indexes):
+        return indexes[len(expected)]
+    elif len(expected) > len(indexes):
+        # the first missing value
+        return indexes.start + len(indexes) * indexes.step
+    return None
+
+
 def _length_repr(length: 'LengthType') -> Any:
     if length is None:
         return Omit
@@ -269,6 +457,250 @@ def _length_repr(length: 'LengthType') -> Any:
         return length[0], max_value
 
 
+def _unordered_equal(items: tuple[Any, ...], other: Any) -> bool:
+    """
+    Check each of `items` is equal to a different value in `other`, comparing them as `list.remove()` would.
+
+    This is a maximum bipartite matching between items and values, an item and a value are joined if they're
+    equal, and every item must be matched. Literal values are put in a dict, so a literal item is only joined to
+    the literal values equal to it (as well as any other values it's equal to), which keeps the graph sparse,
+    other items (e.g. *dirty-equals* types or unhashable values) are compared with every value.
+
+    Items and values which are equal to each other are grouped, e.g. all the `1`s in `other`, so repeated values
+    don't make the graph dense.
+    """
+    values = list(other)
+    if len(items) > len(values):
+        return False
+
+    # each group is a list of indexes of values, a literal item is joined to the whole of a group at once
+    groups: list[list[int]] = []
+    # group of literal values by value, so `1`, `1.0` and `True` share a group like they share a dict key
+    literal_groups: dict[Any, int] = {}
+    non_literal: list[int] = []
+    for index, value in enumerate(values):
+        if type(value) in _literal_types:
+            group = literal_groups.get(value)
+            if group is None:
+                group = literal_groups[value] = len(groups)
+                groups.append([])
+            groups[group].append(index)
+        else:
+            non_literal.append(index)
+
+    # group of non-literal values equal to each literal item, by type and value
+    other_groups: dict[tuple[type, Any], Optional[int]] = {}
+    # group of values equal to each other item, by id
+    same_groups: dict[int, Optional[int]] = {}
+    item_groups: list[tuple[int, ...]] = []
+    found: tuple[Optional[int], ...]
+    for item in items:
+        item_type = type(item)
+        if item_type in _literal_types:
+            key = item_type, item
+            if key not in other_groups:
+                equal = [index for index in non_literal if _value_equal(values[index], item)]
+                other_groups[key] = _add_group(groups, equal)
+            found = literal_groups.get(item), other_groups[key]
+        else:
+            # the same object can be repeated, e.g. `[IsInt()] * 3`, it's only compared with each value once
+            if id(item) not in same_groups:
+                equal = [index for index, value in enumerate(values) if _value_equal(value, item)]
+                same_groups[id(item)] = _add_group(groups, equal)
+            found = (same_groups[id(item)],)
+        item_group = tuple(group for group in found if group is not None)
+        if not item_group:
+            return False
+        item_groups.append(item_group)
+
+    matched = _max_matching(item_groups, groups, len(values))
+    if matched is None:
+        return False
+
+    # compare matched *dirty-equals* types again so their repr shows the value they matched
+    for item, index in zip(items, matched):
+        if isinstance(item, DirtyEquals):
+            values[index] == item
+    return True
+
+
+def _item_equal(item: Any, value: Any) -> bool:
+    # the comparison `list.__eq__` makes, so identical values (e.g. the same NaN) are always equal
+    return item is value or bool(item == value)
+
+
+def _value_equal(value: Any, item: Any) -> bool:
+    # the comparison `list.remove()` makes
+    return value is item or bool(value == item)
+
+
+def _add_group(groups: list[list[int]], indexes: list[int]) -> Optional[int]:
+    if not indexes:
+        return None
+    groups.append(indexes)
+    return len(groups) - 1
+
+
+def _max_matching(item_groups: list[tuple[int, ...]], groups: list[list[int]], value_count: int) -> Optional[list[int]]:
+    """
+    Match each item to a different value with Hopcroft-Karp, items are joined to every value in each of their
+    groups in `item_groups`.
+
+    Returns the index of the value matched to each item, or `None` if they can't all be matched.
+    """
+    item_match = [-1] * len(item_groups)
+    value_match = [-1] * value_count
+    _greedy_matching(item_groups, groups, item_match, value_match)
+    while True:
+        free = [item for item, value in enumerate(item_match) if value == -1]
+        if not free:
+            return item_match
+        layer = _layers(free, item_groups, groups, value_match)
+        if layer is None:
+            return None
+        _augment(free, layer, item_groups, groups, item_match, value_match)
+
+
+def _greedy_matching(
+    item_groups: list[tuple[int, ...]], groups: list[list[int]], item_match: list[int], value_match: list[int]
+) -> None:
+    """
+    Match each item to the first free value it can take, this is usually a complete matching, or close to it.
+    """
+    # values before the position in each group are all matched
+    group_pos = [0] * len(groups)
+    for item, item_group in enumerate(item_groups):
+        for group in item_group:
+            members = groups[group]
+            pos = group_pos[group]
+            while pos < len(members) and value_match[members[pos]] != -1:
+                pos += 1
+            group_pos[group] = pos
+            if pos < len(members):
+                item_match[item] = members[pos]
+                value_match[members[pos]] = item
+                break
+
+
+def _layers(
+    free: list[int], item_groups: list[tuple[int, ...]], groups: list[list[int]], value_match: list[int]
+) -> Optional[list[int]]:
+    """
+    Breadth first search from the free items, the layer of each item is the length of the shortest alternating
+    path to it, or `-1` if there isn't one. Returns `None` if no path reaches a free value.
+
+    Many items can share a group, the first to reach a group is in the lowest layer, so each group is only
+    searched once.
+    """
+    layer = [-1] * len(item_groups)
+    for item in free:
+        layer[item] = 0
+    searched = bytearray(len(groups))
+    queue = free[:]
+    found = False
+    for item in queue:
+        for group in item_groups[item]:
+            if searched[group]:
+                continue
+            searched[group] = 1
+            for value in groups[group]:
+                next_item = value_match[value]
+                if next_item == -1:
+                    found = True
+                elif layer[next_item] == -1:
+                    layer[next_item] = layer[item] + 1
+                    queue.append(next_item)
+    return layer if found else None
+
+
+def _augment(
+    free: list[int],
+    layer: list[int],
+    item_groups: list[tuple[int, ...]],
+    groups: list[list[int]],
+    item_match: list[int],
+    value_match: list[int],
+) -> None:
+    """
+    Depth first search along the layers for disjoint augmenting paths from the free items, and flip them.
+
+    Each value is visited at most once, so a shared position in each group from each layer skips values
+    which have been visited or can't be used from that layer, rather than every item searching the group.
+    """
+    visited = bytearray(len(value_match))
+    group_pos: dict[tuple[int, int], int] = {}
+    item_pos = [0] * len(item_groups)
+
+    def next_value(item: int) -> int:
+        item_group = item_groups[item]
+        while item_pos[item] < len(item_group):
+            group = item_group[item_pos[item]]
+            key = group, layer[item]
+            members = groups[group]
+            pos = group_pos.get(key, 0)
+            while pos < len(members):
+                value = members[pos]
+                pos += 1
+                if visited[value]:
+                    continue
+                next_item = value_match[value]
+                if next_item == -1 or layer[next_item] == layer[item] + 1:
+                    group_pos[key] = pos
+                    return value
+            group_pos[key] = pos
+            item_pos[item] += 1
+        return -1
+
+    for root in free:
+        # iterative so long paths don't hit the recursion limit
+        path_items = [root]
+        path_values: list[int] = []
+        while path_items:
+            item = path_items[-1]
+            value = next_value(item)
+            if value == -1:
+                # dead end, there's no path through this item in this phase
+                layer[item] = -1
+                path_items.pop()
+                if path_values:
+                    path_values.pop()
+                continue
+            visited[value] = 1
+            path_values.append(value)
+            next_item = value_match[value]
+            if next_item == -1:
+                for path_item, path_value in zip(path_items, path_values):
+                    item_match[path_item] = path_value
+                    value_match[path_value] = path_item
+                break
+            path_items.append(next_item)
+
+
+def _length_bounds(length: 'LengthType') -> tuple[int, Optional[int]]:
+    """
+    Minimum and maximum lengths from a length constraint, the maximum is `None` if there isn't one.
+    """
+    if isinstance(length, int):
+        return length, length
+    elif isinstance(length, tuple):
+        min_length, max_length = length
+        return min_length, max_length if isinstance(max_length, int) else None
+    else:
+        return 0, None
+
+
+async def _collect(items: AsyncIterator[Any], max_length: Optional[int]) -> Optional[list[Any]]:
+    """
+    Collect items into a list, or return `None` as soon as there are more than `max_length`.
+    """
+    collected = []
+    async for item in items:
+        collected.append(item)
+        if max_length is not None and len(collected) > max_length:
+            return None
+    return collected
+
+
 def _length_correct(length: 'LengthType', other: 'Sized') -> bool:
     if isinstance(length, int):
         if len(other) != length:
@@ -0,0 +1,367 @@
+import json
+import os
+import pickle
+import re
+import tempfile
+from base64 import b64decode, b64encode
+from contextvars import ContextVar
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from hashlib import sha256
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from ._base import DirtyAnd, DirtyEquals, DirtyEqualsMeta, DirtyNot, DirtyOr
+from ._compile import Compiled, compile
+from .version import VERSION
+
+__all__ = 'from_spec', 'to_spec', 'load_spec'
+
+# set while `from_spec()` is building a value with `allow_refs=True`
+_allow_refs: ContextVar[bool] = ContextVar('dirty_equals_allow_refs', default=False)
+
+
+def from_spec(spec: Any, *, allow_refs: bool = False) -> Any:
+    """
+    Build the value described by a spec, generally a nested structure of dicts, lists and *dirty-equals* types.
+
+    Args:
+        spec: JSON compatible data, e.g. from `json.load()`.
+        allow_refs: Whether to allow `"$ref"`, see below, otherwise it raises a `ValueError`.
+
+    Specs are plain JSON, except for objects with keys starting with `$`:
+
+    * `{"$IsStr": {"regex": "..."}}` creates a type from its keyword arguments, any public type can be used,
+      `{"$IsStr": [...]}` creates it from positional arguments, and `{"$IsList": {"$args": [...], "length": 3}}`
+      from both. Any other value is used as the only positional argument, e.g. `{"$HasLen": 3}`,
+      and `null` gives the class itself rather than an instance, e.g. `{"$IsInt": null}` for `IsInt`.
+      A `"$settings"` key alongside calls `settings()` on the result, e.g. for [`IsDict`][dirty_equals.IsDict].
+    * `{"$or": [...]}`, `{"$and": [...]}` and `{"$not": ...}` combine types as `|`, `&` and `~` do.
+    * `{"$compile": ...}` calls [`compile`][dirty_equals.compile] on the value.
+    * `{"$tuple": [...]}`, `{"$set": [...]}`, `{"$frozenset": [...]}`, `{"$dict": [[key, value], ...]}`,
+      `{"$bytes": "<base64>"}`, `{"$decimal": "1.5"}`, `{"$datetime": "<iso format>"}`, `{"$date": ...}`,
+      `{"$time": ...}`, `{"$timedelta": <seconds>}`, `{"$timezone": <offset seconds>}`,
+      `{"$pattern": [pattern, flags]}` and `{"$ellipsis": null}` create values which JSON can't represent.
+    * `{"$ref": "module:name"}` imports a value, e.g. a class for [`IsInstance`][dirty_equals.IsInstance], a function
+      for [`FunctionCheck`][dirty_equals.FunctionCheck] or an enum member. Importing a module can run any code, and
+      a function from anywhere (e.g. `os:system`) can be called during comparisons, so `"$ref"` is only allowed with
+      `allow_refs=True`, for specs which are as trusted as code.
+
+    [`to_spec()`][dirty_equals.to_spec] does the reverse.
+
+    ```py title="from_spec"
+    import json
+
+    import dirty_equals
+
+    spec = json.loads(
+        '{"id": {"$IsInt": {"gt": 0}}, "name": {"$IsStr": {"regex": "[a-z]+"}}, "tags": {"$IsList": {"length": 2}}}'
+    )
+    user_check = dirty_equals.from_spec(spec)
+    print(user_check)
+    #> {'id': IsInt(gt=0), 'name': IsStr(regex='[a-z]+'), 'tags': IsList(length=2)}
+    assert {'id': 1, 'name': 'john', 'tags': ['a', 'b']} == user_check
+    ```
+    """
+    if not allow_refs:
+        return _from_spec(spec)
+    token = _allow_refs.set(True)
+    try:
+        return _from_spec(spec)
+    finally:
+        _allow_refs.reset(token)
+
+
+def _from_spec(spec: Any) -> Any:
+    spec_type = type(spec)
+    if spec_type is dict:
+        if _is_tagged(spec):
+            return _from_tagged(spec)
+        return {k: _from_spec(v) for k, v in spec.items()}
+    elif spec_type is list:
+        return [_from_spec(v) for v in spec]
+    else:
+        return spec
+
+
+def to_spec(value: Any) -> Any:
+    """
+    Describe `value` as a spec which [`from_spec()`][dirty_equals.from_spec] can use to build an equivalent value.
+
+    Args:
+        value: The value to describe, generally a nested structure of dicts, lists and *dirty-equals* types.
+
+    Returns:
+        JSON compatible data.
+
+    A `TypeError` is raised if `value` contains anything which can't be described, e.g. a lambda or a custom type.
+
+    ```py title="to_spec"
+    import dirty_equals
+    from dirty_equals import IsDict, IsInt, IsStr
+
+    spec = dirty_equals.to_spec(IsDict(id=IsInt(gt=0) | IsStr).settings(partial=True))
+    assert spec == {
+        '$IsDict': {'id': {'$or': [{'$IsInt': {'gt': 0}}, {'$IsStr': None}]}},
+        '$settings': {'partial': True},
+    }
+    matcher = dirty_equals.from_spec(spec)
+    assert repr(matcher) == 'IsDict[partial=True](id=IsInt(gt=0) | IsStr)'
+    ```
+    """
+    value_type = type(value)
+    if value is None or value_type is str or value_type is int or value_type is float or value_type is bool:
+        return value
+    elif value_type is list:
+        return [to_spec(v) for v in value]
+    elif value_type is dict:
+        if all(type(k) is str and not k.startswith('$') for k in value):
+            return {k: to_spec(v) for k, v in value.items()}
+        return {'$dict': [[to_spec(k), to_spec(v)] for k, v in value.items()]}
+    elif isinstance(value_type, DirtyEqualsMeta):
+        return _to_matcher_spec(value)
+    elif isinstance(value, DirtyEqualsMeta) and _matcher_types().get(value.__name__) is value:
+        return {f'${value.__name__}': None}
+
+    tag = _value_tags.get(value_type)
+    if tag is not None:
+        return {tag[0]: tag[1](value)}
+    elif value is Ellipsis:
+        return {'$ellipsis': None}
+    elif isinstance(value, re.Pattern):
+        return {'$pattern': [to_spec(value.pattern), value.flags]}
+    elif isinstance(value, Enum):
+        return _to_ref(value, type(value), f'{type(value).__qualname__}.{value.name}')
+    elif hasattr(value, '__qualname__'):
+        return _to_ref(value, value, value.__qualname__)
+    else:
+        raise TypeError(f'{value!r} cannot be described by a spec')
+
+
+def load_spec(
+    path: Union[str, 'os.PathLike[str]'],
+    *,
+    cache_dir: Union[None, str, 'os.PathLike[str]'] = None,
+    allow_refs: bool = False,
+) -> Any:
+    """
+    Read a JSON spec file and build the value it describes with [`from_spec()`][dirty_equals.from_spec].
+
+    Args:
+        path: Path of the JSON file.
+        cache_dir: If given, built values are pickled in this directory, keyed by a hash of the file's content
+            (and the *dirty-equals* version), so loading an unchanged file again doesn't need to parse the JSON or
+            build any types. Cache files should be treated as trusted code since they're unpickled.
+        allow_refs: Whether to allow `"$ref"` in the spec, which imports any value, see
+            [`from_spec()`][dirty_equals.from_spec].
+
+    ```py title="load_spec"
+    import json
+    from pathlib import Path
+    from tempfile import TemporaryDirectory
+
+    import dirty_equals
+
+    with TemporaryDirectory() as tmp:
+        contract = Path(tmp) / 'user.json'
+        contract.write_text(json.dumps({'id': {'$IsPositiveInt': None}}))
+        cache_dir = Path(tmp) / 'cache'
+
+        user_check = dirty_equals.load_spec(contract, cache_dir=cache_dir)
+        assert {'id': 1} == user_check
+        # loaded from the cache
+        assert {'id': 2} == dirty_equals.load_spec(contract, cache_dir=cache_dir)
+    ```
+    """
+    data = Path(path).read_bytes()
+    if cache_dir is None:
+        return from_spec(json.loads(data), allow_refs=allow_refs)
+
+    # `allow_refs` is part of the key, so a cached value with refs isn't loaded when they aren't allowed
+    key = sha256(f'dirty-equals {VERSION} allow_refs={allow_refs}\n'.encode() + data).hexdigest()
+    cache_path = Path(cache_dir) / f'{key}.pickle'
+    try:
+        with cache_path.open('rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # no cache file, or an unreadable or stale one (e.g. with a `$ref` which no longer exists) to replace
+        pass
+
+    value = from_spec(json.loads(data), allow_refs=allow_refs)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a uniquely named temporary file then rename, so concurrent processes and threads never read
+    # a partially written file
+    tmp_file = tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=f'{key}.', suffix='.tmp', delete=False)
+    try:
+        with tmp_file:
+            pickle.dump(value, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file.name, cache_path)
+    except BaseException:
+        os.unlink(tmp_file.name)
+        raise
+    return value
+
+
+@lru_cache
+def _matcher_types() -> dict[str, DirtyEqualsMeta]:
+    """
+    Public *dirty-equals* types by name.
+    """
+    import dirty_equals
+
+    types = {}
+    for name in dirty_equals.__all__:
+        value = getattr(dirty_equals, name)
+        if isinstance(value, DirtyEqualsMeta) and value is not DirtyEquals:
+            types[name] = value
+    return types
+
+
+def _is_tagged(spec: dict[Any, Any]) -> bool:
+    return any(type(k) is str and k.startswith('$') for k in spec)
+
+
+def _from_tagged(spec: dict[str, Any]) -> Any:
+    tags = [k for k in spec if k != '$settings']
+    if len(tags) != 1:
+        raise ValueError(f'spec objects with "$" keys must have a single key other than "$settings", got {spec!r}')
+    tag = tags[0]
+    arg = spec[tag]
+
+    build_value = _spec_tags.get(tag)
+    if build_value is not None:
+        if '$settings' in spec:
+            raise ValueError(f'"$settings" can only be used with dirty-equals types, not {tag!r}')
+        return build_value(arg)
+
+    cls: Any = _matcher_types().get(tag[1:])
+    if cls is None:
+        raise ValueError(f'unknown spec key {tag!r}, expected a dirty-equals type or one of: {", ".join(_spec_tags)}')
+    elif arg is None:
+        if '$settings' in spec:
+            raise ValueError('"$settings" cannot be used without creating an instance')
+        return cls
+
+    arg_type = type(arg)
+    if arg_type is list:
+        matcher = cls(*_from_spec(arg))
+    elif arg_type is dict and not _is_tagged({k: v for k, v in arg.items() if k != '$args'}):
+        kwargs = {k: _from_spec(v) for k, v in arg.items()}
+        matcher = cls(*kwargs.pop('$args', ()), **kwargs)
+    else:
+        matcher = cls(_from_spec(arg))
+
+    settings = spec.get('$settings')
+    if settings is not None:
+        matcher = matcher.settings(**_from_spec(settings))
+    return matcher
+
+
+def _to_matcher_spec(matcher: DirtyEquals[Any]) -> dict[str, Any]:
+    if isinstance(matcher, (DirtyOr, DirtyAnd)):
+        return {'$or' if isinstance(matcher, DirtyOr) else '$and': [to_spec(d) for d in matcher.dirties]}
+    elif isinstance(matcher, DirtyNot):
+        return {'$not': to_spec(matcher.subject)}
+    elif isinstance(matcher, Compiled):
+        return {'$compile': to_spec(matcher.expected)}
+
+    matcher_type = type(matcher)
+    name = matcher_type.__name__
+    if _matcher_types().get(name) is not matcher_type:
+        raise TypeError(f'{name} cannot be described by a spec, only public dirty-equals types can be')
+
+    args, kwargs = matcher._spec_args()
+    arg_spec: Any
+    if kwargs:
+        arg_spec = {k: to_spec(v) for k, v in kwargs.items()}
+        if args:
+            arg_spec['$args'] = to_spec(list(args))
+    elif len(args) == 1:
+        arg_spec = to_spec(args[0])
+        # a single argument is used directly, unless it would be mistaken for arguments or the class itself
+        if arg_spec is None or type(arg_spec) is list or (type(arg_spec) is dict and not _is_tagged(arg_spec)):
+            arg_spec = [arg_spec]
+    else:
+        arg_spec = to_spec(list(args)) if args else {}
+
+    spec = {f'${name}': arg_spec}
+    settings = matcher._spec_settings()
+    if settings:
+        spec['$settings'] = to_spec(settings)
+    return spec
+
+
+def _to_ref(value: Any, owner: Any, qualname: str) -> dict[str, str]:
+    ref = f'{owner.__module__}:{qualname}'
+    try:
+        found = _import_ref(ref)
+    except (ImportError, AttributeError, ValueError):
+        found = None
+    if found is not value:
+        raise TypeError(f'{value!r} cannot be described by a spec since it cannot be imported as {ref!r}')
+    return {'$ref': ref}
+
+
+def _ref_tag(ref: str) -> Any:
+    if not _allow_refs.get():
+        raise ValueError(f'"$ref" is only allowed with `allow_refs=True` since it can import any value, got {ref!r}')
+    return _import_ref(ref)
+
+
+def _import_ref(ref: str) -> Any:
+    module_name, sep, qualname = ref.partition(':')
+    if not sep or not qualname:
+        raise ValueError(f'"$ref" must be in the form "module:name", got {ref!r}')
+    value: Any = import_module(module_name)
+    for attr in qualname.split('.'):
+        value = getattr(value, attr)
+    return value
+
+
+def _combine(cls: 'type[Union[DirtyOr, DirtyAnd]]') -> Callable[[Any], Any]:
+    def build(arg: list[Any]) -> Any:
+        if type(arg) is not list or len(arg) < 2:
+            raise ValueError(f'"${cls.__name__[5:].lower()}" requires a list of at least two values, got {arg!r}')
+        return cls(*_from_spec(arg))
+
+    return build
+
+
+# value tags used by `from_spec()`, with functions to build the value from the tag's argument
+_spec_tags: dict[str, Callable[[Any], Any]] = {
+    '$or': _combine(DirtyOr),
+    '$and': _combine(DirtyAnd),
+    '$not': lambda arg: DirtyNot(_from_spec(arg)),
+    '$compile': lambda arg: compile(_from_spec(arg)),
+    '$tuple': lambda arg: tuple(_from_spec(arg)),
+    '$set': lambda arg: set(_from_spec(arg)),
+    '$frozenset': lambda arg: frozenset(_from_spec(arg)),
+    '$dict': lambda arg: {_from_spec(k): _from_spec(v) for k, v in arg},
+    '$bytes': b64decode,
+    '$decimal': Decimal,
+    '$datetime': datetime.fromisoformat,
+    '$date': date.fromisoformat,
+    '$time': time.fromisoformat,
+    '$timedelta': lambda arg: timedelta(seconds=arg),
+    '$timezone': lambda arg: timezone(timedelta(seconds=arg)),
+    '$pattern': lambda arg: re.compile(_from_spec(arg[0]), arg[1]),
+    '$ellipsis': lambda arg: Ellipsis,
+    '$ref': _ref_tag,
+}
+
+# types described by value tags in `to_spec()`, with the tag and a function to get its argument
+_value_tags: dict[type, tuple[str, Callable[[Any], Any]]] = {
+    tuple: ('$tuple', lambda v: [to_spec(x) for x in v]),
+    set: ('$set', lambda v: [to_spec(x) for x in v]),
+    frozenset: ('$frozenset', lambda v: [to_spec(x) for x in v]),
+    bytes: ('$bytes', lambda v: b64encode(v).decode()),
+    Decimal: ('$decimal', str),
+    datetime: ('$datetime', datetime.isoformat),
+    date: ('$date', date.isoformat),
+    time: ('$time', time.isoformat),
+    timedelta: ('$timedelta', timedelta.total_seconds),
+    timezone: ('$timezone', lambda v: v.utcoffset(None).total_seconds()),
+}
@@ -1,6 +1,7 @@
 import re
+from collections.abc import Iterable, Iterator
 from re import Pattern
-from typing import Any, Literal, Optional, TypeVar, Union
+from typing import Any, Callable, Literal, Optional, TypeVar, Union
 
 from ._base import DirtyEquals
 from ._utils import Omit, plain_repr
@@ -19,6 +20,8 @@ class IsAnyStr(DirtyEquals[T]):
     `str` or `bytes` respectively.
     """
 
+    __slots__ = 'min_length', 'max_length', 'case', '_flex', 'regex', 'regex_flags'
+
     expected_types: tuple[type[Any], ...] = (str, bytes)
 
     def __init__(
@@ -75,6 +78,12 @@ class IsAnyStr(DirtyEquals[T]):
             regex_flags=Omit if regex_flags == 0 else plain_repr(repr(re.RegexFlag(regex_flags))),
         )
 
+    def _spec_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        args, kwargs = super()._spec_args()
+        if 'regex_flags' in kwargs:
+            kwargs['regex_flags'] = int(self.regex_flags)
+        return args, kwargs
+
     def equals(self, other: Any) -> bool:
         if type(other) not in self.expected_types:
             return False
@@ -101,6 +110,42 @@ class IsAnyStr(DirtyEquals[T]):
 
         return True
 
+    def _matches_many(self, values: Iterable[Any]) -> Iterable[Any]:
+        if type(self).equals is not IsAnyStr.equals:
+            return super()._matches_many(values)
+        # compile the regex once, rather than finding it in `re`'s cache for every value
+        fullmatch = None if self.regex is None else re.compile(self.regex, self.regex_flags).fullmatch
+        return self._str_verdicts(values, fullmatch)
+
+    def _str_verdicts(self, values: Iterable[Any], fullmatch: Optional[Callable[[Any], Any]]) -> Iterator[bool]:
+        expected_types = self.expected_types
+        encode = self._flex and fullmatch is not None
+        min_length = self.min_length or 0
+        max_length = self.max_length
+        case = self.case
+        for other in values:
+            try:
+                if type(other) not in expected_types:
+                    yield False
+                    continue
+                if fullmatch is not None:
+                    if encode and type(other) is str:
+                        other = other.encode()
+                    if not fullmatch(other):
+                        yield False
+                        continue
+                len_ = len(other)
+                if len_ < min_length or (max_length is not None and len_ > max_length):
+                    yield False
+                elif case == 'upper':
+                    yield other.isupper()
+                elif case == 'lower':
+                    yield other.islower()
+                else:
+                    yield True
+            except (TypeError, ValueError):
+                yield False
+
     def _prepare_regex(self, regex: Union[T, Pattern[T]], regex_flags: int) -> tuple[Union[T, Pattern[T]], int]:
         if isinstance(regex, re.Pattern):
             if self._flex:
@@ -136,6 +181,8 @@ class IsStr(IsAnyStr[str]):
     ```
     """
 
+    __slots__ = ()
+
     expected_types = (str,)
 
 
@@ -157,4 +204,6 @@ class IsBytes(IsAnyStr[bytes]):
     ```
     """
 
+    __slots__ = ()
+
     expected_types = (bytes,)
@@ -1,6 +1,7 @@
-__all__ = 'plain_repr', 'PlainRepr', 'Omit', 'get_dict_arg'
+__all__ = 'plain_repr', 'PlainRepr', 'Omit', 'Reject', 'get_dict_arg', 'bounded_repr'
 
-from typing import Any
+import sys
+from typing import Any, Callable, Optional
 
 
 class PlainRepr:
@@ -14,13 +15,44 @@ class PlainRepr:
     def __repr__(self) -> str:
         return self.v
 
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, PlainRepr) and other.v == self.v
+
+    def __hash__(self) -> int:
+        return hash(self.v)
+
 
 def plain_repr(v: str) -> PlainRepr:
     return PlainRepr(v)
 
 
+class _Sentinel:
+    """
+    A unique marker object, pickled and copied by reference so identity checks still work after unpickling.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __reduce__(self) -> str:
+        return self.name
+
+
 # used to omit arguments from repr
-Omit = object()
+Omit = _Sentinel('Omit')
+
+# returned by `prepare()` methods when a value can't be equal, raising and catching an exception for every
+# rejected value is much slower, typed as `Any` so it can be returned in place of any prepared value
+Reject: Any = _Sentinel('Reject')
+
+# exact types whose instances are only equal to values with the same hash, so they can be found by hash,
+# apart from NaN since `nan != nan`
+_literal_types = frozenset({str, bytes, int, float, complex, bool, type(None)})
 
 
 def get_dict_arg(
@@ -44,3 +76,89 @@ def get_dict_arg(
         raise TypeError(f'{name} expected at most 1 argument, got {len(expected_args)}')
 
     return value
+
+
+def bounded_repr(value: Any, max_chars: Optional[int], max_nodes: Optional[int]) -> tuple[str, bool]:
+    """
+    Like `repr(value)`, but dicts, lists, tuples and sets are elided with `...` once `max_nodes` values have
+    been included or the output reaches `max_chars` characters, similar to `reprlib`.
+
+    Returns the repr, and whether it's complete (i.e. the same as `repr(value)`).
+    """
+    if max_chars is None and max_nodes is None:
+        return repr(value), True
+
+    chars = sys.maxsize if max_chars is None else max_chars
+    builder = _BoundedRepr(chars, sys.maxsize if max_nodes is None else max_nodes)
+    builder.walk(value)
+    r = ''.join(builder.parts)
+    if len(r) > chars:
+        return f'{r[: max(chars - 3, 0)]}...', False
+    return r, builder.complete
+
+
+class _BoundedRepr:
+    __slots__ = 'chars', 'nodes', 'parts', 'length', 'complete', 'active'
+
+    def __init__(self, chars: int, nodes: int):
+        self.chars = chars
+        self.nodes = nodes
+        self.parts: list[str] = []
+        self.length = 0
+        self.complete = True
+        # ids of containers being formatted, to catch recursive containers
+        self.active: set[int] = set()
+
+    def add(self, s: str) -> None:
+        self.parts.append(s)
+        self.length += len(s)
+
+    def exhausted(self) -> bool:
+        if self.nodes <= 0 or self.length >= self.chars:
+            self.complete = False
+            self.add('...')
+            return True
+        return False
+
+    def walk(self, v: Any) -> None:
+        if self.exhausted():
+            return
+        self.nodes -= 1
+        t = type(v)
+        if t in _recursive_reprs and id(v) in self.active:
+            self.add(_recursive_reprs[t])
+        elif t is list:
+            self.items(v, '[', ']', self.walk)
+        elif t is tuple:
+            self.items(v, '(', ',)' if len(v) == 1 else ')', self.walk)
+        elif t is dict:
+            self.items(v.items(), '{', '}', self.walk_item, id(v))
+        elif t is set and v:
+            self.items(v, '{', '}', self.walk)
+        elif t is frozenset and v:
+            self.items(v, 'frozenset({', '})', self.walk)
+        elif (t is str or t is bytes) and len(v) > self.chars:
+            self.add(repr(v[: self.chars]))
+        else:
+            self.add(repr(v))
+
+    def walk_item(self, item: tuple[Any, Any]) -> None:
+        self.walk(item[0])
+        self.add(': ')
+        self.walk(item[1])
+
+    def items(self, v: Any, left: str, right: str, func: Callable[[Any], None], v_id: Optional[int] = None) -> None:
+        v_id = id(v) if v_id is None else v_id
+        self.active.add(v_id)
+        self.add(left)
+        for i, item in enumerate(v):
+            if i:
+                self.add(', ')
+            if self.exhausted():
+                break
+            func(item)
+        self.add(right)
+        self.active.discard(v_id)
+
+
+_recursive_reprs: dict[type, str] = {list: '[...]', tuple: '(...)', dict: '{...}'}
@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+from dirty_equals import (
+    AnyThing,
+    Contains,
+    HasLen,
+    IsApprox,
+    IsInt,
+    IsList,
+    IsListOrTuple,
+    IsPositiveInt,
+    IsStr,
+    IsTuple,
+    MatchResult,
+    amatch,
+)
+
+
+async def stream(items, consumed=None):
+    for item in items:
+        if consumed is not None:
+            consumed.append(item)
+        yield item
+
+
+def run_amatch(matcher, source):
+    return asyncio.run(amatch(matcher, source))
+
+
+@pytest.mark.parametrize(
+    'matcher',
+    [
+        IsList(1, 2, 3),
+        IsList(1, IsInt, 3),
+        IsList(1, 2, length=...),
+        IsList(1, 2, length=4),
+        IsList(1, 2, length=(3, 4)),
+        IsListOrTuple(3, 1, 2, check_order=False),
+        IsList(3, check_order=False, length=(0, ...)),
+        IsList(2, 1, check_order=False, length=(2, 3)),
+        IsList(positions={0: 1, 2: 3}),
+        IsList(positions={1: 2}, length=3),
+        IsList(positions={-1: 3, 0: 1}),
+        IsList(positions={-2: IsInt, -3: 1}),
+        IsList(positions={1: 2}, length=(0, 2)),
+        IsList(positions={(1, None): [2, 3], 0: 1}),
+        IsList(positions={(-2, None): HasLen(2)}),
+        IsList(AnyThing, length=(1, ...)),
+        HasLen(3),
+        HasLen(2, ...),
+        HasLen(0, 2),
+        Contains(3),
+        Contains(1, 3),
+        Contains(5),
+        IsInt,
+        [1, 2, 3],
+        [IsInt, IsInt],
+    ],
+)
+@pytest.mark.parametrize('items', [[], [1], [1, 2], [1, 2, 3], [3, 1, 2], [1, 2, 3, 4], [1, 'x', 3, 4, 5]])
+def test_same_as_list(matcher, items):
+    expected = items == matcher
+    result = run_amatch(matcher, stream(items))
+    assert isinstance(result, MatchResult)
+    assert result.matched is expected
+
+
+@pytest.mark.parametrize(
+    'matcher,consumed',
+    [
+        (IsList(0, 1, 2), 4),
+        (IsList(0, 9, 2), 2),
+        (IsList(0, 1, length=...), 2),
+        (IsList(0, 1), 3),
+        (IsList(positions={3: 3}), 4),
+        (IsList(3, 2, check_order=False), 3),
+        (HasLen(5, ...), 5),
+        (HasLen(0, 2), 3),
+        (Contains(2, 4), 5),
+    ],
+)
+def test_stops_early(matcher, consumed):
+    seen = []
+    run_amatch(matcher, stream(range(1_000), seen))
+    assert len(seen) == consumed
+
+
+def test_negative_positions_window():
+    result = run_amatch(IsList(positions={0: 0, -1: 999, -3: 997}), stream(range(1_000)))
+    assert result
+    assert not run_amatch(IsList(positions={-1: 998}), stream(range(1_000)))
+
+
+def test_is_tuple_stream():
+    # the type of a stream isn't checked
+    assert run_amatch(IsTuple(1, 2), stream([1, 2]))
+
+
+def test_awaitable():
+    async def get():
+        return [1, 2]
+
+    result = run_amatch(IsList(1, 2), get())
+    assert result
+    assert result.value == [1, 2]
+    assert not run_amatch(IsStr, get())
+
+    async def get_stream():
+        return stream([1, 2])
+
+    assert run_amatch(IsList(IsPositiveInt, 2), get_stream())
+
+
+def test_not_async():
+    assert run_amatch(IsList(1, 2), [1, 2])
+    assert not run_amatch(IsInt, 'x')
+
+
+nan = float('nan')
+
+
+@pytest.mark.parametrize(
+    'matcher,items',
+    [
+        (IsList(nan), [nan]),
+        (IsList(1, nan, length=...), [1, nan, 2]),
+        (IsList(positions={1: nan}), [1, nan]),
+        (IsList(positions={-1: nan}), [1, nan]),
+        (IsList(positions={0: 1, -2: nan}), [1, nan, 3]),
+    ],
+)
+def test_identical_nan(matcher, items):
+    # identical values are equal, like in a list, even NaN which isn't equal to itself
+    assert items == matcher
+    assert run_amatch(matcher, stream(items))
+    assert not run_amatch(matcher, stream([float('nan') if v is nan else v for v in items]))
+
+
+def test_not_instantiable_class():
+    # like `1 != IsApprox`, a class which can't be created without arguments doesn't match
+    result = run_amatch(IsApprox, 1)
+    assert isinstance(result, MatchResult)
+    assert result.matched is False
+    assert result.other == 1
+    assert not run_amatch(IsApprox, stream([1]))
+    assert run_amatch(IsInt, 1)
+
+
+def test_stateless():
+    inner = IsInt()
+    matcher = IsList(inner, length=...)
+    assert run_amatch(matcher, stream([1, 2]))
+    assert run_amatch(IsInt(), stream([])).matched is False
+    assert repr(inner) == 'IsInt()'
+    assert repr(matcher) == 'IsList(IsInt(), length=(0, ...))'
+
+
+def test_closes_generator():
+    closed = []
+
+    async def numbers():
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            closed.append(True)
+
+    assert run_amatch(IsList(0, length=...), numbers())
+    assert closed == [True]
@@ -1,11 +1,35 @@
+import copy
+import gc
+import pickle
 import platform
 import pprint
+import time
+import weakref
+from decimal import Decimal
+from enum import IntEnum
 from functools import singledispatch
+from typing import Generic
 
 import packaging.version
 import pytest
 
-from dirty_equals import Contains, DirtyEquals, IsApprox, IsInt, IsList, IsNegative, IsOneOf, IsPositive, IsStr
+import dirty_equals
+from dirty_equals import (
+    AnyThing,
+    Contains,
+    DirtyEquals,
+    FunctionCheck,
+    IsApprox,
+    IsDict,
+    IsInt,
+    IsList,
+    IsNegative,
+    IsOneOf,
+    IsPositive,
+    IsStr,
+    MatchManyResult,
+    MatchResult,
+)
 from dirty_equals.version import VERSION
 
 
@@ -34,6 +58,98 @@ def test_not():
     assert 'foo' == ~IsInt
 
 
+def test_or_flattened():
+    a, b, c = IsStr(), IsNegative(), IsPositive()
+    for v in a | b | c, a | (b | c), (a | b) | (c | IsInt):
+        assert type(v).__name__ == 'DirtyOr'
+        assert all(type(d).__name__ != 'DirtyOr' for d in v.dirties)
+    assert (a | b | c).dirties == (a, b, c)
+    assert (IsStr | IsInt | IsNegative).dirties == (IsStr, IsInt, IsNegative)
+    assert str(IsStr | (IsInt | IsNegative)) == 'IsStr | IsInt | IsNegative'
+
+
+def test_and_flattened():
+    v = IsInt & (IsPositive & IsInt(lt=5)) & ~IsStr
+    assert len(v.dirties) == 4
+    assert str(v) == 'IsInt & IsPositive & IsInt(lt=5) & ~IsStr'
+    assert 4 == v
+    assert 5 != v
+    # mixed operators are not merged
+    assert len((IsInt & IsPositive | IsStr).dirties) == 2
+
+
+def test_adaptive_not_flattened():
+    adaptive = (IsStr | IsInt).adaptive()
+    v = adaptive | IsNegative
+    assert v.dirties == (adaptive, IsNegative)
+
+
+def test_long_chain():
+    v = IsInt(exactly=0)
+    for i in range(1, 5000):
+        v = v | IsInt(exactly=i)
+    assert len(v.dirties) == 5000
+    assert 4999 == v
+    assert 5000 != v
+
+
+def test_double_not():
+    is_int = IsInt()
+    assert ~~is_int is is_int
+    assert ~~IsInt is IsInt
+    assert str(~~~IsInt) == '~IsInt'
+    assert 'foo' != ~~IsInt
+
+
+class Slow(DirtyEquals[str]):
+    cost_hint = 1000
+
+    def equals(self, other):
+        time.sleep(0.0001)
+        return other == 'slow'
+
+
+def test_or_adaptive():
+    v = (Slow() | IsInt).adaptive()
+    assert v._branches.order == (1, 0)  # by cost_hint
+    for i in range(100):
+        assert i == v
+    assert 'slow' == v
+    assert 'other' != v
+    assert v._branches.order == (1, 0)
+    assert v._branches.calls == [2, 102]
+    assert v._repr_ne() == 'Slow() | IsInt'
+
+
+def test_or_adaptive_pass_rate():
+    v = (IsStr | IsInt).adaptive()
+    assert v._branches.order == (0, 1)
+    for i in range(100):
+        assert i == v
+    assert v._branches.order == (1, 0)
+    assert 'x' == v
+    assert 1.5 != v
+
+
+def test_and_adaptive():
+    v = (FunctionCheck(lambda x: time.sleep(0.001) or x == 'slow') & IsStr()).adaptive()
+    assert v._branches.order == (1, 0)
+    for i in range(50):
+        assert i != v
+    assert 'slow' == v
+    assert v._branches.order == (1, 0)
+    assert v._branches.calls == [1, 51]
+    assert v._repr_ne() == 'FunctionCheck(<lambda>) & IsStr()'
+
+
+@pytest.mark.parametrize('value', [1, -1, 'x', 1.5, None, [1]])
+def test_adaptive_same_result(value):
+    for v in IsStr | IsNegative | IsPositive, IsInt & IsPositive & ~IsStr:
+        adaptive = v.adaptive()
+        for _ in range(40):
+            assert (value == adaptive) is (value == v)
+
+
 def test_value_eq():
     v = IsStr()
 
@@ -56,6 +172,85 @@ def test_value_ne():
         v.value
 
 
+def test_match():
+    v = IsStr()
+    result = v.match('foo')
+    assert isinstance(result, MatchResult)
+    assert result
+    assert result.value == 'foo'
+    assert repr(result) == "MatchResult(matched=True, other='foo')"
+    assert repr(v) == 'IsStr()'
+    with pytest.raises(AttributeError, match='value is not available until __eq__ has been called'):
+        v.value
+
+
+def test_match_fails():
+    result = IsInt().match('foo')
+    assert not result
+    assert result.matched is False
+    with pytest.raises(AttributeError, match='value is not available since the comparison failed'):
+        result.value
+
+
+def test_match_nested_stateless():
+    inner = IsInt()
+    outer = IsDict(a=inner, b=IsList(inner, ~IsStr()))
+    assert outer.match({'a': 1, 'b': [2, 3]})
+    assert not outer.match({'a': 1, 'b': [2, 'x']})
+    assert repr(inner) == 'IsInt()'
+    assert repr(outer) == 'IsDict(a=IsInt(), b=IsList(IsInt(), ~IsStr()))'
+
+    # normal comparisons still record state after match() has been used
+    assert 1 == inner
+    assert repr(inner) == '1'
+
+
+def test_match_many():
+    v = IsInt(gt=0)
+    result = v.match_many([1, 2, -3, 4, 'x'])
+    assert isinstance(result, MatchManyResult)
+    assert not result
+    assert result.first_failure == 2
+    assert len(result) == 3
+    assert repr(result) == 'MatchManyResult(count=3, first_failure=2)'
+    assert result[1] is True
+    assert result[2] is False
+    with pytest.raises(IndexError, match='index out of range'):
+        result[3]
+    with pytest.raises(AttributeError, match='failures are only available with verdicts=True'):
+        result.failures
+    assert repr(v) == 'IsInt(gt=0)'
+
+    result = v.match_many(iter(range(1, 20)))
+    assert result
+    assert result.first_failure is None
+    assert len(result) == 19
+    assert result[-1] is True
+
+
+@pytest.mark.parametrize('count', [0, 1, 7, 8, 9, 100])
+def test_match_many_verdicts(count):
+    values = [i if i % 3 else str(i) for i in range(count)]
+    result = IsInt().match_many(values, verdicts=True)
+    assert list(result) == [v == IsInt for v in values]
+    assert result.failures == [i for i in range(0, count, 3)]
+    assert result.first_failure == (0 if count else None)
+    assert len(result.bitmap) == (count + 7) // 8
+    with pytest.raises(IndexError):
+        result[count]
+
+
+def test_match_many_custom():
+    class IsEven(DirtyEquals[int]):
+        def equals(self, other):
+            return other % 2 == 0
+
+    inner = IsEven()
+    result = IsList(inner, inner).match_many([[2, 4], [2, 3], 'x', [None, 2]], verdicts=True)
+    assert list(result) == [True, False, False, False]
+    assert repr(inner) == 'IsEven()'
+
+
 def test_dict_compare():
     v = {'foo': 1, 'bar': 2, 'spam': 3}
     assert v == {'foo': IsInt, 'bar': IsPositive, 'spam': ~IsStr}
@@ -185,16 +380,478 @@ def test_pprint_not_equal():
         ([1, 2, 3], Contains(1) | IsOneOf([])),
         ([], Contains(1) | IsOneOf([])),
         ([2], ~(Contains(1) | IsOneOf([]))),
+        (True, IsOneOf(1, 2)),
+        (1, IsOneOf(True)),
+        (1.0, IsOneOf(1)),
+        (1, IsOneOf(1 + 0j)),
+        (2, IsOneOf('x', IsInt(gt=1))),
+        (b'x', IsOneOf('x', b'x')),
+        ('x', ~IsOneOf(b'x')),
+        (float('nan'), ~IsOneOf(float('nan'))),
+        (Decimal(1), IsOneOf(1)),
+        (IntEnum('E', 'a').a, IsOneOf(1)),
+        ('a', IsOneOf(*(str(i) for i in range(1000)), 'a')),
     ],
 )
 def test_is_one_of(value, dirty):
     assert value == dirty
 
 
+def test_is_one_of_split():
+    v = IsOneOf(1, 'a', None, [], IsInt, float('nan'), 'a')
+    assert v._literals == {1, 'a', None}
+    assert len(v._residual) == 3
+    assert repr(v) == "IsOneOf(1, 'a', None, [], IsInt, nan, 'a')"
+
+
+def test_is_one_of_custom_eq():
+    class EqualsEverything:
+        def __eq__(self, other):
+            return True
+
+        def __hash__(self):
+            return 1
+
+    assert EqualsEverything() == IsOneOf(1, 2)
+
+
+def test_repr_bounded():
+    v = IsList(length=...)
+    value = list(range(100_000))
+    assert value == v
+    r = repr(v)
+    assert r.startswith('[0, 1, 2, 3, ')
+    assert r.endswith(', 4998, ...]')
+    assert pprint.pformat(v) == r
+
+    small = IsList(length=...)
+    assert [1, 2] == small
+    assert repr(small) == '[1, 2]'
+
+
+def test_repr_bounded_chars():
+    v = IsStr()
+    assert 'x' * 100_000 == v
+    assert len(repr(v)) == 50_000
+    assert repr(v).endswith('xxx...')
+
+
+def test_repr_budget(monkeypatch):
+    v = IsDict(a=IsList(length=...))
+    assert {'a': [1, 2, 3]} == v
+    monkeypatch.setattr(DirtyEquals, 'repr_max_nodes', 4)
+    assert repr(v) == "{'a': [1, ...]}"
+    assert pprint.pformat(v) == "{'a': [1, ...]}"
+    assert pprint.pformat(v.expected_values['a']) == '[1, 2, 3]'
+    monkeypatch.setattr(DirtyEquals, 'repr_max_nodes', None)
+    assert repr(v) == "{'a': [1, 2, 3]}"
+    monkeypatch.setattr(DirtyEquals, 'repr_max_chars', 8)
+    assert repr(v) == "{'a':..."
+
+
+def test_repr_ne_cached():
+    calls = 0
+
+    class CountRepr(IsDict):
+        def _repr_ne(self):
+            nonlocal calls
+            calls += 1
+            return super()._repr_ne()
+
+    v = CountRepr(a=1, b=[1])
+    assert repr(v) == repr(v) == 'CountRepr(a=1, b=[1])'
+    assert str(IsStr | v) == 'IsStr | CountRepr(a=1, b=[1])'
+    assert calls == 1
+
+    strict = v.settings(strict=True)
+    assert repr(strict) == 'CountRepr[strict=True](a=1, b=[1])'
+    assert calls == 2
+
+
+def test_repr_ne_nested_not_cached():
+    is_int = IsInt()
+    v = IsDict(a=is_int, b=[IsStr()])
+    assert repr(v) == 'IsDict(a=IsInt(), b=[IsStr()])'
+    assert v._repr_cache is False
+
+    # comparing changes the repr of nested types
+    assert 1 == is_int
+    assert repr(v) == 'IsDict(a=1, b=[IsStr()])'
+
+
+class Weakrefable:
+    def __repr__(self):
+        return 'Weakrefable()'
+
+
+def test_retention_strong():
+    v = AnyThing()
+    obj = Weakrefable()
+    assert obj == v
+    del obj
+    gc.collect()
+    assert repr(v) == 'Weakrefable()'
+    assert isinstance(v.value, Weakrefable)
+
+
+def test_retention_weak():
+    v = AnyThing()
+    v.retain('weak')
+    obj = Weakrefable()
+    assert obj == v
+    assert repr(v) == 'Weakrefable()'
+    assert pprint.pformat(v) == 'Weakrefable()'
+    assert v.value is obj
+    del obj
+    gc.collect()
+    assert repr(v) == 'AnyThing()'
+    with pytest.raises(AttributeError, match="value is not available since it was not retained, retention='weak'"):
+        v.value
+
+
+@pytest.mark.parametrize(
+    'other,retained',
+    [
+        (123, True),
+        (1.5, True),
+        (None, True),
+        ('x' * 1_000, True),
+        ('x' * 1_001, False),
+        (b'abc', True),
+        ([1, 2, 3], False),
+        ({'a': 1}, False),
+    ],
+)
+def test_retention_weak_not_weakrefable(other, retained):
+    v = AnyThing()
+    v.retain('weak')
+    assert other == v
+    if retained:
+        assert v.value is other
+        assert repr(v) == repr(other)
+    else:
+        assert repr(v) == 'AnyThing()'
+
+
+def test_retention_none():
+    v = IsDict(a=IsInt)
+    assert v.retain('none') is v
+    assert {'a': 1} == v
+    assert repr(v) == 'IsDict(a=IsInt)'
+    assert pprint.pformat(v) == 'IsDict(a=IsInt)'
+    with pytest.raises(AttributeError, match="value is not available since it was not retained, retention='none'"):
+        v.value
+    assert {'a': 'x'} != v
+    assert repr(v) == 'IsDict(a=IsInt)'
+
+
+def test_retention_global(monkeypatch):
+    monkeypatch.setattr(DirtyEquals, 'retention', 'none')
+    v = IsDict(a=IsInt())
+    assert {'a': 1} == v
+    assert repr(v) == 'IsDict(a=IsInt())'
+
+    # instances can opt back in
+    v.retain('strong')
+    assert {'a': 1} == v
+    assert repr(v) == "{'a': 1}"
+
+
+def test_retention_invalid():
+    v = IsInt()
+    with pytest.raises(ValueError, match="retention must be 'strong', 'weak' or 'none', not 'sometimes'"):
+        v.retain('sometimes')  # type: ignore[arg-type]
+    assert v == 1
+    assert repr(v) == '1'
+
+
+def test_retention_invalid_class(monkeypatch):
+    monkeypatch.setattr(IsInt, 'retention', 'sometimes')
+    with pytest.raises(ValueError, match="retention must be 'strong', 'weak' or 'none', not 'sometimes'"):
+        IsInt() == 1
+
+
+def test_retention_weak_list():
+    v = IsList(1, 2).retain('weak')
+    assert [1, 2] == v
+    # lists can't be weakly referenced
+    assert repr(v) == 'IsList(1, 2)'
+
+
+def test_retention_freeze():
+    v = IsInt()
+    v.retain('none')
+    assert v.freeze() is IsInt().freeze()
+
+
 def test_version():
     packaging.version.parse(VERSION)
 
 
+def test_class_default_instance():
+    assert 1 == IsInt
+    default = IsInt.__dict__['_dirty_equals_default']
+    assert type(default) is IsInt
+    assert 'x' != IsInt
+    assert 2 == IsInt
+    assert IsInt.__dict__['_dirty_equals_default'] is default
+    assert repr(default) == 'IsInt()'
+    # subclasses get their own instance
+    assert -1 != IsPositive
+    assert type(IsPositive.__dict__['_dirty_equals_default']) is IsPositive
+
+
+def test_class_not_instantiable():
+    calls = 0
+
+    class NeedsArg(DirtyEquals[int]):
+        def __init__(self, arg):
+            nonlocal calls
+            calls += 1
+            super().__init__(arg)
+
+        def equals(self, other):
+            return True
+
+    assert 1 != NeedsArg
+    assert 2 != NeedsArg
+    assert 2 == NeedsArg(1)
+    assert calls == 1
+
+
+def test_class_custom_eq():
+    class RecordsEq(DirtyEquals[int]):
+        instances = []
+
+        def __init__(self):
+            self.instances.append(self)
+            super().__init__()
+
+        def equals(self, other):
+            return other == 1
+
+        def __eq__(self, other):
+            return super().__eq__(other)
+
+    assert 1 == RecordsEq
+    assert 2 != RecordsEq
+    # the cached instance plus a new one for each comparison
+    assert len(RecordsEq.instances) == 3
+
+
+def test_freeze():
+    is_a = IsStr(regex='a.*')
+    frozen = is_a.freeze()
+    assert frozen is not is_a
+    assert frozen is IsStr(regex='a.*').freeze()
+    assert frozen.freeze() is frozen
+    assert frozen is not IsStr(regex='b.*').freeze()
+    assert hash(frozen) == hash(IsStr(regex='a.*').freeze())
+
+    assert 'apple' == frozen
+    assert 'banana' != frozen
+    assert repr(frozen) == "IsStr(regex='a.*')"
+
+    assert 'apple' == is_a
+    assert is_a.freeze() is frozen
+    assert repr(is_a) == "'apple'"
+
+
+def test_freeze_nested():
+    frozen = IsDict(a=IsInt(gt=1), b=[IsStr | IsInt]).freeze()
+    assert frozen is IsDict(a=IsInt(gt=1), b=[IsStr | IsInt]).freeze()
+    assert frozen.expected_values['a'] is IsInt(gt=1).freeze()
+    assert frozen.expected_values['b'][0] is (IsStr | IsInt).freeze()
+    assert {'a': 2, 'b': ['x']} == frozen
+    assert repr(frozen.expected_values['a']) == 'IsInt(gt=1)'
+
+
+@pytest.mark.parametrize(
+    'a,b',
+    [
+        (IsOneOf(1), IsOneOf(True)),
+        (IsOneOf(1), IsOneOf(1.0)),
+        (IsOneOf([1]), IsOneOf((1,))),
+        (~AnyThing, ~IsInt),
+        (IsInt | IsStr, IsStr | IsInt),
+        (IsDict(a=1), IsDict(a=1).settings(strict=True)),
+    ],
+    ids=repr,
+)
+def test_freeze_different(a, b):
+    assert a.freeze() is not b.freeze()
+
+
+def test_freeze_unhashable():
+    with pytest.raises(TypeError, match=r"unhashable type: 'IsInt', use `.freeze\(\)` to get a hashable object"):
+        hash(IsInt())
+    with pytest.raises(TypeError, match="unhashable type: 'bytearray'"):
+        IsOneOf(bytearray(b'x')).freeze()
+    with pytest.raises(TypeError, match='adaptive comparisons cannot be frozen'):
+        (IsInt | IsStr).adaptive().freeze()
+
+
+def test_freeze_settings():
+    frozen = IsDict(a=1).freeze()
+    modified = frozen.settings(partial=True)
+    assert {'a': 1, 'b': 2} == modified
+    assert repr(modified) == "{'a': 1, 'b': 2}"
+    assert modified.freeze() is IsDict(a=1).settings(partial=True).freeze()
+
+
+def test_freeze_weak():
+    frozen = IsInt(gt=123456).freeze()
+    key = frozen._frozen[0]
+    assert key in dirty_equals._base._interned
+    del frozen
+    gc.collect()
+    assert key not in dirty_equals._base._interned
+
+
+def test_slots():
+    for name in dirty_equals.__all__:
+        value = getattr(dirty_equals, name)
+        if isinstance(value, type) and issubclass(value, DirtyEquals):
+            for cls in value.__mro__:
+                if cls not in (Generic, object):
+                    assert '__slots__' in cls.__dict__, cls
+
+
+def test_slots_no_dict():
+    assert not hasattr(IsDict(a=IsInt(gt=1)), '__dict__')
+    assert not hasattr(IsStr | IsInt, '__dict__')
+    v = IsInt()
+    assert weakref.ref(v)() is v
+
+
+def test_settings_clone():
+    v = IsDict(a=IsInt)
+    assert {'a': 1} == v
+    strict = v.settings(strict=True)
+    assert (strict.strict, v.strict) == (True, False)
+    assert strict.expected_values is v.expected_values
+    assert repr(strict) == 'IsDict[strict=True](a=IsInt)'
+
+
+def test_subclass_without_init():
+    class IsEven(DirtyEquals[int]):
+        def __init__(self):
+            pass
+
+        def equals(self, other):
+            return other % 2 == 0
+
+    v = IsEven()
+    assert 2 == v
+    assert repr(v) == '2'
+    assert 3 != v
+    assert v.freeze() is IsEven().freeze()
+
+
+def test_subclass_without_slots():
+    class IsMultiple(DirtyEquals[int]):
+        def __init__(self, n):
+            self.n = n
+            super().__init__(n)
+
+        def equals(self, other):
+            return other % self.n == 0
+
+    assert 4 == IsMultiple(2)
+    assert IsMultiple(2).freeze() is IsMultiple(2).freeze()
+    assert IsMultiple(2).freeze() is not IsMultiple(3).freeze()
+
+
+def is_even(v):
+    return v % 2 == 0
+
+
+@pytest.mark.parametrize(
+    'dirty,value',
+    [
+        (IsInt(gt=1), 2),
+        (IsStr(regex=r'\d+'), '123'),
+        (IsOneOf(1, [2]), [2]),
+        (IsDict(a=IsInt, b=IsList(IsStr, length=...)).settings(partial=True), {'a': 1, 'b': ['x'], 'c': 3}),
+        (IsInt | IsStr, 'x'),
+        ((IsPositive | IsStr).adaptive(), 1),
+        (~IsInt, 'x'),
+        (FunctionCheck(is_even), 4),
+        (Contains(1, 2), [1, 2, 3]),
+    ],
+)
+def test_pickle(dirty, value):
+    expected_repr = repr(dirty)
+    unpickled = pickle.loads(pickle.dumps(dirty))
+    assert type(unpickled) is type(dirty)
+    assert repr(unpickled) == expected_repr
+    assert value == unpickled
+    assert repr(unpickled) == repr(value)
+
+
+def test_pickle_state():
+    v = IsStr()
+    assert 'response body' == v
+    assert b'response body' not in pickle.dumps(v)
+    unpickled = pickle.loads(pickle.dumps(v))
+    assert repr(unpickled) == 'IsStr()'
+    with pytest.raises(AttributeError, match='value is not available until __eq__ has been called'):
+        unpickled.value
+
+
+def test_pickle_frozen():
+    v = IsDict(a=IsInt(gt=1)).freeze()
+    assert pickle.loads(pickle.dumps(v)) is v
+    assert copy.copy(v) is v
+    assert copy.deepcopy(v) is v
+
+
+def test_pickle_retention():
+    v = pickle.loads(pickle.dumps(IsInt().retain('none')))
+    assert 1 == v
+    assert repr(v) == 'IsInt()'
+
+
+def test_pickle_lambda():
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(FunctionCheck(lambda x: x > 0))
+
+
+def test_copy():
+    v = IsDict(a=IsInt)
+    assert {'a': 1} == v
+    copied = copy.copy(v)
+    assert copied.expected_values is v.expected_values
+    assert repr(copied) == 'IsDict(a=IsInt)'
+    assert repr(v) == "{'a': 1}"
+
+
+def test_deepcopy():
+    inner = IsInt(gt=1)
+    v = IsDict(a=inner, b=[inner])
+    copied = copy.deepcopy(v)
+    assert copied.expected_values is not v.expected_values
+    assert copied.expected_values['a'] is not inner
+    assert copied.expected_values['b'][0] is copied.expected_values['a']
+    assert {'a': 2, 'b': [3]} == copied
+    assert repr(inner) == 'IsInt(gt=1)'
+
+
+def test_copy_subclass_without_slots():
+    class IsMultiple(DirtyEquals[int]):
+        def __init__(self, n):
+            self.n = n
+            super().__init__(n)
+
+        def equals(self, other):
+            return other % self.n == 0
+
+    v = copy.deepcopy(IsMultiple(3))
+    assert v.n == 3
+    assert 6 == v
+    assert repr(copy.copy(v)) == 'IsMultiple(3)'
+
+
 def test_singledispatch():
     @singledispatch
     def dispatch(value):
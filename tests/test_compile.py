@@ -0,0 +1,199 @@
+import pickle
+import re
+from collections import OrderedDict
+from decimal import Decimal
+
+import pytest
+
+import dirty_equals
+from dirty_equals import (
+    AnyThing,
+    Contains,
+    FunctionCheck,
+    HasAttributes,
+    HasLen,
+    IsApprox,
+    IsBytes,
+    IsDict,
+    IsFloat,
+    IsInt,
+    IsList,
+    IsListOrTuple,
+    IsNegative,
+    IsNumeric,
+    IsOneOf,
+    IsPartialDict,
+    IsPositiveInt,
+    IsStr,
+    IsStrictDict,
+    IsTuple,
+)
+
+nan = float('nan')
+inf = float('inf')
+
+expectations = [
+    1,
+    'foo',
+    None,
+    nan,
+    [1, 2, 3],
+    (1, 'a'),
+    {'a': 1, 'b': [1, 2]},
+    {'a': IsInt, 'b': IsStr},
+    {'a': IsInt(gt=1, le=10), 'b': IsFloat(exactly=1.5), 'c': IsPositiveInt, 'd': IsNegative},
+    {'a': IsStr(regex=r'\d+'), 'b': IsStr(min_length=2, max_length=3, case='upper'), 'c': IsBytes(case='lower')},
+    {'a': IsStr(regex=re.compile('a.', re.I)), 'b': IsStr(regex='b.', regex_flags=re.I), 'c': IsStr(regex=b'x')},
+    [IsInt | IsStr, IsInt & IsPositiveInt, ~IsInt, ~IsStr(), IsOneOf(1, 2) | IsOneOf('x')],
+    IsDict(a=IsInt, b=[IsStr]),
+    IsPartialDict(a=IsInt),
+    IsStrictDict(a=1, b=2),
+    IsPartialDict(a=1, c=3).settings(strict=True),
+    IsPartialDict(),
+    IsPartialDict().settings(strict=True),
+    IsDict().settings(partial=True),
+    {'a': IsPartialDict()},
+    IsDict(a=1, b=None).settings(ignore={None}),
+    IsList(1, IsInt, 3),
+    IsList(1, 2, length=...),
+    IsList(1, 2, length=(3, 4)),
+    IsList(1, length=3),
+    IsTuple(1, IsStr),
+    IsListOrTuple(1, 2),
+    IsList(1, 2, check_order=False),
+    IsList(positions={0: 1, -1: 3}),
+    {'a': IsApprox(10), 'b': IsNumeric(gt=Decimal(1)), 'c': HasLen(2), 'd': Contains(1)},
+    {'a': IsApprox, 'b': AnyThing, 'c': FunctionCheck(lambda v: v == 3)},
+    {'a': [{'b': [{'c': IsInt}]}]},
+    {'a': 1, 'b': [1.5, inf, 2j]},
+    [HasAttributes(real=IsInt), 2],
+]
+
+values = [
+    1,
+    1.0,
+    True,
+    'foo',
+    None,
+    nan,
+    [1, 2, 3],
+    [1, 2, 3, 4],
+    [1, 2],
+    [3, 2, 1],
+    (1, 2, 3),
+    (1, 'a'),
+    [1, 'a'],
+    {'a': 1, 'b': [1, 2]},
+    {'a': 1, 'b': (1, 2)},
+    {'a': 1, 'b': 'x'},
+    {'a': 1},
+    {'a': 1, 'c': 3},
+    {'b': 2, 'a': 1},
+    {'a': 1, 'b': 2},
+    {'a': 1, 'b': None},
+    {'a': 1, 'b': 2, 'c': 3},
+    {'a': 'x', 'b': 1, 'c': 3},
+    {'a': True, 'b': 'x'},
+    {'a': 5, 'b': 1.5, 'c': 1, 'd': -1.0},
+    {'a': 11, 'b': 1.5, 'c': 1, 'd': -1},
+    {'a': 5, 'b': 1.5, 'c': 0, 'd': -1},
+    {'a': '123', 'b': 'AB', 'c': b'ab'},
+    {'a': '12a', 'b': 'ABCD', 'c': b'AB'},
+    {'a': 'Ab', 'b': 'BC', 'c': b'x'},
+    {'a': 'Ab', 'b': 'BC', 'c': 'x'},
+    {'a': 10.05, 'b': Decimal(2), 'c': [1, 2], 'd': [1, 2]},
+    {'a': 10.05, 'b': 2, 'c': [1], 'd': [1, 2]},
+    {'a': 1, 'b': 2, 'c': 3},
+    {'a': 1, 'b': ['x']},
+    {'a': [{'b': [{'c': 1}]}]},
+    {'a': [{'b': [{'c': '1'}]}]},
+    [1, 1, 'x', 1, 2],
+    ['a', 2, 'b', 1, 'x'],
+    [1, -1, 2, 'a', 3],
+    OrderedDict(a=1, b=2),
+    OrderedDict(a=1, b=None),
+    {},
+    {'a': {}},
+    {'a': {'b': 1}},
+    OrderedDict(),
+    {'a': 1, 'b': [1.5, inf, 2j]},
+    {'a': 1, 'b': [1.5, -inf, 2j]},
+    [1, 2],
+    [1.5, 2],
+]
+
+
+@pytest.mark.parametrize('expected', expectations, ids=repr)
+def test_same_verdicts(expected):
+    compiled = dirty_equals.compile(expected)
+    for value in values:
+        assert (value == compiled) is (value == expected), (value, compiled.source)
+        assert bool(compiled.match(value)) is (value == expected)
+
+
+def test_identity():
+    assert [nan] == dirty_equals.compile([nan])
+    assert nan != dirty_equals.compile(nan)
+
+
+def test_inlined():
+    compiled = dirty_equals.compile({'a': [IsInt(gt=1)], 'b': IsDict(c=IsStr(regex='x'))})
+    assert compiled.source.startswith('def validate(v0):\n    if type(v0) is dict:\n')
+    assert '_matches' not in compiled.source.split('elif')[0]
+    assert 'v2 > 1' in compiled.source
+
+
+def test_not_recorded():
+    is_int = IsInt()
+    compiled = dirty_equals.compile({'a': is_int, 'b': IsList(is_int)})
+    assert {'a': 1, 'b': [2]} == compiled
+    assert repr(is_int) == 'IsInt()'
+    assert repr(compiled) == "{'a': 1, 'b': [2]}"
+
+
+def test_not_recorded_fallback():
+    # these types aren't inlined, so they're compared with `_matches()`
+    inner = IsInt()
+    compiled = dirty_equals.compile(
+        [
+            IsDict(a=inner).settings(partial=True),
+            IsList(inner, 1, check_order=False),
+            Contains(inner),
+            HasAttributes(real=inner),
+        ]
+    )
+    assert [{'a': 5, 'b': 1}, [1, 7], [3], 2] == compiled
+    assert compiled.equals([{'a': 5}, [7, 1], ['x', 4], 3])
+    assert repr(inner) == 'IsInt()'
+
+
+def test_repr():
+    compiled = dirty_equals.compile({'a': IsInt})
+    assert repr(compiled) == "Compiled({'a': IsInt})"
+
+
+def test_deep():
+    expected = value = 1
+    for _ in range(200):
+        expected = [expected]
+        value = [value]
+    compiled = dirty_equals.compile(expected)
+    assert value == compiled
+    assert [[[2]]] != compiled
+
+
+def test_not_in_all():
+    assert 'compile' not in dirty_equals.__all__
+    namespace = {}
+    exec('from dirty_equals import *', namespace)
+    assert 'compile' not in namespace
+
+
+def test_pickle():
+    compiled = dirty_equals.compile({'a': IsInt(gt=1), 'b': [IsStr]})
+    data = pickle.dumps(compiled)
+    assert b'validate' not in data
+    unpickled = pickle.loads(data)
+    assert {'a': 2, 'b': ['x']} == unpickled
+    assert {'a': 1, 'b': ['x']} != unpickled
+    assert unpickled.source == compiled.source
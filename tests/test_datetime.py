@@ -134,6 +134,22 @@ def test_is_now_relative(monkeypatch):
     assert IsNow() == datetime(2020, 1, 1, 12, 13, 14)
 
 
+def test_is_now_not_mutated(monkeypatch):
+    is_now = IsNow()
+    approx = is_now.approx
+    mock = Mock(return_value=datetime(2020, 1, 1, 12, 13, 14))
+    monkeypatch.setattr(IsNow, '_get_now', mock)
+    assert is_now.match(datetime(2020, 1, 1, 12, 13, 15))
+    assert is_now.approx is approx
+
+
+def test_is_today_current_date():
+    is_today = IsToday()
+    # as if the instance was created yesterday
+    is_today.approx -= timedelta(days=1)
+    assert date.today() == is_today
+
+
 @pytest.mark.skipif(ZoneInfo is None, reason='requires zoneinfo')
 def test_tz():
     new_year_london = datetime(2000, 1, 1, tzinfo=ZoneInfo('Europe/London'))
@@ -193,3 +209,46 @@ def test_is_today():
     assert today.isoformat() != IsToday()
     assert today.strftime('%Y/%m/%d') == IsToday(format_string='%Y/%m/%d')
     assert today.strftime('%Y/%m/%d') != IsToday()
+
+
+@pytest.mark.parametrize(
+    'dirty,other',
+    [
+        (IsDatetime(), 123),
+        (IsDatetime(), '2000-01-01T00:00:00'),
+        (IsDatetime(iso_string=True), 'not a date'),
+        (IsDatetime(format_string='%Y'), 'xx'),
+        (IsDatetime(), [1]),
+        (IsDate(), '2000-01-01'),
+        (IsDate(iso_string=True), '2000-13-01'),
+        (IsDate(), datetime(2000, 1, 1)),
+    ],
+)
+def test_reject_without_raising(dirty, other):
+    assert dirty.equals(other) is False
+
+
+@pytest.mark.parametrize(
+    'dirty',
+    [
+        IsDatetime(),
+        IsDatetime(gt=datetime(2000, 1, 1)),
+        IsDatetime(ge=datetime(2000, 1, 1, tzinfo=timezone.utc), lt=datetime(2001, 1, 1, tzinfo=timezone.utc)),
+        IsDatetime(le=datetime(2000, 1, 1), iso_string=True),
+        IsDatetime(approx=datetime(2000, 1, 1)),
+        IsDate(lt=date(2000, 1, 2)),
+    ],
+)
+def test_match_many(dirty):
+    values = [
+        datetime(1999, 1, 1),
+        datetime(2000, 1, 1),
+        datetime(2000, 6, 1),
+        datetime(2000, 6, 1, tzinfo=timezone.utc),
+        date(2000, 1, 1),
+        date(2000, 1, 2),
+        '2000-01-01T00:00',
+        946684800,
+        None,
+    ]
+    assert list(dirty.match_many(values, verdicts=True)) == [v == dirty for v in values]
@@ -0,0 +1,96 @@
+import pytest
+
+import dirty_equals
+from dirty_equals import (
+    IsDict,
+    IsInt,
+    IsList,
+    IsPartialDict,
+    IsPositiveInt,
+    IsStr,
+    IsStrictDict,
+    IsTuple,
+)
+
+from .test_compile import expectations, values
+
+
+@pytest.mark.parametrize('expected', expectations, ids=repr)
+def test_same_verdicts(expected):
+    for value in values:
+        assert (dirty_equals.explain(expected, value) is None) is (value == expected), value
+
+
+@pytest.mark.parametrize(
+    'expected,actual,path,expected_repr,actual_repr',
+    [
+        (1, 2, (), '1', '2'),
+        ({'a': 1}, {'a': 2}, ('a',), '1', '2'),
+        ({'a': 1, 'b': 2}, {'a': 1}, ('b',), '2', '<missing>'),
+        ({'a': 1}, {'a': 1, 'b': 2}, ('b',), '<missing>', '2'),
+        ({'a': [1, {'b': IsInt}]}, {'a': [1, {'b': 'x'}]}, ('a', 1, 'b'), 'IsInt', "'x'"),
+        ([1, 2], [1, 2, 3], (2,), '<missing>', '3'),
+        ([1, 2, 3], [1, 2], (2,), '3', '<missing>'),
+        ([1, 2], (1, 2), (), '[1, 2]', '(1, 2)'),
+        ({'a': 1}, [1], (), "{'a': 1}", '[1]'),
+        (IsDict(a=IsPositiveInt), {'a': -1}, ('a',), 'IsPositiveInt', '-1'),
+        (IsPartialDict(a=IsStr(min_length=2)), {'a': 'x', 'b': 1}, ('a',), 'IsStr(min_length=2)', "'x'"),
+        (IsPartialDict(a=1), {'b': 1}, ('a',), '1', '<missing>'),
+        (IsStrictDict(a=1, b=2), {'b': 2, 'a': 1}, (), 'IsStrictDict(a=1, b=2)', "{'b': 2, 'a': 1}"),
+        (IsList(1, IsInt), [1, 'x'], (1,), 'IsInt', "'x'"),
+        (IsList(1, 2, length=...), [1, 3, 4], (1,), '2', '3'),
+        (IsList(1, length=2), [1, 2, 3], (), 'IsList(1, length=2)', '[1, 2, 3]'),
+        (IsList(1, 2), (1, 2), (), 'IsList(1, 2)', '(1, 2)'),
+        (IsTuple(1, 2, check_order=False), (1, 3), (), 'IsTuple(1, 2, check_order=False)', '(1, 3)'),
+        (IsList(positions={-1: IsInt}), [1, 'x'], (1,), 'IsInt', "'x'"),
+        (IsList(positions={(1, None): [2, {'a': 1}]}), [1, 2, {'a': 2}], (2, 'a'), '1', '2'),
+        (IsList(positions={3: 1}), [1], (), 'IsList(positions={3: 1})', '[1]'),
+        (IsList(positions={-3: 1}), [1], (), 'IsList(positions={-3: 1})', '[1]'),
+        ([IsInt | IsStr], [1.5], (0,), 'IsInt | IsStr', '1.5'),
+        ({'a': IsInt}, {'a': IsStr}, ('a',), 'IsInt', 'IsStr'),
+    ],
+)
+def test_mismatch(expected, actual, path, expected_repr, actual_repr):
+    mismatch = dirty_equals.explain(expected, actual)
+    assert mismatch.path == path
+    assert mismatch.expected == expected_repr
+    assert mismatch.actual == actual_repr
+
+
+def test_str():
+    mismatch = dirty_equals.explain({'items': [{'price': IsInt}]}, {'items': [{'price': 'x'}]})
+    assert str(mismatch) == "['items'][0]['price']: expected IsInt, got 'x'"
+    assert repr(mismatch) == "Mismatch(path=('items', 0, 'price'), expected='IsInt', actual=\"'x'\")"
+    assert str(dirty_equals.explain(1, 2)) == 'value: expected 1, got 2'
+
+
+def test_bounded_repr():
+    actual = {'a': 'x' * 1_000_000, 'b': list(range(1_000_000))}
+    mismatch = dirty_equals.explain({'a': 'y', 'b': []}, actual)
+    assert len(mismatch.actual) < 100
+    mismatch = dirty_equals.explain({'b': 'x'}, {'b': actual['b']})
+    assert mismatch.actual == '[0, 1, 2, 3, 4, 5, 6, 7, 8, ...]'
+
+    mismatch = dirty_equals.explain(IsList(*range(1000), 'x'), list(range(1001)))
+    assert mismatch.path == (1000,)
+    mismatch = dirty_equals.explain(IsList(*range(1000)), 'x')
+    assert len(mismatch.expected) == 200
+    assert mismatch.expected.endswith('...')
+
+
+def test_identity():
+    nan = float('nan')
+    assert dirty_equals.explain(nan, nan) is not None
+    assert dirty_equals.explain([nan], [nan]) is None
+
+
+def test_not_recorded():
+    is_int = IsInt()
+    assert dirty_equals.explain([is_int, IsInt], [1, 'x']).path == (1,)
+    # nested within types which aren't walked
+    assert dirty_equals.explain(IsDict(a=is_int).settings(strict=True), {'a': 1}) is None
+    assert dirty_equals.explain(IsList(1, is_int, length=...), [1, 2, 3]) is None
+    assert dirty_equals.explain([IsList(is_int, check_order=False)], [[4]]) is None
+    mismatch = dirty_equals.explain({'a': IsList(positions={0: is_int}), 'b': 1}, {'a': [5], 'b': 2})
+    assert str(mismatch) == "['b']: expected 1, got 2"
+    assert repr(is_int) == 'IsInt()'
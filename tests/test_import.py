@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+import dirty_equals
+
+
+def run(code: str) -> str:
+    p = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return p.stdout
+
+
+def imported_by(statement: str) -> set[str]:
+    code = f'import sys\nbefore = set(sys.modules)\n{statement}\nprint(*sorted(set(sys.modules) - before))\n'
+    return set(run(code).split())
+
+
+def test_imported_modules():
+    # anything else, e.g. `typing`, `re` or a *dirty-equals* submodule, should only be imported when it's used,
+    # what `importlib` imports depends on the python version
+    allowed = {'dirty_equals', 'dirty_equals.version'} | imported_by('import importlib')
+    assert imported_by('import dirty_equals') - allowed == set()
+
+
+def test_heavy_submodules_not_imported():
+    # these import `pickle`, `concurrent.futures` etc. and used to make `import dirty_equals` slow
+    code = 'import sys\nimport dirty_equals\nprint(*sorted(m for m in sys.modules if m.startswith("dirty_equals.")))\n'
+    modules = run(code).split()
+    assert not {'dirty_equals._compile', 'dirty_equals._spec', 'dirty_equals._parallel'} & set(modules)
+    assert modules == ['dirty_equals.version']
+
+
+def test_lazy_attributes():
+    assert run('import dirty_equals\nprint(dirty_equals.IsInt, dirty_equals.compile.__name__)') == 'IsInt compile\n'
+    assert run('from dirty_equals import *\nprint(IsStr, IsNow, explain.__name__)') == 'IsStr IsNow explain\n'
+
+
+def test_all():
+    for name in dirty_equals.__all__:
+        assert getattr(dirty_equals, name) is not None
+    assert set(dirty_equals.__all__) <= set(dir(dirty_equals))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="module 'dirty_equals' has no attribute 'IsMissing'"):
+        dirty_equals.IsMissing
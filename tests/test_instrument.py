@@ -0,0 +1,167 @@
+import gc
+import json
+import os
+import subprocess
+import sys
+import weakref
+
+import pytest
+
+import dirty_equals
+from dirty_equals import DirtyEquals, FunctionCheck, IsDict, IsInt, IsList, IsStr, IsUUID
+from dirty_equals._instrument import _original_matches
+
+
+def test_disabled():
+    assert DirtyEquals._matches is _original_matches
+    with dirty_equals.instrument():
+        assert DirtyEquals._matches is not _original_matches
+    assert DirtyEquals._matches is _original_matches
+
+
+def test_counts():
+    is_str = IsStr(min_length=2)
+    with dirty_equals.instrument() as stats:
+        assert {'a': 1, 'b': 'xx'} == IsDict(a=IsInt, b=is_str)
+        assert 'x' != is_str
+        assert 1 != is_str
+        assert is_str.match('yy')
+        assert 2 == ~IsStr
+        assert 'x' != IsInt
+        assert 'x' != FunctionCheck(lambda v: v > 0)
+
+    assert 'zz' == is_str
+    assert stats.classes.keys() == {'IsDict', 'IsInt', 'IsStr', 'DirtyNot', 'FunctionCheck'}
+    s = stats.classes['IsStr']
+    assert (s.calls, s.passed, s.failed, s.errors) == (5, 2, 3, 0)
+    assert s.max_time <= s.total_time
+    assert s.mean_time == pytest.approx(s.total_time / 5)
+    assert stats.classes['IsDict'].total_time >= stats.classes['IsInt'].max_time
+    assert repr(stats.classes['IsInt']) == 'MatcherStats(calls=2, passed=1, failed=1, errors=0)'
+    # comparing a string to an int raises a TypeError
+    assert repr(stats.classes['FunctionCheck']) == 'MatcherStats(calls=1, passed=0, failed=1, errors=1)'
+
+    instances = {instance._repr_ne(): s for instance, s in stats.instances}
+    assert instances['IsStr(min_length=2)'].calls == 4
+    assert instances['IsStr()'].calls == 1
+
+
+def test_match_many():
+    # these types have faster versions of `match_many()` which are only used when not instrumented
+    with dirty_equals.instrument() as stats:
+        assert not IsInt(gt=0).match_many([1, 2, -3, 4])
+        assert IsStr(min_length=2).match_many(['xx', 'yyy'])
+        assert IsUUID().match_many(['ebcdab58-6eb8-46fb-a190-d07a33e9eac8'])
+    assert repr(stats.classes['IsInt']) == 'MatcherStats(calls=3, passed=2, failed=1, errors=0)'
+    assert stats.classes['IsStr'].calls == 2
+    assert stats.classes['IsUUID'].calls == 1
+    assert IsInt(gt=0).match_many([1, 2, 4])
+
+
+def test_nested():
+    with dirty_equals.instrument() as outer:
+        assert 1 == IsInt
+        with dirty_equals.instrument() as inner:
+            assert 2 == IsInt
+        assert DirtyEquals._matches is not _original_matches
+        assert 3 == IsInt
+    assert outer.classes['IsInt'].calls == 3
+    assert inner.classes['IsInt'].calls == 1
+    assert DirtyEquals._matches is _original_matches
+
+
+class Items(list):
+    # lists can't be weakly referenced
+    pass
+
+
+def test_instances_not_kept():
+    value = Items(range(1_000))
+    with dirty_equals.instrument() as stats:
+        matcher = IsList(*range(1_000))
+        matcher_ref, value_ref = weakref.ref(matcher), weakref.ref(value)
+        assert value == matcher
+        assert stats.instances == [(matcher, stats.instances[0][1])]
+        del matcher, value
+        gc.collect()
+        assert matcher_ref() is None
+        assert value_ref() is None
+        assert stats.instances == []
+        # temporaries often reuse the same id
+        for i in range(3):
+            assert i == IsInt(ge=i)
+
+    assert sorted((d['repr'][:6], d['calls']) for d in stats.as_dict()['instances']) == [
+        ('IsInt(', 1),
+        ('IsInt(', 1),
+        ('IsInt(', 1),
+        ('IsList', 1),
+    ]
+    assert stats.classes['IsInt'].calls == 3
+
+
+def test_top():
+    with dirty_equals.instrument() as stats:
+        for i in range(3):
+            assert i == IsInt
+        assert 'x' == IsStr(regex='x' * 100 + '|x')
+
+    lines = stats.top(by='calls').splitlines()
+    assert lines[0].split() == [
+        'class',
+        'calls',
+        'passed',
+        'failed',
+        'errors',
+        'total',
+        'ms',
+        'max',
+        'ms',
+        'mean',
+        'µs',
+    ]
+    assert lines[1].split()[:5] == ['IsInt', '3', '3', '0', '0']
+    assert lines[2].split()[:5] == ['IsStr', '1', '1', '0', '0']
+    assert len(stats.top(1).splitlines()) == 2
+
+    lines = stats.top(instances=True, by='calls').splitlines()
+    assert lines[1].startswith('IsInt() ')
+    long_repr = lines[2].split()[0]
+    assert long_repr == "IsStr(regex='" + 'x' * 44 + '...'
+    assert len(long_repr) == 60
+
+
+def test_json():
+    with dirty_equals.instrument() as stats:
+        assert 1 == IsInt
+    data = json.loads(stats.to_json())
+    assert data == {
+        'classes': {'IsInt': {**data['classes']['IsInt'], 'calls': 1, 'passed': 1, 'failed': 0, 'errors': 0}},
+        'instances': [{**data['instances'][0], 'class': 'IsInt', 'repr': 'IsInt()', 'calls': 1}],
+    }
+    assert data['classes']['IsInt'].keys() == {
+        'calls',
+        'passed',
+        'failed',
+        'errors',
+        'total_time',
+        'max_time',
+        'mean_time',
+    }
+
+
+code = 'from dirty_equals import IsInt\nassert 1 == IsInt\nassert "x" != IsInt'
+
+
+def test_env_stderr():
+    env = {**os.environ, 'DIRTY_EQUALS_INSTRUMENT': '1'}
+    p = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+    assert p.stderr.startswith('dirty-equals comparisons:\nclass ')
+    assert p.stderr.splitlines()[2].split()[:5] == ['IsInt', '2', '1', '1', '0']
+
+
+def test_env_json(tmp_path):
+    path = tmp_path / 'stats.json'
+    env = {**os.environ, 'DIRTY_EQUALS_INSTRUMENT': str(path)}
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
+    assert json.loads(path.read_text())['classes']['IsInt']['calls'] == 2
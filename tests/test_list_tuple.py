@@ -1,6 +1,18 @@
 import pytest
 
-from dirty_equals import AnyThing, Contains, HasLen, IsInt, IsList, IsListOrTuple, IsNegative, IsTuple
+from dirty_equals import (
+    AnyThing,
+    Contains,
+    FunctionCheck,
+    HasLen,
+    IsFloat,
+    IsInt,
+    IsList,
+    IsListOrTuple,
+    IsNegative,
+    IsStr,
+    IsTuple,
+)
 
 
 @pytest.mark.parametrize(
@@ -26,6 +38,21 @@ from dirty_equals import AnyThing, Contains, HasLen, IsInt, IsList, IsListOrTupl
         ([1, 2, 3], IsList(1, 2, IsInt)),
         ([3, 2, 1], IsList(1, 2, IsInt, check_order=False)),
         ([1, 2, 2], IsList(2, 2, 1, check_order=False)),
+        ([1.0, True, 'a', None], IsList(None, 1, 'a', 1, check_order=False)),
+        ([[1], 2, {3}, 4], IsList(4, {3}, [1], 2, check_order=False)),
+        (['a', 'b', 3, 'c'], IsList('c', 'a', IsInt, length=(3, ...), check_order=False)),
+        ([1.0, 2], IsList(IsFloat, 2, check_order=False)),
+        ([1.0, 1], IsList(IsFloat, 1, check_order=False)),
+        (list(range(50_000)), IsList(*reversed(range(50_000)), check_order=False)),
+        ([1, 2], IsListOrTuple(IsInt(), 1, check_order=False)),
+        ([1, 2, 3, 4], IsList(positions={-1: 4, -4: 1})),
+        ([1, 2, 3, 4], IsList(positions={(1, 3): [2, 3], (None, None, 2): [1, 3]})),
+        ((1, 2, 3, 4), IsTuple(positions={(-2, None): (3, 4)})),
+        ([1, 2, 3, 4], IsList(positions={(2, None): IsList(3, 4), (5, None): []})),
+        ([1, 1.0], IsList(IsInt(exactly=1), 1, check_order=False)),
+        ([2, 'a', 1], IsList(IsInt(), IsStr(), IsInt(lt=2), check_order=False)),
+        (list(range(5_000)), IsList(*[IsInt()] * 2_500, *range(2_500), check_order=False)),
+        (['x'] * 10_000, IsList(*['x'] * 5_000, *[IsStr()] * 5_000, check_order=False)),
         ([], HasLen(0)),
         ([1, 2, 3], HasLen(3)),
         ('123', HasLen(3)),
@@ -67,6 +94,16 @@ def test_dirty_equals(other, dirty):
         ([1, 2, 3], IsList(1, 2, IsNegative)),
         ([1, 2, 2], IsList(1, 2, 3, check_order=False)),
         ([1, 2, 3], IsList(1, 2, 2, check_order=False)),
+        ([1, 2, True], IsList(1, 2, 2, check_order=False)),
+        (['a', 'b'], IsList('a', IsInt, check_order=False)),
+        ([float('nan')], IsList(float('nan'), check_order=False)),
+        (list(range(50_000)), IsList(*range(1, 50_001), check_order=False)),
+        ([1, 'a'], IsList(IsInt(), 1, check_order=False)),
+        ([1, 2], IsList(positions={-3: 1})),
+        ([1, 2, 3, 4], IsList(positions={(1, 3): [2, 4]})),
+        ([1, 2, 3, 4], IsList(positions={(1, 3): [2, 3, 4]})),
+        ([1, 2, 3, 4], IsList(positions={(1, 3): (2, 3)})),
+        ([1, 2], IsList(IsInt(lt=2), 1, check_order=False)),
         ([1], HasLen(0)),
         ([], HasLen(1)),
         ('abc', HasLen(2)),
@@ -122,3 +159,36 @@ def test_repr(dirty, repr_str):
 def test_no_contains_value():
     with pytest.raises(TypeError):
         Contains()
+
+
+@pytest.mark.parametrize(
+    'dirty,other,index',
+    [
+        (IsList(1, 2, 3), [1, 2, 3], None),
+        (IsList(1, 2, 3), [1, 5, 3], 1),
+        (IsList(1, 2, 3), [0, 5, 3], 0),
+        (IsList(1, 2, 3), [1, 2], 2),
+        (IsList(1, 2), [1, 2, 3], 2),
+        (IsList(1, 2, length=...), [1, 2, 3], None),
+        (IsList(*range(1_000)), [*range(600), -1, *range(601, 1_000)], 600),
+        (IsList(*range(1_000)), list(range(999)), 999),
+        (IsList(positions={-1: 3, 0: 1}), [1, 2, 4], 2),
+        (IsList(positions={5: 3}), [1, 2, 3], 5),
+        (IsList(positions={-5: 3}), [1, 2, 3], -2),
+        (IsList(positions={-7: 1, 0: 1}), [1, 2, 3, 4, 5], -2),
+        (IsList(positions={-1: 5, -7: 1}), [1, 2, 3, 4, 5], -2),
+        (IsList(positions={(1, None): [2, 4]}), [1, 2, 3], 2),
+        (IsList(positions={(1, None): [2]}), [1, 2, 3], 2),
+        (IsList(positions={(1, None): [2, 3, 4]}), [1, 2, 3], 3),
+        (IsList(positions={(1, None): HasLen(1)}), [1, 2, 3], 1),
+    ],
+)
+def test_first_mismatch(dirty, other, index):
+    assert dirty._first_mismatch(other) == index
+
+
+def test_first_mismatch_calls_once():
+    calls = []
+    check = FunctionCheck(lambda v: calls.append(v) or v != 3)
+    assert IsList(check, check, check, check)._first_mismatch([1, 2, 3, 4]) == 2
+    assert calls == [1, 2, 3]
@@ -1,7 +1,13 @@
+from array import array
+from decimal import Decimal
+from enum import IntEnum
+
 import pytest
 
 from dirty_equals import (
     IsApprox,
+    IsArrayOf,
+    IsDatetime,
     IsFloat,
     IsFloatInf,
     IsFloatInfNeg,
@@ -13,9 +19,12 @@ from dirty_equals import (
     IsNegativeInt,
     IsNonNegative,
     IsNonPositive,
+    IsNumber,
+    IsNumeric,
     IsPositive,
     IsPositiveFloat,
     IsPositiveInt,
+    IsStr,
 )
 
 
@@ -143,3 +152,141 @@ def test_not_negative():
     with pytest.raises(AssertionError):
         assert 1 == d
     assert repr(d) == 'IsNegativeInt'
+
+
+@pytest.mark.parametrize(
+    'dirty,other',
+    [
+        (IsInt(), '1'),
+        (IsInt(), True),
+        (IsFloat(gt=1), 'x'),
+        (IsFloatInf, 'inf'),
+        (IsFloatInfPos, 'inf'),
+        (IsFloatInfNeg, None),
+        (IsFloatNan, 'nan'),
+    ],
+)
+def test_reject_without_raising(dirty, other):
+    if isinstance(dirty, type):
+        dirty = dirty()
+    # rejected values don't rely on `TypeError` being caught
+    assert dirty.equals(other) is False
+
+
+class Level(IntEnum):
+    one = 1
+
+
+@pytest.mark.parametrize(
+    'dirty',
+    [
+        IsInt(),
+        IsInt(gt=1, le=5),
+        IsPositiveInt(),
+        IsFloat(lt=0.5),
+        IsNegative(),
+        IsNumeric(ge=2),
+        IsApprox(3),
+        IsFloatNan(),
+        IsFloatInf(),
+    ],
+)
+def test_match_many(dirty):
+    values = [0, 1, 2, 5, 6, -1, 0.1, 0.6, float('nan'), float('inf'), Decimal(3), True, '1', None, Level.one]
+    assert list(dirty.match_many(values, verdicts=True)) == [v == dirty for v in values]
+
+
+@pytest.mark.parametrize(
+    'other,dirty,expect_match',
+    [
+        (array('d', [0.5, 1.5]), IsArrayOf(IsFloat(gt=0)), True),
+        (array('d', [0.5, -1.5]), IsArrayOf(IsFloat(gt=0)), False),
+        (array('d', [0.5, float('nan')]), IsArrayOf(IsPositiveFloat), False),
+        (array('d', [0.5, float('nan')]), IsArrayOf(IsFloat), True),
+        (array('d', [float('nan'), float('nan')]), IsArrayOf(IsFloatNan), True),
+        (array('d', [float('nan'), 1.0]), IsArrayOf(IsFloatNan), False),
+        (array('d', [float('inf'), float('-inf')]), IsArrayOf(IsFloatInf), True),
+        (array('d', [float('inf'), float('-inf')]), IsArrayOf(IsFloatInfPos), False),
+        (array('f', [float('inf')]), IsArrayOf(IsFloatInfPos), True),
+        (array('d', [1.49, 1.51]), IsArrayOf(IsApprox(1.5)), True),
+        (array('d', [1.49, 1.6]), IsArrayOf(IsApprox(1.5)), False),
+        (array('d', [1.4, 1.6]), IsArrayOf(IsApprox(1.5, delta=0.2)), True),
+        (array('d', [1.4, 1.8]), IsArrayOf(IsApprox(1.5, delta=0.2)), False),
+        (array('d', [1.0, 1.0]), IsArrayOf(IsFloat(exactly=1.0)), True),
+        (array('d', [1.0, 2.0]), IsArrayOf(IsFloat(exactly=1.0)), False),
+        (array('d', []), IsArrayOf(IsPositiveFloat), True),
+        (array('d', [1.0]), IsArrayOf(IsInt), False),
+        (array('q', [1, 2]), IsArrayOf(IsFloat), False),
+        (array('q', [1, 2]), IsArrayOf(IsNumber(lt=3)), True),
+        (array('B', [0, 255]), IsArrayOf(IsInt(ge=0, le=255)), True),
+        (array('h', [0, 256]), IsArrayOf(IsInt(ge=0, le=255)), False),
+        (memoryview(array('i', [1, 2])), IsArrayOf(IsPositiveInt), True),
+        (memoryview(array('i', [1, 2, 3, 4])).cast('B').cast('i', (2, 2)), IsArrayOf(IsInt(lt=5)), True),
+        (memoryview(array('i', [1, 2, 3, 4]))[::2], IsArrayOf(IsInt(lt=5)), True),
+        (memoryview(b'ab').cast('c'), IsArrayOf(IsInt), False),
+        (b'ab', IsArrayOf(IsInt), False),
+        (bytearray(b'ab'), IsArrayOf(IsInt), False),
+        ([1, 2], IsArrayOf(IsInt), False),
+        (1, IsArrayOf(IsInt), False),
+    ],
+)
+def test_is_array_of(other, dirty, expect_match):
+    if expect_match:
+        assert other == dirty
+    else:
+        assert other != dirty
+
+
+def test_is_array_of_repr():
+    dirty = IsArrayOf(IsPositiveFloat)
+    assert repr(dirty) == 'IsArrayOf(IsPositiveFloat)'
+    assert array('d', [1.0]) == dirty
+    assert repr(dirty) == "array('d', [1.0])"
+    assert repr(IsArrayOf(IsInt(gt=1))) == 'IsArrayOf(IsInt(gt=1))'
+
+
+@pytest.mark.parametrize(
+    'item,error',
+    [
+        (IsStr, 'IsArrayOf requires a numeric type, e.g. IsInt or IsFloat\\(gt=0\\), not IsStr'),
+        (IsDatetime(), 'IsArrayOf requires a type which matches ints or floats, not IsDatetime\\(\\)'),
+    ],
+)
+def test_is_array_of_invalid(item, error):
+    with pytest.raises(TypeError, match=error):
+        IsArrayOf(item)
+
+
+@pytest.mark.parametrize(
+    'dirty',
+    [
+        IsArrayOf(IsFloat(gt=0)),
+        IsArrayOf(IsPositiveFloat),
+        IsArrayOf(IsApprox(1.5)),
+        IsArrayOf(IsApprox(1.5, delta=0.2)),
+        IsArrayOf(IsFloatNan),
+        IsArrayOf(IsFloatInfNeg),
+        IsArrayOf(IsInt(ge=0, le=255)),
+        IsArrayOf(IsNumber),
+    ],
+)
+@pytest.mark.parametrize(
+    'values',
+    [[], [1.5, 1.55], [1.5, float('nan')], [float('-inf')], [2.0, 300.0], [0, 255], [-1, 2], [0.5, 2.5]],
+)
+def test_is_array_of_numpy(dirty, values):
+    np = pytest.importorskip('numpy')
+    int_values = all(float(v).is_integer() for v in values)
+    for dtype, item_type in (np.float64, float), (np.float32, float), (np.int64, int), (np.int16, int):
+        if item_type is int and not int_values:
+            continue
+        other = np.array(values, dtype=dtype)
+        expected = issubclass(item_type, dirty.item.allowed_types) and all(v == dirty.item for v in other.tolist())
+        assert (other == dirty) is expected
+        assert (other.reshape(-1, 1) == dirty) is expected
+        assert (other != dirty) is not expected
+
+
+def test_is_array_of_numpy_bool():
+    np = pytest.importorskip('numpy')
+    assert np.array([True, False]) != IsArrayOf(IsInt)
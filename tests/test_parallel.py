@@ -0,0 +1,56 @@
+import pickle
+
+import pytest
+
+from dirty_equals import FunctionCheck, IsInt, IsStr, MatchManyResult, validate_parallel
+
+
+def test_all_match():
+    result = validate_parallel(IsInt(ge=0), range(1_000), workers=2, chunksize=64)
+    assert isinstance(result, MatchManyResult)
+    assert result
+    assert len(result) == 1_000
+    assert result.first_failure is None
+
+
+def test_first_failure():
+    values = list(range(1_000))
+    values[900] = 'x'
+    values[123] = -1
+    values[124] = -1
+    result = validate_parallel(IsInt(ge=0), values, workers=3, chunksize=10)
+    assert not result
+    assert result.first_failure == 123
+    assert len(result) == 124
+
+
+def test_verdicts():
+    values = [i if i % 7 else str(i) for i in range(500)]
+    result = validate_parallel(IsInt, values, workers=2, chunksize=30, fail_fast=False)
+    assert len(result) == 500
+    assert result.first_failure == 0
+    assert result.failures == list(range(0, 500, 7))
+    assert list(result) == list(IsInt().match_many(values, verdicts=True))
+
+
+def test_expected_value():
+    rows = ({'id': i, 'name': f'user {i}'} for i in range(100))
+    assert validate_parallel({'id': IsInt, 'name': IsStr}, rows, workers=2, chunksize=16)
+    assert not validate_parallel([IsInt], [[1], [2, 3]], workers=1)
+
+
+def test_empty():
+    assert repr(validate_parallel(IsInt, [], workers=1)) == 'MatchManyResult(count=0, first_failure=None)'
+    result = validate_parallel(IsInt, iter([]), workers=1, fail_fast=False)
+    assert len(result) == 0
+    assert result.failures == []
+
+
+def test_invalid_chunksize():
+    with pytest.raises(ValueError, match='chunksize must be at least 1'):
+        validate_parallel(IsInt, [1], chunksize=0)
+
+
+def test_not_picklable():
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        validate_parallel(FunctionCheck(lambda v: True), [1], workers=1)
@@ -0,0 +1,264 @@
+import json
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+import dirty_equals
+from dirty_equals import (
+    AnyThing,
+    Contains,
+    FunctionCheck,
+    HasAttributes,
+    HasLen,
+    HasName,
+    IsApprox,
+    IsArrayOf,
+    IsBytes,
+    IsDataclass,
+    IsDatetime,
+    IsDict,
+    IsEnum,
+    IsFalseLike,
+    IsFloat,
+    IsFloatNan,
+    IsHash,
+    IsIgnoreDict,
+    IsInstance,
+    IsInt,
+    IsIP,
+    IsJson,
+    IsList,
+    IsNow,
+    IsOneOf,
+    IsPartialDict,
+    IsPositiveInt,
+    IsStr,
+    IsToday,
+    IsTuple,
+    IsUrl,
+    IsUUID,
+    from_spec,
+    load_spec,
+    to_spec,
+)
+
+
+class Colour(Enum):
+    red = 1
+    blue = 2
+
+
+def is_even(v):
+    return v % 2 == 0
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        IsInt,
+        IsInt(),
+        IsInt(gt=1, le=10),
+        IsPositiveInt,
+        IsApprox(1.5, delta=Decimal('0.1')),
+        IsFloatNan(),
+        IsArrayOf(IsFloat(gt=0)),
+        IsStr(regex=r'\d+', regex_flags=re.IGNORECASE),
+        IsStr(regex=re.compile('[a-z]+'), min_length=2, case='lower'),
+        IsBytes(regex=b'\x00+'),
+        IsDict(a=1, b=IsInt),
+        IsDict({1: 2, '$x': 3}),
+        IsDict(a=1).settings(strict=True, partial=True),
+        IsIgnoreDict(a=1),
+        IsPartialDict(a=1).settings(partial=False, ignore={None, 0}),
+        IsList(1, 2, check_order=False),
+        IsList(IsStr, length=...),
+        IsTuple(positions={0: 1, 3: 4}, length=(4, 5)),
+        HasLen(2),
+        HasLen(1, ...),
+        Contains(1, [2]),
+        IsOneOf(None, 'a', (1, 2)),
+        IsInstance(int, only_direct_instance=True),
+        IsInstance(list),
+        HasName('foo', allow_instances=False),
+        HasName(IsStr(regex='Is.*')),
+        HasAttributes(a=1),
+        IsEnum(Colour),
+        IsEnum(),
+        IsOneOf(Colour.red),
+        FunctionCheck(is_even),
+        IsJson(),
+        IsJson(a=1),
+        IsJson([1, 2]),
+        IsUUID(),
+        IsUUID(4),
+        IsUrl(),
+        IsUrl(http_url=True, scheme='https'),
+        IsHash('md5'),
+        IsIP(version=4),
+        IsFalseLike(allow_strings=True),
+        IsDataclass(a=1).settings(strict=True),
+        IsDatetime(approx=datetime(2000, 1, 1, tzinfo=timezone.utc), delta=timedelta(minutes=1), enforce_tz=False),
+        IsDatetime(gt=datetime(2000, 1, 1), iso_string=True),
+        IsNow(tz='Europe/London', delta=10),
+        IsNow(tz=timezone(timedelta(hours=2))),
+        IsToday(iso_string=True),
+        AnyThing,
+        IsInt | IsStr | IsOneOf(None),
+        IsInt & IsPositiveInt,
+        ~IsInt,
+        dirty_equals.compile({'a': [IsInt]}),
+        {'a': [1, 2.5, None, True, (1, ...)], 'b': {1, 2}, 'c': b'\xff', 'd': date(2000, 1, 1), 'e': Decimal('1.5')},
+    ],
+)
+def test_round_trip(value):
+    spec = json.loads(json.dumps(to_spec(value)))
+    built = from_spec(spec, allow_refs=True)
+    if isinstance(value, (IsNow, IsToday)):
+        # the repr includes the current time
+        assert type(built) is type(value)
+    else:
+        assert repr(built) == repr(value)
+    assert to_spec(built) == spec
+
+
+def test_from_spec():
+    spec = {
+        'id': {'$IsInt': {'gt': 0}},
+        'name': {'$IsStr': None},
+        'tags': {'$IsList': {'$args': [{'$IsStr': None}], 'length': {'$tuple': [1, {'$ellipsis': None}]}}},
+        'owner': {'$or': [{'$IsDict': {'id': {'$IsInt': None}}}, {'$IsOneOf': [None]}]},
+        'colour': {'$IsOneOf': [{'$ref': 'tests.test_spec:Colour.red'}, 'red']},
+        'hash': {'$IsHash': 'md5'},
+    }
+    matcher = from_spec(spec, allow_refs=True)
+    assert matcher['name'] is IsStr
+    assert {
+        'id': 1,
+        'name': 'x',
+        'tags': ['a', 'b'],
+        'owner': None,
+        'colour': Colour.red,
+        'hash': 'd41d8cd98f00b204e9800998ecf8427e',
+    } == matcher
+    assert {'id': 1, 'name': 'x', 'tags': [], 'owner': None, 'colour': 'red', 'hash': 'x'} != matcher
+
+
+def test_literal_values():
+    assert from_spec({'a': [1, 'b', None]}) == {'a': [1, 'b', None]}
+    assert from_spec({'$dict': [['$a', 1], [{'$tuple': [1, 2]}, 2]]}) == {'$a': 1, (1, 2): 2}
+    assert from_spec({'$datetime': '2000-01-01T00:00:00+00:00'}) == datetime(2000, 1, 1, tzinfo=timezone.utc)
+    assert from_spec({'$pattern': ['a+', 2]}) == re.compile('a+', re.IGNORECASE)
+
+
+@pytest.mark.parametrize(
+    'spec,error',
+    [
+        ({'$IsInt': None, '$IsStr': None}, 'spec objects with "\\$" keys must have a single key'),
+        ({'$Nope': {}}, "unknown spec key '\\$Nope'"),
+        ({'$DirtyEquals': {}}, "unknown spec key '\\$DirtyEquals'"),
+        ({'$or': [1]}, '"\\$or" requires a list of at least two values'),
+        ({'$tuple': [], '$settings': {}}, '"\\$settings" can only be used with dirty-equals types'),
+        ({'$IsDict': None, '$settings': {}}, '"\\$settings" cannot be used without creating an instance'),
+        ({'$ref': 'dirty_equals'}, '"\\$ref" must be in the form "module:name"'),
+    ],
+)
+def test_invalid_spec(spec, error):
+    with pytest.raises(ValueError, match=error):
+        from_spec(spec, allow_refs=True)
+
+
+def test_refs_not_allowed(tmp_path):
+    spec = {'a': [{'$ref': 'os:system'}]}
+    with pytest.raises(ValueError, match='"\\$ref" is only allowed with `allow_refs=True`'):
+        from_spec(spec)
+
+    path = tmp_path / 'contract.json'
+    path.write_text(json.dumps({'$IsInstance': {'$ref': 'builtins:int'}}))
+    with pytest.raises(ValueError, match='only allowed with `allow_refs=True`'):
+        load_spec(path)
+    assert 1 == load_spec(path, cache_dir=tmp_path / 'cache', allow_refs=True)
+    # a value cached with refs allowed isn't used when they aren't
+    with pytest.raises(ValueError, match='only allowed with `allow_refs=True`'):
+        load_spec(path, cache_dir=tmp_path / 'cache')
+
+
+@pytest.mark.parametrize(
+    'value,error',
+    [
+        (FunctionCheck(lambda v: True), "cannot be imported as 'tests.test_spec:<lambda>'"),
+        (object(), 'cannot be described by a spec'),
+    ],
+)
+def test_not_describable(value, error):
+    with pytest.raises(TypeError, match=error):
+        to_spec(value)
+
+
+def test_custom_type():
+    class IsEven(dirty_equals.DirtyEquals[int]):
+        def equals(self, other):
+            return other % 2 == 0
+
+    with pytest.raises(TypeError, match='IsEven cannot be described by a spec, only public dirty-equals types can be'):
+        to_spec(IsEven())
+
+
+def test_load_spec(tmp_path, monkeypatch):
+    path = tmp_path / 'contract.json'
+    path.write_text(json.dumps({'id': {'$IsInt': {'gt': 0}}}))
+    assert {'id': 1} == load_spec(path)
+
+    cache_dir = tmp_path / 'cache'
+    loaded = load_spec(path, cache_dir=cache_dir)
+    assert repr(loaded) == "{'id': IsInt(gt=0)}"
+    (cache_file,) = cache_dir.iterdir()
+    assert cache_file.suffix == '.pickle'
+
+    calls = []
+    monkeypatch.setattr('dirty_equals._spec.from_spec', lambda spec, allow_refs: calls.append(spec))
+    assert repr(load_spec(path, cache_dir=cache_dir)) == "{'id': IsInt(gt=0)}"
+    assert calls == []
+
+    # a changed file has a new key
+    path.write_text(json.dumps({'id': {'$IsStr': {}}}))
+    load_spec(path, cache_dir=cache_dir)
+    assert calls == [{'id': {'$IsStr': {}}}]
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_load_spec_invalid_cache(tmp_path):
+    path = tmp_path / 'contract.json'
+    path.write_text(json.dumps([{'$IsInt': None}]))
+    load_spec(path, cache_dir=tmp_path)
+    (cache_file,) = tmp_path.glob('*.pickle')
+    cache_file.write_bytes(b'not a pickle')
+    assert load_spec(path, cache_dir=tmp_path) == [IsInt]
+    assert cache_file.read_bytes() != b'not a pickle'
+
+
+def test_load_spec_write_error(tmp_path, monkeypatch):
+    path = tmp_path / 'contract.json'
+    path.write_text(json.dumps({'$IsInt': None}))
+
+    def dump(*args, **kwargs):
+        raise pickle.PicklingError('nope')
+
+    monkeypatch.setattr('dirty_equals._spec.pickle.dump', dump)
+    with pytest.raises(pickle.PicklingError, match='nope'):
+        load_spec(path, cache_dir=tmp_path / 'cache')
+    assert list((tmp_path / 'cache').iterdir()) == []
+
+
+def test_load_spec_threads(tmp_path):
+    path = tmp_path / 'contract.json'
+    path.write_text(json.dumps({'id': {'$IsInt': {'gt': 0}}}))
+    cache_dir = tmp_path / 'cache'
+    with ThreadPoolExecutor(4) as executor:
+        loaded = list(executor.map(lambda _: load_spec(path, cache_dir=cache_dir), range(20)))
+    assert all(repr(v) == "{'id': IsInt(gt=0)}" for v in loaded)
+    assert [p.suffix for p in cache_dir.iterdir()] == ['.pickle']
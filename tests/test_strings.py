@@ -110,3 +110,21 @@ def test_is_any_str():
     assert 'foo' == IsAnyStr(regex=b'foo')
     assert b'foo' == IsAnyStr(regex='foo')
     assert b'foo' == IsAnyStr(regex=b'foo')
+
+
+@pytest.mark.parametrize(
+    'dirty',
+    [
+        IsStr(),
+        IsStr(regex=r'\d+', max_length=3),
+        IsStr(regex=re.compile('[a-z]+', re.I), case='lower'),
+        IsStr(min_length=2, case='upper'),
+        IsBytes(regex=b'a.'),
+        IsBytes(regex='a.'),
+        IsAnyStr(regex='é+', max_length=2),
+        IsAnyStr(regex=re.compile(b'A', re.I)),
+    ],
+)
+def test_match_many(dirty):
+    values = ['1', '1234', 'abc', 'ABC', 'Ab', 'a', '', b'ab', b'AB', b'a', 'é', 'éé', 'a\n', 1, None, bytearray(b'ab')]
+    assert list(dirty.match_many(values, verdicts=True)) == [v == dirty for v in values]
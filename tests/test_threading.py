@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Barrier
+
+from dirty_equals import IsDict, IsInt, IsList, IsNow, IsPositiveInt, IsStr
+
+THREADS = 8
+ITERATIONS = 500
+
+shared = IsDict(id=IsPositiveInt, name=IsStr(regex='user-.+'), tags=IsList(IsStr, length=...), age=IsInt | IsStr)
+
+
+def run_threads(func):
+    barrier = Barrier(THREADS)
+
+    def worker(thread_id):
+        barrier.wait()
+        return func(thread_id)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        return list(pool.map(worker, range(THREADS)))
+
+
+def test_match_concurrent():
+    def check(thread_id):
+        errors = 0
+        for i in range(ITERATIONS):
+            good = {'id': thread_id + 1, 'name': f'user-{i}', 'tags': ['a'], 'age': i}
+            bad = {'id': -i, 'name': f'user-{i}', 'tags': ['a'], 'age': i}
+            result = shared.match(good)
+            if not result or result.value is not good:
+                errors += 1
+            if shared.match(bad):
+                errors += 1
+        return errors
+
+    assert run_threads(check) == [0] * THREADS
+    assert repr(shared) == (
+        "IsDict(id=IsPositiveInt, name=IsStr(regex='user-.+'), tags=IsList(IsStr, length=(0, ...)), age=IsInt | IsStr)"
+    )
+
+
+def test_eq_concurrent():
+    matcher = IsStr(regex=r'\d+')
+
+    def check(thread_id):
+        errors = 0
+        for i in range(ITERATIONS):
+            if (str(i) == matcher) is not True or (f'x{i}' == matcher) is not False:
+                errors += 1
+            # the recorded value and outcome are always replaced together, so the value is always one that matched
+            try:
+                value = matcher.value
+            except AttributeError:
+                pass
+            else:
+                if not value.isdigit():
+                    errors += 1
+        return errors
+
+    assert run_threads(check) == [0] * THREADS
+
+
+def test_is_now_concurrent():
+    is_now = IsNow()
+    approx = is_now.approx
+
+    def check(thread_id):
+        return sum(not is_now.match(datetime.now()) for _ in range(ITERATIONS))
+
+    assert run_threads(check) == [0] * THREADS
+    assert is_now.approx is approx
+
+
+def test_freeze_concurrent():
+    def freeze(thread_id):
+        return [IsDict(a=IsInt(gt=i), b=IsStr).freeze() for i in range(ITERATIONS)]
+
+    results = run_threads(freeze)
+    for frozen in zip(*results):
+        assert all(f is frozen[0] for f in frozen)